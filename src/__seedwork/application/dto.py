@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Generic, List, Optional, TypeVar
+from __seedwork.domain.repositories import SearchParams, SearchResult
+
+Filter = TypeVar("Filter")
+Item = TypeVar("Item")
+
+
+@dataclass(slots=True, frozen=True)
+class SearchInput(Generic[Filter]):
+    page: Optional[int] = None
+    per_page: Optional[int] = None
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+
+    def to_search_params(self) -> SearchParams[Filter]:
+        return SearchParams(page=self.page, per_page=self.per_page, sort=self.sort,
+                            sort_dir=self.sort_dir, filter=self.filter, cursor=self.cursor)
+
+
+@dataclass(slots=True, frozen=True)
+class PaginationOutput(Generic[Item]):
+    items: List[Item]
+    total: int
+    current_page: int
+    last_page: int
+    per_page: int
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_search_result(cls, result: SearchResult,
+                           items: List[Item]) -> 'PaginationOutput[Item]':
+        return cls(items=items, total=result.total, current_page=result.current_page,
+                   last_page=result.last_page, per_page=result.per_page,
+                   next_cursor=result.next_cursor)
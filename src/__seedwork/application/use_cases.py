@@ -0,0 +1,12 @@
+import abc
+from typing import Generic, TypeVar
+
+Input = TypeVar("Input")
+Output = TypeVar("Output")
+
+
+class UseCase(Generic[Input, Output], abc.ABC):
+
+    @abc.abstractmethod
+    async def execute(self, input_param: Input) -> Output:
+        raise NotImplementedError()
@@ -0,0 +1,210 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Union
+from __seedwork.domain.repositories import (
+    ET,
+    Filter,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    loads: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(slots=True)
+class _Load:
+    done: threading.Event = field(default_factory=threading.Event)
+    snapshot: Any = None
+    error: Optional[BaseException] = None
+    stale: bool = False
+
+
+@dataclass(slots=True)
+class EntityCache(Generic[ET]):
+    """Thread-safe LRU cache of entity snapshots with an optional TTL in seconds.
+
+    Entities are mutable through `_set`, so the cache keeps its own copy and
+    hands out a fresh copy on every hit. Concurrent misses on one key wait
+    for a single loader; a load invalidated while in flight is not cached.
+    `misses` counts every lookup that found nothing, `loads` the loader calls.
+    """
+    maxsize: int = 10_000
+    ttl: Optional[float] = None
+    clock: Callable[[], float] = time.monotonic
+    _entries: Dict[str, Tuple[float, ET]] = field(init=False, default_factory=OrderedDict)
+    _loads: Dict[str, _Load] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    _hits: int = field(init=False, default=0)
+    _misses: int = field(init=False, default=0)
+    _load_count: int = field(init=False, default=0)
+    _evictions: int = field(init=False, default=0)
+    _expirations: int = field(init=False, default=0)
+
+    def get(self, key: str, loader: Callable[[], ET]) -> ET:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self.clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy.copy(entry[1])
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            load = self._loads.get(key)
+            if load is None:
+                load = self._loads[key] = _Load()
+                self._load_count += 1
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return copy.copy(load.snapshot)
+
+        try:
+            entity = loader()
+            load.snapshot = copy.copy(entity)
+        except BaseException as exc:
+            load.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._loads[key]
+                if load.error is None and not load.stale:
+                    self._store(key, load.snapshot)
+            load.done.set()
+        return entity
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            load = self._loads.get(key)
+            if load is not None:
+                load.stale = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for load in self._loads.values():
+                load.stale = True
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, loads=self._load_count,
+                              evictions=self._evictions, expirations=self._expirations,
+                              size=len(self._entries))
+
+    def _store(self, key: str, snapshot: ET) -> None:
+        expires_at = float("inf") if self.ttl is None else self.clock() + self.ttl
+        entries = self._entries
+        entries[key] = (expires_at, snapshot)
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self._evictions += 1
+
+
+@dataclass(slots=True)
+class CachedRepository(RepositoryInterface[ET]):
+    """Read-through cache for `find_by_id` in front of any repository.
+
+    Every write drops the written ids from the cache once the wrapped
+    repository is done, so no read served afterwards sees the old state.
+    """
+    repository: RepositoryInterface[ET]
+    cache: EntityCache[ET] = field(default_factory=EntityCache)
+
+    def insert(self, entity: ET) -> None:
+        try:
+            self.repository.insert(entity)
+        finally:
+            self.cache.invalidate(entity.id)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        entities = list(entities)
+        try:
+            self.repository.bulk_insert(entities)
+        finally:
+            for entity in entities:
+                self.cache.invalidate(entity.id)
+
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        return self.cache.get(_key(entity_id), lambda: self.repository.find_by_id(entity_id))
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def update(self, entity: ET) -> None:
+        try:
+            self.repository.update(entity)
+        finally:
+            self.cache.invalidate(entity.id)
+
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            self.cache.invalidate(_key(entity_id))
+
+    def patch_many(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.repository.patch_many(changes)
+        finally:
+            for entity_id in changes:
+                self.cache.invalidate(_key(entity_id))
+
+    def bulk_delete(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> None:
+        entity_ids = list(entity_ids)
+        try:
+            self.repository.bulk_delete(entity_ids)
+        finally:
+            for entity_id in entity_ids:
+                self.cache.invalidate(_key(entity_id))
+
+    def compare_and_set_many(self, entities: Iterable[Tuple[ET, int]]) -> None:
+        entities = list(entities)
+        try:
+            self.repository.compare_and_set_many(entities)
+        finally:
+            for entity, _ in entities:
+                self.cache.invalidate(entity.id)
+
+
+@dataclass(slots=True)
+class CachedSearchableRepository(
+    CachedRepository[ET],
+    SearchableRepositoryInterface[ET, Filter]
+):
+    """Searches go straight to the wrapped repository."""
+    repository: SearchableRepositoryInterface[ET, Filter]
+
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        return self.repository.search(input_params)
+
+
+def _key(entity_id: Union[str, UniqueEntityId]) -> str:
+    return entity_id.id if isinstance(entity_id, UniqueEntityId) else str(entity_id)
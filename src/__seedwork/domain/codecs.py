@@ -0,0 +1,194 @@
+"""JSON codecs for value objects and entities, built once per class.
+
+A codec turns an object into JSON-ready values and back. Value objects with
+a single field encode as that field, like their `str`, others as an object
+of their fields. Entities encode like `to_dict` and decode like `restore`:
+the data is trusted, so nothing, not even the id, is validated and no event
+is recorded.
+Fields are decoded by their annotation, so `datetime` fields come back as
+datetimes rather than ISO strings. Other classes can `register` a codec.
+"""
+import types
+import typing
+import uuid
+from dataclasses import MISSING, dataclass, fields
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.serializers import dumps, loads, serializer_for
+from __seedwork.domain.value_objects import UniqueEntityId, ValueObject, public_fields
+
+T = TypeVar("T")
+
+_SCALAR_DECODERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    timedelta: lambda seconds: timedelta(seconds=seconds),
+    Decimal: Decimal,
+    uuid.UUID: uuid.UUID,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Codec:
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+
+
+_CODECS: Dict[type, Codec] = {}
+
+
+def register(cls: type, encoder: Callable[[Any], Any], decoder: Callable[[Any], Any]) -> None:
+    """Uses the given functions for `cls` instead of the ones built from its fields."""
+    _CODECS[cls] = Codec(encode=encoder, decode=decoder)
+
+
+def codec_for(cls: type) -> Codec:
+    try:
+        return _CODECS[cls]
+    except KeyError:
+        codec = _CODECS[cls] = _build_codec(cls)
+        return codec
+
+
+def encode(value: Any) -> bytes:
+    return dumps(codec_for(type(value)).encode(value))
+
+
+def encode_many(values: Iterable[Any]) -> bytes:
+    encoded = []
+    codec, value_class = None, None
+    for value in values:
+        if type(value) is not value_class:  # pylint: disable=unidiomatic-typecheck
+            value_class = type(value)
+            codec = codec_for(value_class)
+        encoded.append(codec.encode(value))
+    return dumps(encoded)
+
+
+def decode(data: Union[bytes, str], cls: Type[T]) -> T:
+    return codec_for(cls).decode(loads(data))
+
+
+def decode_many(data: Union[bytes, str], cls: Type[T]) -> List[T]:
+    decoder = codec_for(cls).decode
+    return [decoder(item) for item in loads(data)]
+
+
+def _build_codec(cls: type) -> Codec:
+    if isinstance(cls, type) and issubclass(cls, Entity):
+        return _entity_codec(cls)
+    if isinstance(cls, type) and issubclass(cls, ValueObject):
+        return _value_object_codec(cls)
+    raise TypeError(f"No codec for {cls.__qualname__}, register one")
+
+
+def _value_object_codec(cls: type) -> Codec:
+    hints = typing.get_type_hints(cls)
+    names = public_fields(cls)
+    decoders = [(name, _decoder_for(hints[name])) for name in names]
+    encoders = [(name, _encoder_for(hints[name])) for name in names]
+    if len(names) == 1:
+        (name, decoder), (_, encoder) = decoders[0], encoders[0]
+
+        def decode_single(value: Any) -> Any:
+            return cls(**{name: value if decoder is None else decoder(value)})
+
+        def encode_single(value_object: Any) -> Any:
+            value = getattr(value_object, name)
+            return value if encoder is None else encoder(value)
+        return Codec(encode=encode_single, decode=decode_single)
+
+    def decode_fields(data: Dict[str, Any]) -> Any:
+        return cls(**{name: data[name] if decoder is None else decoder(data[name])
+                      for name, decoder in decoders if name in data})
+
+    def encode_fields(value_object: Any) -> Dict[str, Any]:
+        return {name: getattr(value_object, name) if encoder is None
+                else encoder(getattr(value_object, name)) for name, encoder in encoders}
+    return Codec(encode=encode_fields, decode=decode_fields)
+
+
+def _entity_codec(cls: type) -> Codec:
+    hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_cls": cls, "_set": object.__setattr__,
+                                 "_id": UniqueEntityId.trusted}
+    lines = ["def decode(data):\n", "    entity = _new(_cls)\n",
+             "    _set(entity, 'unique_entity_id', _id(data['id']))\n"]
+    encoders = {}
+    for index, class_field in enumerate(fields(cls)):
+        name = class_field.name
+        if name == "unique_entity_id":
+            continue
+        if class_field.default is not MISSING:
+            namespace[f"_default{index}"] = class_field.default
+            default = f"_default{index}"
+        elif class_field.default_factory is not MISSING:
+            namespace[f"_factory{index}"] = class_field.default_factory
+            default = f"_factory{index}()"
+        else:
+            default = None
+        if name.startswith("_"):
+            lines.append(f"    _set(entity, {name!r}, {default})\n")
+            continue
+        value = f"data[{name!r}]"
+        decoder = _decoder_for(hints[name])
+        if decoder is not None:
+            namespace[f"_decode{index}"] = decoder
+            value = f"None if (value := {value}) is None else _decode{index}(value)"
+        if default is None:
+            lines.append(f"    _set(entity, {name!r}, {value})\n")
+        else:
+            lines.append(f"    _set(entity, {name!r},\n"
+                         f"         ({value}) if {name!r} in data else {default})\n")
+        encoder = _encoder_for(hints[name])
+        if encoder is not None:
+            encoders[name] = encoder
+    lines.append("    return entity\n")
+    exec("".join(lines), namespace)  # pylint: disable=exec-used
+    decode_entity = namespace["decode"]
+    decode_entity.__qualname__ = f"{cls.__qualname__}.decode"
+
+    serializer = serializer_for(cls)
+    if not encoders:
+        return Codec(encode=serializer, decode=decode_entity)
+
+    def encode_entity(entity: Any) -> Dict[str, Any]:
+        data = serializer(entity)
+        for name, encoder in encoders.items():
+            data[name] = encoder(getattr(entity, name))
+        return data
+    return Codec(encode=encode_entity, decode=decode_entity)
+
+
+def _decoder_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """How to rebuild a field from JSON, or None when the JSON value is the value."""
+    annotation = _without_none(annotation)
+    if annotation in _SCALAR_DECODERS:
+        return _SCALAR_DECODERS[annotation]
+    if _has_codec(annotation):
+        return lambda value: None if value is None else codec_for(annotation).decode(value)
+    return None
+
+
+def _encoder_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Only nested value objects and entities need one, JSON handles the rest."""
+    annotation = _without_none(annotation)
+    if _has_codec(annotation):
+        return lambda value: None if value is None else codec_for(annotation).encode(value)
+    return None
+
+
+def _without_none(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not types.NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _has_codec(annotation: Any) -> bool:
+    return annotation in _CODECS or (
+        isinstance(annotation, type) and issubclass(annotation, (Entity, ValueObject)))
@@ -1,28 +1,108 @@
 from abc import ABC
-from typing import Any
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from __seedwork.domain.events import DomainEvent
+from __seedwork.domain.instrumentation import INSTRUMENTATION
+from __seedwork.domain.serializers import serializer_for
 from __seedwork.domain.value_objects import UniqueEntityId
 
 
+_MISSING = object()
+
+
+def _none() -> None:
+    return None
+
+
 @dataclass(frozen=True, slots=True)
 class Entity(ABC):
-    # pylint: disable=unnecessary-lambda
     unique_entity_id: UniqueEntityId = field(
-        default_factory=lambda: UniqueEntityId())
+        default_factory=UniqueEntityId.generate)
+    # created on the first recorded event, so entities without events stay small;
+    # a factory rather than a default so subclasses without slots set it too
+    _events: Optional[List[DomainEvent]] = field(
+        default_factory=_none, init=False, repr=False, compare=False)
+    # names of the fields changed through `_set` since the entity was last clean
+    _dirty: Optional[Set[str]] = field(
+        default_factory=_none, init=False, repr=False, compare=False)
+    # bumped by each change a business method makes, see `version`
+    _version: int = field(default_factory=int, init=False, repr=False, compare=False)
 
     # pylint: disable=invalid-name
     @property
     def id(self):
-        return str(self.unique_entity_id)
+        return self.unique_entity_id.id
+
+    @property
+    def version(self) -> int:
+        """Number of changes since creation, for compare-and-set saves.
+
+        Repositories store it with the entity; a save expecting the version
+        the entity was loaded at fails once another write has landed.
+        """
+        return self._version
 
     def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop("unique_entity_id")
-        entity_dict["id"] = self.id
-        return entity_dict
+        if INSTRUMENTATION.enabled:
+            return INSTRUMENTATION.timed(f"{type(self).__name__}.to_dict",
+                                         serializer_for(type(self)), self)
+        return serializer_for(type(self))(self)
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Returns the events recorded so far and forgets them.
+
+        A recorded event replaces the pending one with its `coalesce_key`, as
+        the dispatcher would, so an entity nobody pulls from keeps at most
+        one event per key besides the ones that never coalesce.
+        """
+        events = self._events
+        if events is None:
+            return []
+        object.__setattr__(self, "_events", None)
+        return events
+
+    def changes(self) -> Dict[str, Any]:
+        """Current values of the fields changed since `mark_clean`."""
+        dirty = self._dirty
+        if not dirty:
+            return {}
+        return {name: getattr(self, name) for name in dirty}
+
+    def mark_clean(self) -> None:
+        object.__setattr__(self, "_dirty", None)
 
     # pylint: disable=unused-private-member
 
     def _set(self, name: str, value: Any):
+        """Sets a field; writing the value it already holds is not a change."""
+        current = getattr(self, name, _MISSING)
+        # pylint: disable-next=unidiomatic-typecheck
+        if current == value and type(current) is type(value):
+            return self
         object.__setattr__(self, name, value)
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.count("field_changes", entity=type(self).__name__, field=name)
+        if self._dirty is None:
+            object.__setattr__(self, "_dirty", {name})
+        else:
+            self._dirty.add(name)
         return self
+
+    def _bump_version(self) -> None:
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def _record(self, event: DomainEvent) -> None:
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.count("domain_events", entity=type(self).__name__,
+                                  event=type(event).__name__)
+        events = self._events
+        if events is None:
+            object.__setattr__(self, "_events", [event])
+            return
+        key = event.coalesce_key
+        if key is not None:
+            for index, recorded in enumerate(events):
+                if recorded.coalesce_key == key:
+                    del events[index]
+                    break
+        events.append(event)
@@ -0,0 +1,119 @@
+"""Domain events recorded by entities and delivered in batches.
+
+Entities buffer their events until someone pulls them; `EventDispatcher`
+queues pulled events, drops the ones a later event of the same entity makes
+redundant, and hands each handler the list of events it subscribed to.
+"""
+import inspect
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+Handler = Callable[[List['DomainEvent']], Union[None, Awaitable[None]]]
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Events sharing a `coalesce_key` for one entity overwrite each other:
+    inside a batch only the last one is delivered. None keeps every event.
+    """
+    coalesce_key: ClassVar[Optional[str]] = None
+
+    entity_id: str
+
+
+@dataclass(slots=True)
+class EventDispatcher:
+    """Single-threaded event queue; handlers may be plain or async functions.
+
+    Handlers subscribed to a base class receive its subclasses too. Plain
+    handlers only need `dispatch`, async ones need `dispatch_async`.
+    """
+    batch_size: int = 1000
+    _handlers: Dict[type, List[Handler]] = field(init=False, default_factory=dict)
+    _resolved: Dict[type, Tuple[Handler, ...]] = field(init=False, default_factory=dict)
+    _queue: Deque[DomainEvent] = field(init=False, default_factory=deque)
+
+    def subscribe(self, event_type: type, handler: Handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        self._queue.extend(events)
+
+    def collect(self, *entities: Any) -> None:
+        """Moves the pending events of every entity into the queue."""
+        for entity in entities:
+            self._queue.extend(entity.pull_events())
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def dispatch(self) -> int:
+        """Delivers every queued event; returns how many were delivered."""
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                if inspect.iscoroutinefunction(handler):
+                    raise TypeError(f"{handler.__qualname__} is async, use dispatch_async")
+        delivered = 0
+        while self._queue:
+            for handler, events in self._next_batch():
+                handler(events)
+                delivered += len(events)
+        return delivered
+
+    async def dispatch_async(self) -> int:
+        delivered = 0
+        while self._queue:
+            for handler, events in self._next_batch():
+                result = handler(events)
+                if inspect.isawaitable(result):
+                    await result
+                delivered += len(events)
+        return delivered
+
+    def _next_batch(self) -> List[Tuple[Handler, List[DomainEvent]]]:
+        queue = self._queue
+        batch = coalesce([queue.popleft() for _ in range(min(self.batch_size, len(queue)))])
+        deliveries: Dict[Handler, List[DomainEvent]] = {}
+        for event in batch:
+            for handler in self._handlers_for(type(event)):
+                deliveries.setdefault(handler, []).append(event)
+        return list(deliveries.items())
+
+    def _handlers_for(self, event_type: type) -> Tuple[Handler, ...]:
+        try:
+            return self._resolved[event_type]
+        except KeyError:
+            handlers = self._resolved[event_type] = tuple(
+                handler for base in reversed(event_type.__mro__)
+                for handler in self._handlers.get(base, ()))
+            return handlers
+
+
+def coalesce(events: List[DomainEvent]) -> List[DomainEvent]:
+    """Keeps, in order, each event no later event of the same entity and key replaces."""
+    seen = set()
+    kept = []
+    for event in reversed(events):
+        key = event.coalesce_key
+        if key is not None:
+            identity = (event.entity_id, key)
+            if identity in seen:
+                continue
+            seen.add(identity)
+        kept.append(event)
+    kept.reverse()
+    return kept
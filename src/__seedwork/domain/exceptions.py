@@ -1,7 +1,22 @@
+from typing import Any
+
+
 class InvalidUuidException(Exception):
     def __init__(self, error="ID must be a valid UUID") -> None:
         super().__init__(error)
 
 
 class ValidationException(Exception):
+    """`error` is the structured failure behind the message, when there is one."""
+
+    def __init__(self, message: str, error: Any = None) -> None:
+        super().__init__(message)
+        self.error = error
+
+
+class NotFoundException(Exception):
+    pass
+
+
+class ConflictException(Exception):
     pass
@@ -0,0 +1,136 @@
+"""Opt-in timing and counters for the domain hot paths.
+
+Instrumented code checks `INSTRUMENTATION.enabled` and does nothing else
+while it is off, so disabled instrumentation costs one attribute read per
+call. Once enabled, operations are timed into an in-process
+`MetricsRegistry` that can be read directly or dumped in the Prometheus
+text format.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TimerStats:
+    count: int
+    total: float
+    max: float
+
+
+@dataclass(slots=True)
+class MetricsRegistry:
+    """Thread-safe counters and timers keyed by name and labels."""
+    _counters: Dict[Tuple[str, Labels], int] = field(init=False, default_factory=dict)
+    # name and labels -> [count, total seconds, max seconds]
+    _timers: Dict[Tuple[str, Labels], List[float]] = field(init=False, default_factory=dict)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def increment(self, name: str, amount: int = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                self._timers[key] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    def counter(self, name: str, **labels: str) -> int:
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def timer(self, name: str, **labels: str) -> TimerStats:
+        count, total, longest = self._timers.get((name, tuple(sorted(labels.items()))), (0, 0, 0))
+        return TimerStats(count=int(count), total=total, max=longest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def to_prometheus(self, prefix: str = "seedwork_") -> str:
+        """Counters as `<prefix><name>_total`, timers as `<prefix><name>_seconds` summaries.
+
+        The longest time of each timer goes in its own `<prefix><name>_seconds_max`
+        gauge family, after every summary, so each family stays in one piece.
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timers = sorted((key, list(value)) for key, value in self._timers.items())
+        families: Dict[str, Tuple[str, List[str]]] = {}
+
+        def sample(metric: str, kind: str, line: str) -> None:
+            families.setdefault(metric, (kind, []))[1].append(line)
+
+        for (name, labels), value in counters:
+            metric = f"{prefix}{name}_total"
+            sample(metric, "counter", f"{metric}{_format_labels(labels)} {value}")
+        for (name, labels), (count, total, _) in timers:
+            metric, formatted = f"{prefix}{name}_seconds", _format_labels(labels)
+            sample(metric, "summary", f"{metric}_count{formatted} {int(count)}")
+            sample(metric, "summary", f"{metric}_sum{formatted} {total!r}")
+        for (name, labels), (_, _, longest) in timers:
+            metric = f"{prefix}{name}_seconds_max"
+            sample(metric, "gauge", f"{metric}{_format_labels(labels)} {longest!r}")
+        lines: List[str] = []
+        for metric, (kind, samples) in families.items():
+            lines.append(f"# TYPE {metric} {kind}")
+            lines += samples
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+@dataclass(slots=True)
+class Instrumentation:
+    """The switch instrumented code checks, and the hooks it calls when it is on."""
+    enabled: bool = False
+    registry: MetricsRegistry = field(default_factory=MetricsRegistry)
+    clock: Callable[[], float] = time.perf_counter
+
+    def enable(self, registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+        if registry is not None:
+            self.registry = registry
+        self.enabled = True
+        return self.registry
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def timed(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Calls func, timing it under `operation` and counting the errors it raises."""
+        started = self.clock()
+        try:
+            return func(*args)
+        except Exception as exc:
+            self.registry.increment("operation_errors", operation=operation,
+                                    error=type(exc).__name__)
+            raise
+        finally:
+            self.registry.observe("operation", self.clock() - started, operation=operation)
+
+    def count(self, name: str, **labels: str) -> None:
+        self.registry.increment(name, **labels)
+
+    def rule_failed(self, prop: str, rule: str, message: str) -> None:
+        self.registry.increment("validation_failures", field=prop, rule=rule, message=message)
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,53 @@
+"""Shared instances for values that repeat across many entities.
+
+Large catalogs repeat the same names, descriptions and import timestamps,
+and every loaded row gets its own copy of each. An `Interner` hands out the
+first instance it saw of each distinct value instead, so equal values are
+stored once. It is opt-in: factories and loaders take one as an argument
+and intern nothing without it.
+
+Only immutable values should be interned. Values are told apart by type as
+well, and datetimes by their tzinfo instance too, because equal datetimes
+can still differ in their time zone.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Interner:
+    """Pool of canonical instances, bounded by `max_size`.
+
+    Once full, new values are returned as they are rather than evicting
+    shared ones, and so are unhashable values. Concurrent threads may both
+    add a value; they still get the same instance back.
+    """
+    max_size: int = 100_000
+    _pool: Dict[Any, Any] = field(init=False, default_factory=dict)
+
+    def __call__(self, value: T) -> T:
+        if value is None:
+            return None
+        key = value if type(value) is str else _key(value)  # pylint: disable=unidiomatic-typecheck
+        try:
+            shared = self._pool.get(key)
+        except TypeError:
+            return value
+        if shared is not None:
+            return shared
+        if len(self._pool) >= self.max_size:
+            return value
+        return self._pool.setdefault(key, value)
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def clear(self) -> None:
+        self._pool.clear()
+
+
+def _key(value: Any) -> tuple:
+    # True == 1 and aware datetimes equal across time zones, so the key keeps them apart
+    return type(value), value, id(getattr(value, "tzinfo", None))
@@ -0,0 +1,739 @@
+import abc
+import asyncio
+import base64
+import copy
+import heapq
+import json
+import math
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from operator import attrgetter
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union
+)
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+
+ET = TypeVar("ET", bound=Entity)
+Filter = TypeVar("Filter")
+
+
+class RepositoryInterface(Generic[ET], abc.ABC):
+
+    @abc.abstractmethod
+    def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def bulk_insert(self, entities: List[ET]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        raise NotImplementedError()
+
+    def find_many(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> Dict[str, ET]:
+        """The stored entities among the ids, by id; unknown ids are left out.
+
+        Falls back to one `find_by_id` per id.
+        """
+        found = {}
+        for entity_id in entity_ids:
+            try:
+                found[str(entity_id)] = self.find_by_id(entity_id)
+            except NotFoundException:
+                pass
+        return found
+
+    def patch_many(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """Writes only the given fields, as `{entity id: {field: value}}`.
+
+        A `version` entry is the entity's new version; without one the
+        stored version goes up by one, so a compare-and-set expecting the
+        previous version fails either way.
+
+        Falls back to one `update` per entity; repositories that can write
+        the changed columns in batches override it.
+        """
+        # pylint: disable=protected-access
+        for entity_id, fields in changes.items():
+            entity = self.find_by_id(entity_id)
+            for name, value in fields.items():
+                if name == "version":
+                    object.__setattr__(entity, "_version", value)
+                else:
+                    entity._set(name, value)
+            if "version" not in fields:
+                entity._bump_version()
+            self.update(entity)
+            entity.mark_clean()
+
+    def bulk_delete(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> None:
+        for entity_id in entity_ids:
+            self.delete(entity_id)
+
+    def compare_and_set(self, entity: ET, expected_version: int) -> None:
+        """Saves the entity only if the stored one is still at `expected_version`.
+
+        Raises `ConflictException` when another write landed since, and
+        `NotFoundException` when the entity is not stored.
+        """
+        self.compare_and_set_many([(entity, expected_version)])
+
+    @abc.abstractmethod
+    def compare_and_set_many(self, entities: Iterable[Tuple[ET, int]]) -> None:
+        """Saves every `(entity, expected version)` pair, or none when one is stale."""
+        raise NotImplementedError()
+
+    @contextmanager
+    def transaction(self) -> Iterator[bool]:
+        """Groups the writes of the block; yields whether they land all or none.
+
+        By default each write lands on its own and a failure rolls nothing
+        back, so it yields False.
+        """
+        yield False
+
+
+@dataclass(slots=True, kw_only=True)
+class SearchParams(Generic[Filter]):
+    page: Optional[int] = 1
+    per_page: Optional[int] = 15
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+
+    def __post_init__(self):
+        self.page = self._positive_int(self.page, 1)
+        self.per_page = self._positive_int(self.per_page, 15)
+        self.sort = str(self.sort) if self.sort not in (None, "") else None
+        sort_dir = str(self.sort_dir).lower() if self.sort_dir is not None else None
+        self.sort_dir = None if self.sort is None else \
+            sort_dir if sort_dir in ("asc", "desc") else "asc"
+        self.filter = self.filter if self.filter != "" else None
+        self.cursor = str(self.cursor) if self.cursor not in (None, "") else None
+
+    @staticmethod
+    def _positive_int(value: Any, default: int) -> int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return default
+        return value if value > 0 else default
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SearchResult(Generic[ET, Filter]):
+    items: List[ET]
+    total: int
+    current_page: int
+    per_page: int
+    last_page: int = field(init=False)
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+    next_cursor: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "last_page", math.ceil(self.total / self.per_page))
+
+    def to_dict(self):
+        return {
+            "items": self.items,
+            "total": self.total,
+            "current_page": self.current_page,
+            "per_page": self.per_page,
+            "last_page": self.last_page,
+            "sort": self.sort,
+            "sort_dir": self.sort_dir,
+            "filter": self.filter,
+            "next_cursor": self.next_cursor,
+        }
+
+
+def conflict(entity_id: Union[str, UniqueEntityId], expected_version: int,
+             stored_version: int) -> ConflictException:
+    return ConflictException(f"Entity '{entity_id}' is at version {stored_version}, "
+                             f"not the expected {expected_version}")
+
+
+def encode_cursor(sort: str, sort_dir: str, value: Any, entity_id: str) -> str:
+    """Opaque keyset cursor pointing right after the `(value, entity_id)` sort key."""
+    payload = json.dumps([sort, sort_dir, value, entity_id],
+                         default=_cursor_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str], sort: Optional[str], sort_dir: Optional[str]
+                  ) -> Optional[Tuple[Any, str]]:
+    """The `(value, entity_id)` sort key of a cursor, or None when it is missing,
+    malformed or was issued for another sort."""
+    if cursor is None or sort is None:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor), object_hook=_cursor_object)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, list) or len(payload) != 4 or payload[:2] != [sort, sort_dir] \
+            or not isinstance(payload[3], str):
+        return None
+    return payload[2], payload[3]
+
+
+def _cursor_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"Cannot store {type(value).__name__} in a cursor")
+
+
+def _cursor_object(value: dict) -> Any:
+    return datetime.fromisoformat(value["$datetime"]) if "$datetime" in value else value
+
+
+class SearchableRepositoryInterface(Generic[ET, Filter], RepositoryInterface[ET], abc.ABC):
+    sortable_fields: ClassVar[List[str]] = []
+
+    @abc.abstractmethod
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        raise NotImplementedError()
+
+
+IndexEntry = Tuple[bool, Any, str]
+# what `_apply_filter` returns when it keeps every entity
+_NO_FILTER: Optional[List[str]] = None
+
+
+class SortedIndex:
+    """Sorted `(has_value, value, entity_id)` entries split into bounded chunks.
+
+    Chunking keeps inserts and removals at O(chunk size) instead of shifting
+    one huge list, while positions and slices only walk the chunk lengths.
+    """
+
+    __slots__ = ("_chunks", "_maxes", "_len")
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, entries: Iterable[IndexEntry] = ()):
+        self._chunks: List[List[IndexEntry]] = []
+        self._maxes: List[IndexEntry] = []
+        self._len = 0
+        self.update(entries)
+
+    @staticmethod
+    def entry(value: Any, entity_id: str) -> IndexEntry:
+        return (value is not None, value, entity_id)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def update(self, entries: Iterable[IndexEntry]) -> None:
+        """Adds entries one at a time when they are few next to the index; otherwise
+        merges them, sorted, into the chunks they fall in and leaves the others be."""
+        entries = sorted(entries)
+        if len(entries) * 64 < self._len:
+            for entry in entries:
+                self.add(entry)
+            return
+        if not self._chunks:
+            self._load(entries)
+            return
+        size, last = self.CHUNK_SIZE, len(self._chunks) - 1
+        chunks: List[List[IndexEntry]] = []
+        start = 0
+        for pos, (chunk, chunk_max) in enumerate(zip(self._chunks, self._maxes)):
+            stop = len(entries) if pos == last else bisect_right(entries, chunk_max, start)
+            if stop == start:
+                chunks.append(chunk)
+                continue
+            # timsort merges the two sorted runs in one pass
+            chunk = chunk + entries[start:stop]
+            chunk.sort()
+            start = stop
+            if len(chunk) > 2 * size:
+                chunks.extend(chunk[split:split + size] for split in range(0, len(chunk), size))
+            else:
+                chunks.append(chunk)
+        self._chunks = chunks
+        self._maxes = [chunk[-1] for chunk in chunks]
+        self._len += len(entries)
+
+    def replace(self, entity_ids: Set[str], entries: Iterable[IndexEntry]) -> None:
+        """Drops the entries of `entity_ids` and merges `entries`, sorting once."""
+        self._load(sorted([*(entry for entry in self if entry[2] not in entity_ids), *entries]))
+
+    def _load(self, entries: List[IndexEntry]) -> None:
+        size = self.CHUNK_SIZE
+        self._chunks = [entries[start:start + size] for start in range(0, len(entries), size)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._len = len(entries)
+
+    def add(self, entry: IndexEntry) -> None:
+        chunks, maxes = self._chunks, self._maxes
+        if not chunks:
+            chunks.append([entry])
+            maxes.append(entry)
+        else:
+            pos = bisect_left(maxes, entry)
+            if pos == len(maxes):
+                pos -= 1
+                chunks[pos].append(entry)
+                maxes[pos] = entry
+            else:
+                insort(chunks[pos], entry)
+            chunk = chunks[pos]
+            if len(chunk) > 2 * self.CHUNK_SIZE:
+                chunks.insert(pos + 1, chunk[self.CHUNK_SIZE:])
+                del chunk[self.CHUNK_SIZE:]
+                maxes[pos] = chunk[-1]
+                maxes.insert(pos + 1, chunks[pos + 1][-1])
+        self._len += 1
+
+    def remove(self, entry: IndexEntry) -> None:
+        pos = bisect_left(self._maxes, entry)
+        chunk = self._chunks[pos] if pos < len(self._chunks) else []
+        index = bisect_left(chunk, entry)
+        if index == len(chunk) or chunk[index] != entry:
+            raise KeyError(entry)
+        del chunk[index]
+        if chunk:
+            self._maxes[pos] = chunk[-1]
+        else:
+            del self._chunks[pos]
+            del self._maxes[pos]
+        self._len -= 1
+
+    def position(self, entry: IndexEntry, inclusive: bool = False) -> int:
+        """Number of entries lower than `entry`, or lower or equal when inclusive."""
+        search = bisect_right if inclusive else bisect_left
+        pos = search(self._maxes, entry)
+        if pos == len(self._chunks):
+            return self._len
+        return sum(len(chunk) for chunk in self._chunks[:pos]) + search(self._chunks[pos], entry)
+
+    def ids(self, start: int, stop: int, reverse: bool = False) -> List[str]:
+        """Entity ids at sorted positions [start, stop), or from the end when reversed."""
+        start, stop = max(start, 0), min(stop, self._len)
+        if start >= stop:
+            return []
+        if reverse:
+            start, stop = self._len - stop, self._len - start
+        entries = []
+        for chunk in self._chunks:
+            if start >= len(chunk):
+                start -= len(chunk)
+                stop -= len(chunk)
+                continue
+            entries.extend(chunk[start:stop])
+            stop -= len(chunk)
+            start = 0
+            if stop <= 0:
+                break
+        if reverse:
+            entries.reverse()
+        return [entry[2] for entry in entries]
+
+
+@dataclass(slots=True)
+class InMemoryRepository(RepositoryInterface[ET], abc.ABC):
+    """Stores the entities themselves, not copies.
+
+    The version of each entity is recorded when it is written, so a
+    compare-and-set still sees the stored version after the shared instance
+    was changed.
+    """
+    items: Dict[str, ET] = field(default_factory=dict)
+    _versions: Dict[str, int] = field(init=False, default_factory=dict, repr=False, compare=False)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False,
+                                  compare=False)
+
+    def __post_init__(self):
+        self._versions.update((entity.id, entity.version) for entity in self.items.values())
+
+    def insert(self, entity: ET) -> None:
+        self.items[entity.id] = entity
+        self._versions[entity.id] = entity.version
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        entities = list(entities)
+        self.items.update((entity.id, entity) for entity in entities)
+        self._versions.update((entity.id, entity.version) for entity in entities)
+
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        return self._get(str(entity_id))
+
+    def find_many(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> Dict[str, ET]:
+        items = self.items
+        return {entity_id: items[entity_id] for entity_id in map(str, entity_ids)
+                if entity_id in items}
+
+    def find_all(self) -> List[ET]:
+        return list(self.items.values())
+
+    def update(self, entity: ET) -> None:
+        self._get(entity.id)
+        self.items[entity.id] = entity
+        self._versions[entity.id] = entity.version
+
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        entity_id = str(entity_id)
+        self._get(entity_id)
+        del self.items[entity_id]
+        del self._versions[entity_id]
+
+    def compare_and_set_many(self, entities: Iterable[Tuple[ET, int]]) -> None:
+        entities = list(entities)
+        with self._lock:
+            # an id given twice must expect the version its first save writes
+            versions: Dict[str, int] = {}
+            for entity, expected_version in entities:
+                self._get(entity.id)
+                stored = versions.get(entity.id, self._versions[entity.id])
+                if stored != expected_version:
+                    raise conflict(entity.id, expected_version, stored)
+                versions[entity.id] = entity.version
+            self._update_many([entity for entity, _ in entities])
+
+    def _update_many(self, entities: List[ET]) -> None:
+        for entity in entities:
+            self.update(entity)
+
+    def _get(self, entity_id: str) -> ET:
+        try:
+            return self.items[entity_id]
+        except KeyError as exc:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from exc
+
+
+@dataclass(slots=True)
+class InMemorySearchableRepository(
+    InMemoryRepository[ET],
+    SearchableRepositoryInterface[ET, Filter],
+    abc.ABC
+):
+    """Keeps a sorted index per sortable field plus any `lookup_indexes`.
+
+    Index keys are snapshotted on every write, so an entity mutated in place
+    must go through `update` to be re-indexed.
+    """
+
+    lookup_indexes: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    default_sort: ClassVar[Optional[str]] = None
+    default_sort_dir: ClassVar[str] = "asc"
+
+    indexes: Dict[str, SortedIndex] = field(init=False)
+    _index_keys: Dict[str, tuple] = field(init=False, default_factory=dict)
+    _key_getters: Tuple[Callable[[Any], Any], ...] = field(init=False)
+
+    def __post_init__(self):
+        getters = {
+            **{name: attrgetter(name) for name in self.sortable_fields},
+            **self.lookup_indexes
+        }
+        self._key_getters = tuple(getters.values())
+        self.indexes = {name: SortedIndex() for name in getters}
+        entities = list(self.items.values())
+        self.items = {}
+        self.bulk_insert(entities)
+
+    def insert(self, entity: ET) -> None:
+        if entity.id in self.items:
+            self._unindex(entity.id)
+        InMemoryRepository.insert(self, entity)
+        self._index(entity)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        by_id = {entity.id: entity for entity in entities}
+        for entity_id in by_id:
+            if entity_id in self.items:
+                self._unindex(entity_id)
+        self.items.update(by_id)
+        self._versions.update((entity_id, entity.version) for entity_id, entity in by_id.items())
+        entries = [[] for _ in self.indexes]
+        for entity_id, entity in by_id.items():
+            keys = self._keys_of(entity)
+            self._index_keys[entity_id] = keys
+            for index_entries, key in zip(entries, keys):
+                index_entries.append(SortedIndex.entry(key, entity_id))
+        for index, index_entries in zip(self.indexes.values(), entries):
+            index.update(index_entries)
+
+    def update(self, entity: ET) -> None:
+        InMemoryRepository.update(self, entity)
+        entity_id = entity.id
+        previous, keys = self._index_keys[entity_id], self._keys_of(entity)
+        self._index_keys[entity_id] = keys
+        for index, old_key, key in zip(self.indexes.values(), previous, keys):
+            if old_key != key:
+                index.remove(SortedIndex.entry(old_key, entity_id))
+                index.add(SortedIndex.entry(key, entity_id))
+
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        entity_id = str(entity_id)
+        InMemoryRepository.delete(self, entity_id)
+        self._unindex(entity_id)
+
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        """Pages by offset, or by keyset after `input_params.cursor` when it is given.
+
+        Sorted results carry a `next_cursor` while more items follow.
+        """
+        sort, sort_dir = input_params.sort, input_params.sort_dir
+        if sort not in self.sortable_fields:
+            sort, sort_dir = self.default_sort, self.default_sort_dir
+        reverse = sort_dir == "desc"
+        per_page = input_params.per_page
+        cursor = decode_cursor(input_params.cursor, sort, sort_dir)
+        after = None if cursor is None else SortedIndex.entry(*cursor)
+        offset = 0 if after is not None else (input_params.page - 1) * per_page
+        # one extra id tells whether another page follows
+        stop = offset + per_page + 1
+
+        candidates = self._apply_filter(input_params.filter)
+        if candidates is not None:
+            total = len(candidates)
+            if after is not None:
+                candidates = self._ids_after(candidates, sort, after, reverse)
+            ids = self._sort_ids(candidates, sort, reverse, stop)[offset:]
+        elif sort is not None:
+            total = len(self.items)
+            index = self.indexes[sort]
+            if after is None:
+                ids = index.ids(offset, stop, reverse)
+            elif reverse:
+                end = index.position(after)
+                ids = index.ids(max(end - stop, 0), end)[::-1]
+            else:
+                start = index.position(after, inclusive=True)
+                ids = index.ids(start, start + stop)
+        else:
+            total = len(self.items)
+            ids = list(islice(self.items, offset, stop))
+
+        next_cursor = None
+        if len(ids) > per_page:
+            del ids[per_page:]
+            if sort is not None:
+                next_cursor = encode_cursor(sort, sort_dir, self._sort_key(ids[-1], sort), ids[-1])
+
+        return SearchResult(
+            items=[self.items[entity_id] for entity_id in ids],
+            total=total,
+            current_page=input_params.page,
+            per_page=per_page,
+            sort=sort,
+            sort_dir=sort_dir if sort is not None else None,
+            filter=input_params.filter,
+            next_cursor=next_cursor
+        )
+
+    def _apply_filter(self, filter_param: Optional[Filter]) -> Optional[List[str]]:
+        """Ids matching the filter, or None when nothing is filtered out.
+
+        Repositories without a filter keep every entity, whatever the filter.
+        """
+        del filter_param
+        return _NO_FILTER
+
+    def _sort_key(self, entity_id: str, sort: str) -> Any:
+        return self._index_keys[entity_id][list(self.indexes).index(sort)]
+
+    def _ids_after(self, ids: List[str], sort: str, after: IndexEntry, reverse: bool) -> List[str]:
+        position = list(self.indexes).index(sort)
+        keys = self._index_keys
+        if reverse:
+            return [entity_id for entity_id in ids
+                    if SortedIndex.entry(keys[entity_id][position], entity_id) < after]
+        return [entity_id for entity_id in ids
+                if SortedIndex.entry(keys[entity_id][position], entity_id) > after]
+
+    def _sort_ids(self, ids: List[str], sort: Optional[str], reverse: bool,
+                  limit: int) -> List[str]:
+        if sort is None:
+            return ids[:limit]
+        position = list(self.indexes).index(sort)
+        keys = self._index_keys
+
+        def sort_key(entity_id):
+            return SortedIndex.entry(keys[entity_id][position], entity_id)
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(limit, ids, key=sort_key)
+
+    def _update_many(self, entities: List[ET]) -> None:
+        """Re-sorts each changed index once when the batch is large next to the store;
+        moving entries one at a time costs more past about 1/64 of it."""
+        if len(entities) * 64 < len(self.items):
+            InMemoryRepository._update_many(self, entities)
+            return
+        changed = [(set(), []) for _ in self.indexes]
+        for entity in entities:
+            InMemoryRepository.update(self, entity)
+            entity_id = entity.id
+            previous, keys = self._index_keys[entity_id], self._keys_of(entity)
+            self._index_keys[entity_id] = keys
+            for (entity_ids, entries), old_key, key in zip(changed, previous, keys):
+                if old_key != key:
+                    entity_ids.add(entity_id)
+                    entries.append(SortedIndex.entry(key, entity_id))
+        for index, (entity_ids, entries) in zip(self.indexes.values(), changed):
+            if entity_ids:
+                index.replace(entity_ids, entries)
+
+    def _keys_of(self, entity: ET) -> tuple:
+        return tuple(getter(entity) for getter in self._key_getters)
+
+    def _index(self, entity: ET) -> None:
+        keys = self._keys_of(entity)
+        self._index_keys[entity.id] = keys
+        for index, key in zip(self.indexes.values(), keys):
+            index.add(SortedIndex.entry(key, entity.id))
+
+    def _unindex(self, entity_id: str) -> None:
+        keys = self._index_keys.pop(entity_id)
+        for index, key in zip(self.indexes.values(), keys):
+            index.remove(SortedIndex.entry(key, entity_id))
+
+
+class AsyncRepositoryInterface(Generic[ET], abc.ABC):
+
+    @abc.abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    @asynccontextmanager
+    async def lock(self, entity_id: Union[str, UniqueEntityId]) -> AsyncIterator[None]:
+        """Held around a read-modify-write of one entity so concurrent writers queue up."""
+        raise NotImplementedError()
+
+
+class AsyncSearchableRepositoryInterface(
+    Generic[ET, Filter],
+    AsyncRepositoryInterface[ET],
+    abc.ABC
+):
+    sortable_fields: ClassVar[List[str]] = []
+
+    @abc.abstractmethod
+    async def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        raise NotImplementedError()
+
+
+@dataclass(slots=True)
+class _EntityLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+@dataclass(slots=True)
+class AsyncInMemoryRepository(AsyncRepositoryInterface[ET], abc.ABC):
+    """Async facade over an in-memory repository, for a single event loop.
+
+    Entities are copied on the way in and out, like rows of a real store, so
+    a change only lands through `update`; locks exist only while held or
+    awaited.
+    """
+    repository: InMemoryRepository[ET]
+    _locks: Dict[str, _EntityLock] = field(init=False, default_factory=dict)
+
+    async def insert(self, entity: ET) -> None:
+        self.repository.insert(copy.copy(entity))
+
+    async def bulk_insert(self, entities: List[ET]) -> None:
+        self.repository.bulk_insert([copy.copy(entity) for entity in entities])
+
+    async def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        return copy.copy(self.repository.find_by_id(entity_id))
+
+    async def find_all(self) -> List[ET]:
+        return [copy.copy(entity) for entity in self.repository.find_all()]
+
+    async def update(self, entity: ET) -> None:
+        self.repository.update(copy.copy(entity))
+
+    async def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        self.repository.delete(entity_id)
+
+    @asynccontextmanager
+    async def lock(self, entity_id: Union[str, UniqueEntityId]) -> AsyncIterator[None]:
+        entity_id = str(entity_id)
+        entity_lock = self._locks.get(entity_id)
+        if entity_lock is None:
+            entity_lock = self._locks[entity_id] = _EntityLock()
+        entity_lock.users += 1
+        try:
+            async with entity_lock.lock:
+                yield
+        finally:
+            entity_lock.users -= 1
+            if not entity_lock.users:
+                del self._locks[entity_id]
+
+
+@dataclass(slots=True)
+class AsyncInMemorySearchableRepository(
+    AsyncInMemoryRepository[ET],
+    AsyncSearchableRepositoryInterface[ET, Filter],
+    abc.ABC
+):
+    repository: InMemorySearchableRepository[ET, Filter]
+
+    async def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        result = self.repository.search(input_params)
+        return replace(result, items=[copy.copy(entity) for entity in result.items])
@@ -0,0 +1,192 @@
+"""Incremental full-text index with prefix matching and ranked, paginated results.
+
+Every indexed document gets an increasing internal number, so postings are
+append-only sorted arrays. Removing a document only marks its number dead;
+the arrays are compacted once dead numbers outnumber the live ones, so the
+cost stays amortized per change and the index is never rebuilt wholesale.
+"""
+import re
+import unicodedata
+from array import array
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from __seedwork.domain.repositories import SortedIndex
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased words of the text, with compatibility characters folded."""
+    if not text:
+        return []
+    return _TOKEN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+@dataclass(frozen=True, slots=True)
+class TextSearchResult:
+    ids: List[str]
+    total: int
+
+
+@dataclass(slots=True)
+class _Postings:
+    docs: array = field(default_factory=lambda: array("I"))
+    # bit i set when the token occurs in field i of the document
+    masks: bytearray = field(default_factory=bytearray)
+
+
+@dataclass(slots=True)
+class TextIndex:
+    """Indexes a tuple of texts per id; `weights` gives one weight per field.
+
+    A query matches the documents containing every query term, either as a
+    word or, for terms of at least `min_prefix` characters, as the start of
+    a word (up to `max_expansions` words per term). A term scores the summed
+    weights of the fields it occurs in, doubled for a whole-word match, and
+    a document through the first expansion of a term it contains (the whole
+    word first, then the completions in sorted order). Results are ordered
+    by total score, then by indexing order.
+    """
+    weights: Tuple[int, ...]
+    min_prefix: int = 2
+    max_expansions: int = 50
+    _postings: Dict[str, _Postings] = field(init=False, default_factory=dict)
+    _vocabulary: SortedIndex = field(init=False, default_factory=SortedIndex)
+    _ids: List[Optional[str]] = field(init=False, default_factory=list)
+    _docs: Dict[str, int] = field(init=False, default_factory=dict)
+    _deleted: Set[int] = field(init=False, default_factory=set)
+    # score of a posting by mask, for prefix and for whole-word matches
+    _scores: Tuple[Tuple[int, ...], Tuple[int, ...]] = field(init=False)
+
+    def __post_init__(self):
+        if not 0 < len(self.weights) <= 8:
+            raise ValueError("TextIndex supports 1 to 8 fields")
+        prefix = tuple(sum(weight for bit, weight in enumerate(self.weights) if mask >> bit & 1)
+                       for mask in range(1 << len(self.weights)))
+        self._scores = (prefix, tuple(2 * score for score in prefix))
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._docs
+
+    def add(self, entity_id: str, texts: Sequence[Optional[str]]) -> None:
+        """Indexes the texts of `entity_id`, replacing what was indexed for it."""
+        self.update([(entity_id, texts)])
+
+    def update(self, documents: Iterable[Tuple[str, Sequence[Optional[str]]]]) -> None:
+        postings, new_tokens = self._postings, []
+        ids, docs = self._ids, self._docs
+        for entity_id, texts in documents:
+            if entity_id in docs:
+                self._forget(entity_id)
+            doc = len(ids)
+            ids.append(entity_id)
+            docs[entity_id] = doc
+            masks: Dict[str, int] = {}
+            get_mask = masks.get
+            for bit, text in enumerate(texts):
+                for token in tokenize(text):
+                    masks[token] = get_mask(token, 0) | 1 << bit
+            for token, mask in masks.items():
+                token_postings = postings.get(token)
+                if token_postings is None:
+                    token_postings = postings[token] = _Postings()
+                    new_tokens.append(SortedIndex.entry(token, token))
+                token_postings.docs.append(doc)
+                token_postings.masks.append(mask)
+        vocabulary = self._vocabulary
+        if 64 * len(new_tokens) > len(vocabulary):
+            vocabulary.update(new_tokens)
+        else:
+            for entry in new_tokens:
+                vocabulary.add(entry)
+        self._compact_if_needed()
+
+    def remove(self, entity_id: str) -> None:
+        if entity_id in self._docs:
+            self._forget(entity_id)
+            self._compact_if_needed()
+
+    def search(self, query: str, page: int = 1, per_page: int = 15) -> TextSearchResult:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return TextSearchResult(ids=[], total=0)
+        expansions = sorted((self._expand(term) for term in terms),
+                            key=lambda term_postings: sum(len(postings.docs)
+                                                          for _, postings in term_postings))
+        scores = self._term_scores(expansions[0])
+        for term_postings in expansions[1:]:
+            if not scores:
+                break
+            other = self._term_scores(term_postings)
+            scores = {doc: score + other[doc] for doc, score in scores.items() if doc in other}
+        if self._deleted:
+            for doc in self._deleted.intersection(scores):
+                del scores[doc]
+
+        # indexing order first, then a stable sort by score
+        ranked = sorted(sorted(scores), key=scores.__getitem__, reverse=True)
+        start = (page - 1) * per_page
+        ids = self._ids
+        return TextSearchResult(ids=[ids[doc] for doc in ranked[start:start + per_page]],
+                                total=len(scores))
+
+    def _expand(self, term: str) -> List[Tuple[bool, _Postings]]:
+        postings = self._postings
+        expanded = []
+        if term in postings:
+            expanded.append((True, postings[term]))
+        if len(term) >= self.min_prefix:
+            vocabulary = self._vocabulary
+            start = vocabulary.position(SortedIndex.entry(term, term), inclusive=True)
+            stop = vocabulary.position(SortedIndex.entry(term[:-1] + chr(ord(term[-1]) + 1), ""))
+            limit = self.max_expansions - len(expanded)
+            expanded.extend((False, postings[token])
+                            for token in vocabulary.ids(start, min(stop, start + limit)))
+        return expanded
+
+    def _term_scores(self, term_postings: List[Tuple[bool, _Postings]]) -> Dict[int, int]:
+        scores: Dict[int, int] = {}
+        for exact, postings in term_postings:
+            table = self._scores[exact]
+            matched = dict(zip(postings.docs, map(table.__getitem__, postings.masks)))
+            if scores:
+                # earlier expansions win: the whole word, then the words in sorted order
+                matched.update(scores)
+            scores = matched
+        return scores
+
+    def _forget(self, entity_id: str) -> None:
+        doc = self._docs.pop(entity_id)
+        self._ids[doc] = None
+        self._deleted.add(doc)
+
+    def _compact_if_needed(self) -> None:
+        if len(self._deleted) > max(len(self._docs), 1024):
+            self.compact()
+
+    def compact(self) -> None:
+        """Renumbers the live documents and drops dead postings and words."""
+        renumbered = array("I", repeat(0, len(self._ids)))
+        live_ids: List[Optional[str]] = []
+        for doc, entity_id in enumerate(self._ids):
+            if entity_id is not None:
+                renumbered[doc] = len(live_ids)
+                live_ids.append(entity_id)
+        deleted = self._deleted
+        postings: Dict[str, _Postings] = {}
+        for token, token_postings in self._postings.items():
+            kept = [(renumbered[doc], mask)
+                    for doc, mask in zip(token_postings.docs, token_postings.masks)
+                    if doc not in deleted]
+            if kept:
+                docs, masks = zip(*kept)
+                postings[token] = _Postings(array("I", docs), bytearray(masks))
+        self._postings = postings
+        self._vocabulary = SortedIndex(SortedIndex.entry(token, token) for token in postings)
+        self._ids = live_ids
+        self._docs = {entity_id: doc for doc, entity_id in enumerate(live_ids)}
+        self._deleted = set()
@@ -0,0 +1,313 @@
+"""Entities partitioned across several repositories by consistent hashing.
+
+`HashRing` maps keys to shard names through `replicas` points per shard on
+a 64-bit ring, so adding a shard moves only the keys that now belong to it,
+about 1/N of them, and leaves every other key where it was.
+
+`ShardedRepository` routes each entity by its id and guards every shard
+with its own lock, so writers to different shards never wait for each
+other. Batches are split per shard and are atomic per shard only.
+`add_shard` rebalances online: it drains one existing shard at a time into
+the new one while the others keep serving, and a call racing a move
+re-routes once the move it waited for is done. Reads spanning every shard
+lock one shard at a time and start over when a move landed meanwhile.
+"""
+import hashlib
+import heapq
+import threading
+from bisect import bisect_right, insort
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union
+)
+from __seedwork.domain.repositories import (
+    ET,
+    Filter,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+    SortedIndex,
+    encode_cursor
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+T = TypeVar("T")
+
+
+def _point(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+@dataclass(slots=True)
+class HashRing:
+    """Consistent hashing of string keys onto shard names."""
+    replicas: int = 64
+    _hashes: List[int] = field(init=False, default_factory=list)
+    _owners: Dict[int, str] = field(init=False, default_factory=dict)
+
+    def __contains__(self, shard: str) -> bool:
+        return shard in self.shards()
+
+    def __len__(self) -> int:
+        return len(self.shards())
+
+    def shards(self) -> Set[str]:
+        return set(self._owners.values())
+
+    def add(self, shard: str) -> None:
+        if shard in self:
+            raise ValueError(f"Shard '{shard}' is already on the ring")
+        for replica in range(self.replicas):
+            point = _point(f"{shard}#{replica}")
+            if point not in self._owners:
+                insort(self._hashes, point)
+                self._owners[point] = shard
+
+    def shard_for(self, key: str) -> str:
+        if not self._hashes:
+            raise LookupError("The ring has no shards")
+        position = bisect_right(self._hashes, _point(key))
+        return self._owners[self._hashes[position % len(self._hashes)]]
+
+    def copy(self) -> 'HashRing':
+        ring = HashRing(replicas=self.replicas)
+        ring._hashes = list(self._hashes)  # pylint: disable=protected-access
+        ring._owners = dict(self._owners)  # pylint: disable=protected-access
+        return ring
+
+
+@dataclass(slots=True)
+class _Rebalance:
+    """Keys of shards not drained yet stay with their previous owner."""
+    previous: HashRing
+    target: str
+    drained: Set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class ShardedRepository(RepositoryInterface[ET]):
+    """Entities spread over `shards` by the consistent hash of their id."""
+    shards: Dict[str, RepositoryInterface[ET]]
+    replicas: int = 64
+    ring: HashRing = field(init=False)
+    _locks: Dict[str, threading.Lock] = field(init=False, default_factory=dict)
+    _rebalance: Optional[_Rebalance] = field(init=False, default=None)
+    _rebalance_lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+    # bumped by every move of entities between shards
+    _moves: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        if not self.shards:
+            raise ValueError("A sharded repository needs at least one shard")
+        self.ring = HashRing(replicas=self.replicas)
+        for name in self.shards:
+            self.ring.add(name)
+            self._locks[name] = threading.Lock()
+
+    def shard_for(self, entity_id: Union[str, UniqueEntityId]) -> str:
+        """Name of the shard holding the id right now."""
+        entity_id = _key(entity_id)
+        shard = self.ring.shard_for(entity_id)
+        rebalance = self._rebalance
+        if rebalance is not None and shard == rebalance.target:
+            previous = rebalance.previous.shard_for(entity_id)
+            if previous not in rebalance.drained:
+                return previous
+        return shard
+
+    def insert(self, entity: ET) -> None:
+        with self._shard(entity.id) as shard:
+            shard.insert(entity)
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        self._each_shard([(entity.id, entity) for entity in entities],
+                         lambda shard, batch: shard.bulk_insert(batch))
+
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> ET:
+        with self._shard(entity_id) as shard:
+            return shard.find_by_id(entity_id)
+
+    def find_all(self) -> List[ET]:
+        """Entities of every shard, shard after shard."""
+        return list(chain.from_iterable(self._read_shards(lambda shard: shard.find_all())))
+
+    def update(self, entity: ET) -> None:
+        with self._shard(entity.id) as shard:
+            shard.update(entity)
+
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        with self._shard(entity_id) as shard:
+            shard.delete(entity_id)
+
+    def patch_many(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        self._each_shard([(_key(entity_id), (entity_id, fields))
+                          for entity_id, fields in changes.items()],
+                         lambda shard, batch: shard.patch_many(dict(batch)))
+
+    def bulk_delete(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> None:
+        self._each_shard([(_key(entity_id), entity_id) for entity_id in entity_ids],
+                         lambda shard, batch: shard.bulk_delete(batch))
+
+    def compare_and_set_many(self, entities: Iterable[Tuple[ET, int]]) -> None:
+        self._each_shard([(entity.id, (entity, version)) for entity, version in entities],
+                         lambda shard, batch: shard.compare_and_set_many(batch))
+
+    def add_shard(self, name: str, repository: RepositoryInterface[ET]) -> int:
+        """Adds a shard and moves the entities that now hash to it; returns how many moved.
+
+        Each existing shard is drained under its lock and the new one's, so
+        calls routed to other shards go on meanwhile.
+        """
+        with self._rebalance_lock:
+            if name in self.shards:
+                raise ValueError(f"Shard '{name}' already exists")
+            previous = self.ring
+            ring = previous.copy()
+            ring.add(name)
+            self._locks[name] = threading.Lock()
+            self.shards[name] = repository
+            self._rebalance = _Rebalance(previous=previous, target=name)
+            self.ring = ring
+            moved = 0
+            try:
+                for source in sorted(previous.shards()):
+                    with self._locked(sorted([source, name])):
+                        entities = [entity for entity in self.shards[source].find_all()
+                                    if self.ring.shard_for(entity.id) == name]
+                        if entities:
+                            self._moves += 1
+                            repository.bulk_insert(entities)
+                            self.shards[source].bulk_delete([entity.id for entity in entities])
+                        self._rebalance.drained.add(source)
+                    moved += len(entities)
+            finally:
+                self._rebalance = None
+            return moved
+
+    @contextmanager
+    def _shard(self, entity_id: Union[str, UniqueEntityId]) -> Iterator[RepositoryInterface[ET]]:
+        entity_id = _key(entity_id)
+        while True:
+            name = self.shard_for(entity_id)
+            with self._locks[name]:
+                # a rebalance may have moved the id while this call waited
+                if self.shard_for(entity_id) == name:
+                    yield self.shards[name]
+                    return
+
+    def _each_shard(self, items: List[Tuple[str, T]],
+                    write: Callable[[RepositoryInterface[ET], List[T]], None]) -> None:
+        while items:
+            batches: Dict[str, List[Tuple[str, T]]] = {}
+            for key, item in items:
+                batches.setdefault(self.shard_for(key), []).append((key, item))
+            items = []
+            for name, batch in batches.items():
+                with self._locks[name]:
+                    routed = [item for key, item in batch if self.shard_for(key) == name]
+                    items.extend((key, item) for key, item in batch
+                                 if self.shard_for(key) != name)
+                    if routed:
+                        write(self.shards[name], routed)
+
+    def _read_shards(self, read: Callable[[RepositoryInterface[ET]], T]) -> List[T]:
+        """`read` of every shard in name order, each under its own lock only.
+
+        Writes to the other shards go on meanwhile. Moves hold both shards
+        they touch, so a read that saw a shard before a move and another
+        after it notices the move count changed and starts over, instead of
+        seeing the moved entities twice or not at all.
+        """
+        while True:
+            moves = self._moves
+            results = []
+            for name in sorted(self.shards):
+                with self._locks[name]:
+                    results.append(read(self.shards[name]))
+            if self._moves == moves:
+                return results
+
+    @contextmanager
+    def _locked(self, names: List[str]) -> Iterator[None]:
+        with ExitStack() as stack:
+            for name in names:
+                stack.enter_context(self._locks[name])
+            yield
+
+
+@dataclass(slots=True)
+class ShardedSearchableRepository(
+    ShardedRepository[ET],
+    SearchableRepositoryInterface[ET, Filter]
+):
+    """Searches every shard and merges their sorted pages.
+
+    Each shard returns the first `offset + per_page + 1` matches in the
+    requested order and the pages are merged k-way, so results equal those
+    of a single repository holding everything, as long as the shards sort
+    the same way. Keyset cursors skip the offset on every shard.
+    """
+    shards: Dict[str, SearchableRepositoryInterface[ET, Filter]]
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self._reference().sortable_fields
+
+    def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET, Filter]:
+        reference = self._reference()
+        sort, sort_dir = input_params.sort, input_params.sort_dir
+        if sort not in reference.sortable_fields:
+            sort = getattr(reference, "default_sort", None)
+            sort_dir = getattr(reference, "default_sort_dir", "asc") if sort else None
+        per_page = input_params.per_page
+        offset = 0 if input_params.cursor is not None else (input_params.page - 1) * per_page
+        shard_params = SearchParams(page=1, per_page=offset + per_page + 1, sort=sort,
+                                    sort_dir=sort_dir, filter=input_params.filter,
+                                    cursor=input_params.cursor)
+        results = self._read_shards(lambda shard: shard.search(shard_params))
+        total = sum(result.total for result in results)
+        if sort is None:
+            merged = chain.from_iterable(result.items for result in results)
+        else:
+            def key(entity: ET) -> tuple:
+                return SortedIndex.entry(getattr(entity, sort), entity.id)
+            merged = heapq.merge(*(result.items for result in results), key=key,
+                                 reverse=sort_dir == "desc")
+        items = list(merged)[offset:offset + per_page + 1]
+
+        next_cursor = None
+        if len(items) > per_page:
+            del items[per_page:]
+            if sort is not None:
+                last = items[-1]
+                next_cursor = encode_cursor(sort, sort_dir, getattr(last, sort), last.id)
+        return SearchResult(
+            items=items,
+            total=total,
+            current_page=input_params.page,
+            per_page=per_page,
+            sort=sort,
+            sort_dir=sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor
+        )
+
+    def _reference(self) -> SearchableRepositoryInterface[ET, Filter]:
+        return next(iter(self.shards.values()))
+
+
+def _key(entity_id: Union[str, UniqueEntityId]) -> str:
+    return entity_id.id if isinstance(entity_id, UniqueEntityId) else str(entity_id)
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Union
+from __seedwork.domain.repositories import ET, RepositoryInterface
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, slots=True)
+class PendingChanges(Generic[ET]):
+    """What a commit writes: one batch per kind of operation."""
+    new: List[ET]
+    patches: Dict[str, Dict[str, Any]]
+    deleted: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.patches or self.deleted)
+
+
+@dataclass(slots=True)
+class UnitOfWork(Generic[ET]):
+    """Tracks the entities of one business transaction and writes them together.
+
+    Entities loaded through `get` or passed to `attach` are watched for
+    changes made with `_set`; on `commit` only the changed fields of each are
+    sent, with the entity's version, in a single `patch_many`, after one
+    `bulk_insert` of the new entities and before one `bulk_delete`. An entity
+    is tracked once per unit, so loading it twice returns the same instance,
+    and an entity removed in this unit is not loaded again.
+
+    Used as a context manager, it commits when the block ends without error.
+    """
+    repository: RepositoryInterface[ET]
+    _tracked: Dict[str, ET] = field(init=False, default_factory=dict)
+    _new: Dict[str, ET] = field(init=False, default_factory=dict)
+    _deleted: Dict[str, None] = field(init=False, default_factory=dict)
+
+    def __enter__(self) -> 'UnitOfWork[ET]':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def get(self, entity_id: Union[str, UniqueEntityId]) -> Optional[ET]:
+        """The tracked entity, loaded on first use; None once removed in this unit."""
+        entity_id = str(entity_id)
+        if entity_id in self._deleted:
+            return None
+        entity = self._tracked.get(entity_id) or self._new.get(entity_id)
+        if entity is None:
+            entity = self.attach(self.repository.find_by_id(entity_id))
+        return entity
+
+    def attach(self, entity: ET) -> ET:
+        """Tracks an entity loaded elsewhere; changes made before are not saved."""
+        entity.mark_clean()
+        self._tracked[entity.id] = entity
+        return entity
+
+    def add(self, entity: ET) -> None:
+        self._new[entity.id] = entity
+        self._deleted.pop(entity.id, None)
+
+    def remove(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        entity_id = str(entity_id)
+        if self._new.pop(entity_id, None) is None:
+            self._tracked.pop(entity_id, None)
+            self._deleted[entity_id] = None
+
+    def pending(self) -> PendingChanges[ET]:
+        patches = {}
+        for entity_id, entity in self._tracked.items():
+            changes = entity.changes()
+            if changes:
+                changes["version"] = entity.version
+                patches[entity_id] = changes
+        return PendingChanges(new=list(self._new.values()), patches=patches,
+                              deleted=list(self._deleted))
+
+    def commit(self) -> Optional[PendingChanges[ET]]:
+        """Writes the pending changes, or nothing when there are none.
+
+        Returns what was written. The writes run in a `transaction` of the
+        repository. When it rolls back, a failed commit leaves every change
+        pending. Otherwise, only the batches written before the failure stop
+        being pending. Either way the commit can be retried.
+        """
+        pending = self.pending()
+        if not pending:
+            return None
+        steps: List[Tuple[Callable[[], None], Callable[[], None]]] = []
+        if pending.new:
+            steps.append((lambda: self.repository.bulk_insert(pending.new),
+                          lambda: self._inserted(pending.new)))
+        if pending.patches:
+            steps.append((lambda: self.repository.patch_many(pending.patches),
+                          lambda: self._patched(pending.patches)))
+        if pending.deleted:
+            steps.append((lambda: self.repository.bulk_delete(pending.deleted),
+                          lambda: self._removed(pending.deleted)))
+        written = []
+        with self.repository.transaction() as atomic:
+            for write, settle in steps:
+                write()
+                if atomic:
+                    written.append(settle)
+                else:
+                    settle()
+        for settle in written:
+            settle()
+        return pending
+
+    def _inserted(self, entities: List[ET]) -> None:
+        for entity in entities:
+            entity.mark_clean()
+            self._tracked[entity.id] = self._new.pop(entity.id)
+
+    def _patched(self, patches: Dict[str, Dict[str, Any]]) -> None:
+        for entity_id in patches:
+            self._tracked[entity_id].mark_clean()
+
+    def _removed(self, entity_ids: List[str]) -> None:
+        for entity_id in entity_ids:
+            del self._deleted[entity_id]
+
+    def rollback(self) -> None:
+        """Forgets everything tracked; the entities keep their in-memory changes."""
+        self._tracked.clear()
+        self._new.clear()
+        self._deleted.clear()
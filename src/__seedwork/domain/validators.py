@@ -1,10 +1,49 @@
 import abc
-from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, TypeVar
-
-from rest_framework.serializers import Serializer
+import keyword
+from dataclasses import dataclass, field as dc_field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar
+)
 
 from .exceptions import ValidationException
+from .instrumentation import INSTRUMENTATION
+
+if TYPE_CHECKING:  # DRF is only needed by DRFValidator users
+    from rest_framework.serializers import Serializer
+
+
+@dataclass(frozen=True, slots=True)
+class RuleError:
+    """One failed rule: the field, the rule code and the rule's parameters.
+
+    The message is rendered when first read and kept, and reads exactly
+    like the one `ValidationException` carries for the same failure.
+    """
+    field: str
+    code: str
+    params: Tuple[Any, ...] = ()
+    _message: Optional[str] = dc_field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def message(self) -> str:
+        message = self._message
+        if message is None:
+            message = _RULES[self.code][1].format(prop=self.field,
+                                                  arg=self.params[0] if self.params else None)
+            object.__setattr__(self, "_message", message)
+        return message
+
+    def __str__(self) -> str:
+        return self.message
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,29 +57,161 @@ class ValidatorRules():
 
     def required(self) -> 'ValidatorRules':
         if self.value is not None and self.value == "" or self.value is None:
-            raise ValidationException(F"The field {self.prop} is required.")
+            raise _rule_error(RuleError(self.prop, "required"))
         return self
 
     def string(self) -> 'ValidatorRules':
         if self.value is not None and not isinstance(self.value, str):
-            raise ValidationException(
-                f"The field {self.prop} must be a string.")
+            raise _rule_error(RuleError(self.prop, "string"))
         return self
 
     def max_length(self, max_len: int) -> 'ValidatorRules':
         if self.value is not None and len(self.value) > max_len:
-            raise ValidationException(
-                f"The field {self.prop} cannot exceed {max_len} characters.")
+            raise _rule_error(RuleError(self.prop, "max_length", (max_len,)))
         return self
 
     def boolean(self) -> 'ValidatorRules':
         if self.value is not None and self.value is not True and self.value is not False:
-            raise ValidationException(
-                f"The field {self.prop} must be a boolean.")
+            raise _rule_error(RuleError(self.prop, "boolean"))
         return self
 
 
+def _rule_error(error: RuleError, message: Optional[str] = None) -> ValidationException:
+    # failures are counted here, on the failing path only
+    message = error.message if message is None else message
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.rule_failed(error.field, error.code, message)
+    return ValidationException(message, error)
+
+
+def _rule_failed(error: RuleError, message: str) -> str:
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.rule_failed(error.field, error.code, message)
+    return message
+
+
+def _rule_found(error: RuleError, message: str) -> RuleError:
+    if INSTRUMENTATION.enabled:
+        INSTRUMENTATION.rule_failed(error.field, error.code, message)
+    return error
+
+
 ErrorFields = Dict[str, List[str]]
+
+
+def error_fields(errors: Iterable[RuleError]) -> ErrorFields:
+    """Messages of the errors grouped by field, in the order they come."""
+    fields: ErrorFields = {}
+    for error in errors:
+        messages = fields.get(error.field)
+        if messages is None:
+            fields[error.field] = [error.message]
+        else:
+            messages.append(error.message)
+    return fields
+
+
+# rule name -> (failure condition over `{value}`, message); both mirror ValidatorRules
+_RULES = {
+    "required": ('{value} is None or {value} == ""',
+                 "The field {prop} is required."),
+    "string": ("{value} is not None and not isinstance({value}, str)",
+               "The field {prop} must be a string."),
+    "max_length": ("{value} is not None and len({value}) > {arg}",
+                   "The field {prop} cannot exceed {arg} characters."),
+    "boolean": ("{value} is not None and {value} is not True and {value} is not False",
+                "The field {prop} must be a boolean."),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRules:
+    """Validation functions generated from a `{field: "rule|rule:arg"}` schema.
+
+    `validate` raises the first failure as ValidationException, exactly like
+    chaining ValidatorRules field by field. `collect` checks every field and
+    returns the first failure of each one as ErrorFields (empty when valid).
+    `check` and `check_all` find the same failures as `RuleError` values
+    without raising: each rule of the schema has one shared instance, so
+    rejecting a value allocates nothing. All of them take the field values
+    positionally or by name, the `_dict` variants read them from a mapping.
+    """
+    schema: Dict[str, str]
+    validate: Callable[..., None]
+    collect: Callable[..., ErrorFields]
+    validate_dict: Callable[[Dict[str, Any]], None]
+    collect_dict: Callable[[Dict[str, Any]], ErrorFields]
+    check: Callable[..., Optional[RuleError]]
+    check_all: Callable[..., List[RuleError]]
+    check_dict: Callable[[Dict[str, Any]], Optional[RuleError]]
+    check_all_dict: Callable[[Dict[str, Any]], List[RuleError]]
+
+
+def compile_rules(schema: Dict[str, str]) -> CompiledRules:
+    checks: List[Tuple[str, List[Tuple[str, str, str]]]] = []
+    namespace: Dict[str, Any] = {"_rule_error": _rule_error, "_rule_failed": _rule_failed,
+                                 "_rule_found": _rule_found}
+    for prop, rules in schema.items():
+        if not prop.isidentifier() or keyword.iskeyword(prop) or prop.startswith("_"):
+            raise ValueError(f"Invalid field name '{prop}'")
+        field_checks = []
+        for rule in filter(None, rules.split("|")):
+            name, _, arg = rule.partition(":")
+            if name not in _RULES:
+                raise ValueError(f"Unknown validation rule '{name}'")
+            if name == "max_length":
+                arg = int(arg)
+            condition, message = _RULES[name]
+            # `_errorN` is the shared RuleError of the rule, `_messageN` its message
+            number = len(field_checks) + sum(len(done) for _, done in checks)
+            namespace[f"_error{number}"] = RuleError(prop, name, (arg,) if arg != "" else ())
+            namespace[f"_message{number}"] = message.format(prop=prop, arg=arg)
+            field_checks.append((condition.format(value=prop, arg=arg), f"_error{number}",
+                                 f"_message{number}"))
+        checks.append((prop, field_checks))
+
+    props = ", ".join(f"{prop}=None" for prop in schema)
+    from_dict = "".join(f"    {prop} = data.get({prop!r})\n" for prop in schema)
+
+    def first_failure(statement: str) -> str:
+        return "".join(
+            f"    if {condition}:\n        {statement.format(error=error, message=message)}\n"
+            for _, field_checks in checks for condition, error, message in field_checks)
+
+    def every_field(start: str, statement: str, end: str) -> str:
+        return f"    {start}\n" + "".join(
+            f"    {'elif' if position else 'if'} {condition}:\n"
+            f"        {statement.format(prop=prop, error=error, message=message)}\n"
+            for prop, field_checks in checks
+            for position, (condition, error, message) in enumerate(field_checks)
+        ) + f"    {end}\n"
+
+    fail_fast = first_failure("raise _rule_error({error}, {message})") + "    return None\n"
+    find_first = first_failure("return _rule_found({error}, {message})") + "    return None\n"
+    collect_all = every_field("_errors = {}",
+                              "_errors[{prop!r}] = [_rule_failed({error}, {message})]",
+                              "return _errors")
+    find_all = every_field("_errors = []", "_errors.append(_rule_found({error}, {message}))",
+                           "return _errors")
+
+    source = "".join(
+        f"def {name}({props}):\n{body}def {name}_dict(data):\n{from_dict}{body}"
+        for name, body in [("validate", fail_fast), ("collect", collect_all),
+                           ("check", find_first), ("check_all", find_all)])
+    exec(compile(source, "<compiled rules>", "exec"), namespace)  # pylint: disable=exec-used
+    return CompiledRules(
+        schema=dict(schema),
+        validate=namespace["validate"],
+        collect=namespace["collect"],
+        validate_dict=namespace["validate_dict"],
+        collect_dict=namespace["collect_dict"],
+        check=namespace["check"],
+        check_all=namespace["check_all"],
+        check_dict=namespace["check_dict"],
+        check_all_dict=namespace["check_all_dict"],
+    )
+
+
 PropsValidated = TypeVar("PropsValidated")
 
 
@@ -55,12 +226,31 @@ class ValidatorFieldsInterface(abc.ABC, Generic[PropsValidated]):
 
 
 class DRFValidator(ValidatorFieldsInterface[PropsValidated]):
-    def validate(self, data: Serializer):
-        if not data.is_valid():
-            self.errors = {
-                field: [str(_error) for _error in _errors]
-                for field, _errors in data.errors.item()
-            }
-        else:
-            self.validated_data = data.validated_data
+    def validate(self, data: 'Serializer') -> bool:
+        if data.is_valid():
+            self.errors = None
+            self.validated_data = dict(data.validated_data)
             return True
+        self.errors = {
+            field: [str(_error) for _error in _errors]
+            for field, _errors in data.errors.items()
+        }
+        self.validated_data = None
+        return False
+
+
+@dataclass(slots=True)
+class RulesValidator(ValidatorFieldsInterface[PropsValidated]):
+    """Validates plain dicts against compiled rules, without DRF serializers."""
+    rules: CompiledRules = None
+
+    def validate(self, data: Dict[str, Any]) -> bool:
+        data = data if data is not None else {}
+        errors = self.rules.collect_dict(data)
+        if errors:
+            self.errors = errors
+            self.validated_data = None
+            return False
+        self.errors = None
+        self.validated_data = {field: data[field] for field in self.rules.schema if field in data}
+        return True
@@ -1,15 +1,42 @@
 """object values"""
 import json
+import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field, fields
 from abc import ABC
+from typing import Dict, List, Optional, Tuple
 from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.instrumentation import INSTRUMENTATION
+
+# byte translation tables stamping the version 4 and RFC 4122 variant bits
+_VERSION_4 = bytes((byte & 0x0F) | 0x40 for byte in range(256))
+_RFC_4122_VARIANT = bytes((byte & 0x3F) | 0x80 for byte in range(256))
+
+_RANDOM_62_BITS = (1 << 62) - 1
+_VERSION_7_BITS = (0x7 << 76) | (0b10 << 62)
+
+
+_PUBLIC_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def public_fields(value_class: type) -> Tuple[str, ...]:
+    """Names of the dataclass fields that make up the value, computed once per class."""
+    try:
+        return _PUBLIC_FIELDS[value_class]
+    except KeyError:
+        names = _PUBLIC_FIELDS[value_class] = tuple(
+            class_field.name for class_field in fields(value_class)
+            if not class_field.name.startswith("_"))
+        return names
 
 
 @dataclass(frozen=True, slots=True)
 class ValueObject(ABC):
+    # fields starting with an underscore are internal state, not part of the value
     def __str__(self) -> str:
-        fields_name = [field.name for field in fields(self)]
+        fields_name = public_fields(type(self))
         return str(getattr(self, fields_name[0])) \
             if len(fields_name) == 1 \
             else json.dumps({field_name: getattr(self, field_name) for field_name in fields_name})
@@ -19,14 +46,129 @@ class ValueObject(ABC):
 class UniqueEntityId(ValueObject):
     # pylint: disable=invalid-name
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    _raw: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
         object.__setattr__(self, "id", id_value)
-        self.__validate()
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.timed("UniqueEntityId.validate", self.__validate)
+        else:
+            self.__validate()
 
     def __validate(self):
         try:
             uuid.UUID(self.id)
         except ValueError as exc:
             raise InvalidUuidException() from exc
+
+    def __str__(self) -> str:
+        return self.id
+
+    def __getattr__(self, name: str):
+        # only reached when a slot was never set: ids built from bytes format
+        # their string on first access and keep it
+        if name == "id":
+            value = _format(object.__getattribute__(self, "_raw"))
+            object.__setattr__(self, "id", value)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def to_bytes(self) -> bytes:
+        if self._raw is None:
+            object.__setattr__(self, "_raw", uuid.UUID(self.id).bytes)
+        return self._raw
+
+    @classmethod
+    def trusted(cls, id_value: str) -> 'UniqueEntityId':
+        """Wraps an id string known to be a valid UUID, skipping validation."""
+        unique_entity_id = object.__new__(cls)
+        object.__setattr__(unique_entity_id, "id", id_value)
+        object.__setattr__(unique_entity_id, "_raw", None)
+        return unique_entity_id
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'UniqueEntityId':
+        """Compact id holding the 16 UUID bytes; `id` is formatted lazily."""
+        if not isinstance(raw, bytes) or len(raw) != 16:
+            raise InvalidUuidException()
+        unique_entity_id = object.__new__(cls)
+        object.__setattr__(unique_entity_id, "_raw", raw)
+        return unique_entity_id
+
+    @classmethod
+    def generate(cls) -> 'UniqueEntityId':
+        """Random (version 4) id formatted up front, as it is read right away."""
+        raw = bytearray(os.urandom(16))
+        raw[6] = _VERSION_4[raw[6]]
+        raw[8] = _RFC_4122_VARIANT[raw[8]]
+        return cls.trusted(_format(raw))
+
+    @classmethod
+    def generate_many(cls, count: int, time_ordered: bool = False) -> List['UniqueEntityId']:
+        """Generates `count` compact ids without parsing them.
+
+        Ids are random (version 4) by default. Time-ordered ids follow the
+        UUIDv7 layout (unix milliseconds, then a sequence in the 12 `rand_a`
+        bits) and strictly increase within the process, so inserts into
+        sorted indexes stay at the end.
+        """
+        if time_ordered:
+            raw = _time_ordered_bytes(count)
+        else:
+            raw = bytearray(os.urandom(16 * count))
+            raw[6::16] = raw[6::16].translate(_VERSION_4)
+            raw[8::16] = raw[8::16].translate(_RFC_4122_VARIANT)
+            raw = bytes(raw)
+        return cls.many_from_bytes(raw)
+
+    @classmethod
+    def many_from_bytes(cls, raw: bytes) -> List['UniqueEntityId']:
+        """Compact ids of consecutive 16-byte UUIDs, like `from_bytes` for each."""
+        if len(raw) % 16:
+            raise InvalidUuidException()
+        raw = bytes(raw)
+        new = object.__new__
+        set_raw = _RAW_SLOT.__set__
+        ids = []
+        for start in range(0, len(raw), 16):
+            unique_entity_id = new(cls)
+            set_raw(unique_entity_id, raw[start:start + 16])
+            ids.append(unique_entity_id)
+        return ids
+
+
+_RAW_SLOT = UniqueEntityId.__dict__["_raw"]
+
+
+def _format(raw: bytes) -> str:
+    digits = raw.hex()
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+class _TimeOrderedClock:
+    """Hands out strictly increasing `unix ms << 12 | sequence` values."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = 0
+
+    def reserve(self, count: int) -> int:
+        with self._lock:
+            first = max(time.time_ns() // 1_000_000 << 12, self._last + 1)
+            self._last = first + count - 1
+        return first
+
+
+_CLOCK = _TimeOrderedClock()
+
+
+def _time_ordered_bytes(count: int) -> bytes:
+    first = _CLOCK.reserve(count)
+    random_bits = os.urandom(8 * count)
+    return b"".join(
+        ((clock >> 12) << 80 | (clock & 0xFFF) << 64 | _VERSION_7_BITS
+         | int.from_bytes(random_bits[8 * offset:8 * offset + 8], "big") & _RANDOM_62_BITS
+         ).to_bytes(16, "big")
+        for offset, clock in enumerate(range(first, first + count))
+    )
@@ -0,0 +1,65 @@
+"""Run from src/: python -m __seedwork.tests.benchmark.domain.bench_value_objects"""
+import json
+import sys
+from dataclasses import dataclass, fields
+from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
+from __seedwork.tests.benchmark.runner import measure, report
+
+NUMBER = 50_000
+
+
+def bench_unique_entity_id():
+    id_value = str(UniqueEntityId.generate().id)
+    timings = {
+        "UniqueEntityId()": measure(UniqueEntityId, number=NUMBER),
+        "UniqueEntityId(id)": measure(lambda: UniqueEntityId(id_value), number=NUMBER),
+        "UniqueEntityId.trusted(id)": measure(lambda: UniqueEntityId.trusted(id_value),
+                                              number=NUMBER),
+        "generate()": measure(UniqueEntityId.generate, number=NUMBER),
+        "generate().id": measure(lambda: UniqueEntityId.generate().id, number=NUMBER),
+        "generate_many(n)": measure(lambda: UniqueEntityId.generate_many(NUMBER)),
+        "generate_many(n) + .id": measure(
+            lambda: [unique_id.id for unique_id in UniqueEntityId.generate_many(NUMBER)]),
+        "generate_many(n, time_ordered)": measure(
+            lambda: UniqueEntityId.generate_many(NUMBER, time_ordered=True)),
+    }
+    report("UniqueEntityId construction", timings,
+           baseline="UniqueEntityId()", unit_count=NUMBER)
+
+    compact = UniqueEntityId.generate()
+    print("\nretained bytes per id payload")
+    print(f"  id string  {sys.getsizeof(compact.id)}")
+    print(f"  raw bytes  {sys.getsizeof(compact.to_bytes())}")
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+def fields_str(value_object: ValueObject) -> str:
+    """The former ValueObject.__str__, reading the dataclass fields on every call."""
+    fields_name = [field.name for field in fields(value_object) if not field.name.startswith("_")]
+    return str(getattr(value_object, fields_name[0])) \
+        if len(fields_name) == 1 \
+        else json.dumps({field_name: getattr(value_object, field_name)
+                         for field_name in fields_name})
+
+
+def bench_str():
+    unique_entity_id, money = UniqueEntityId.generate(), Money(amount=10, currency="BRL")
+    timings = {
+        "fields() str(UniqueEntityId)": measure(lambda: fields_str(unique_entity_id),
+                                                number=NUMBER),
+        "str(UniqueEntityId)": measure(lambda: str(unique_entity_id), number=NUMBER),
+        "fields() str(two fields)": measure(lambda: fields_str(money), number=NUMBER),
+        "str(two fields)": measure(lambda: str(money), number=NUMBER),
+    }
+    report("ValueObject.__str__", timings,
+           baseline="fields() str(UniqueEntityId)", unit_count=NUMBER)
+
+
+if __name__ == "__main__":
+    bench_unique_entity_id()
+    bench_str()
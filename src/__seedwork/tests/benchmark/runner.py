@@ -0,0 +1,156 @@
+import gc
+import json
+import math
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def measure(func: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    """Best wall time, in seconds, of `number` calls to func."""
+    return min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+def report(title: str, timings: Dict[str, float], baseline: str, unit_count: int = 1) -> None:
+    print(f"\n{title}")
+    base = timings[baseline]
+    for name, seconds in timings.items():
+        per_unit = seconds / unit_count * 1e6
+        print(f"  {name:<32} {per_unit:10.3f} us/op  {base / seconds:6.2f}x")
+
+
+def retained_bytes(build: Callable[[], T]) -> Tuple[T, int]:
+    """What build returns, and the bytes it allocated that its result keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return value, size
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """One benchmark case at one input size: latencies per call, the rest per item."""
+    items_per_second: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    peak_bytes: float
+    allocated_blocks: float
+
+    # metrics where a larger value is a regression; throughput is the other way round
+    LOWER_IS_BETTER: ClassVar[Tuple[str, ...]] = (
+        "p50_us", "p90_us", "p99_us", "peak_bytes", "allocated_blocks")
+
+
+def profile(func: Callable[[], object], items: int = 1, calls: int = 200,
+            memory_calls: int = 20) -> Measurement:
+    """Times `calls` separate calls of func, each handling `items` items.
+
+    Latencies are per call; throughput is items over the median call time,
+    so a stray slow call moves the tail percentiles only.
+    Allocations come from a second, traced pass so tracing does not skew
+    the timings: `peak_bytes` is the most memory a call had allocated at
+    once and `allocated_blocks` the memory blocks it allocated that are
+    still alive afterwards, its result included, both per item.
+    """
+    func()
+    durations = []
+    gc.disable()
+    try:
+        for _ in range(calls):
+            started = time.perf_counter_ns()
+            func()
+            durations.append(time.perf_counter_ns() - started)
+    finally:
+        gc.enable()
+    durations.sort()
+
+    peak = 0
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        results = []
+        for _ in range(memory_calls):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results.append(func())
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    allocated = sys.getallocatedblocks() - blocks
+    del results
+
+    def percentile(fraction: float) -> float:
+        return durations[min(len(durations) - 1, int(fraction * len(durations)))] / 1e3
+
+    return Measurement(
+        items_per_second=items / (percentile(0.50) / 1e6),
+        p50_us=percentile(0.50),
+        p90_us=percentile(0.90),
+        p99_us=percentile(0.99),
+        peak_bytes=peak / items,
+        allocated_blocks=max(allocated, 0) / (memory_calls * items),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = (self.current - self.baseline) / self.baseline * 100 if self.baseline else math.inf
+        return f"{self.case}: {self.metric} {self.baseline:,.3f} -> {self.current:,.3f} " \
+               f"({change:+.1f}%)"
+
+
+def compare(baseline: Dict[str, Measurement], current: Dict[str, Measurement],
+            threshold: float = 0.25, metric_thresholds: Optional[Dict[str, float]] = None,
+            min_delta: float = 0.5) -> List[Regression]:
+    """Metrics of the cases in both runs that got worse by more than their threshold.
+
+    `metric_thresholds` overrides `threshold` for some metrics. Changes
+    smaller than `min_delta` in the metric's own unit are noise (a fraction
+    of a microsecond, a byte), whatever their ratio.
+    """
+    metric_thresholds = metric_thresholds or {}
+    regressions = []
+    for case, measurement in current.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        for metric in (metric_field.name for metric_field in fields(Measurement)):
+            old, new = getattr(reference, metric), getattr(measurement, metric)
+            allowed = metric_thresholds.get(metric, threshold)
+            if metric in Measurement.LOWER_IS_BETTER:
+                worse = new > old * (1 + allowed) and new - old > min_delta
+            else:
+                worse = new < old * (1 - allowed)
+            if worse:
+                regressions.append(Regression(case, metric, old, new))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Measurement]:
+    with open(path, encoding="utf-8") as file:
+        return {case: Measurement(**metrics) for case, metrics in json.load(file).items()}
+
+
+def save_baseline(path: str, measurements: Dict[str, Measurement]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({case: asdict(measurement) for case, measurement in measurements.items()},
+                  file, indent=2, sort_keys=True)
+        file.write("\n")
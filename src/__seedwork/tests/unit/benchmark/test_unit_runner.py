@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from __seedwork.tests.benchmark.runner import (
+    Measurement,
+    Regression,
+    compare,
+    load_baseline,
+    profile,
+    save_baseline
+)
+
+
+def measurement(**metrics) -> Measurement:
+    values = {"items_per_second": 1000.0, "p50_us": 10.0, "p90_us": 20.0, "p99_us": 40.0,
+              "peak_bytes": 500.0, "allocated_blocks": 4.0}
+    values.update(metrics)
+    return Measurement(**values)
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_profile(self):
+        result = profile(lambda: [object() for _ in range(100)], items=100, calls=20,
+                         memory_calls=5)
+        self.assertGreater(result.items_per_second, 0)
+        self.assertLessEqual(result.p50_us, result.p90_us)
+        self.assertLessEqual(result.p90_us, result.p99_us)
+        self.assertGreater(result.peak_bytes, 0)
+        # the list and its objects stay alive with the result
+        self.assertGreaterEqual(result.allocated_blocks, 1)
+
+    def test_compare(self):
+        baseline = {"a[1]": measurement(), "b[1]": measurement()}
+        current = {
+            "a[1]": measurement(items_per_second=700.0, p50_us=12.0, peak_bytes=700.0),
+            "b[1]": measurement(p99_us=70.0, allocated_blocks=4.4),
+            "new[1]": measurement(p50_us=1e6),
+        }
+        self.assertEqual(compare(baseline, current), [
+            Regression("a[1]", "items_per_second", 1000.0, 700.0),
+            Regression("a[1]", "peak_bytes", 500.0, 700.0),
+            Regression("b[1]", "p99_us", 40.0, 70.0),
+        ])
+        self.assertEqual(compare(baseline, current, threshold=0.5,
+                                 metric_thresholds={"p99_us": 1.0}), [])
+        self.assertEqual(str(Regression("a[1]", "p50_us", 10.0, 15.0)),
+                         "a[1]: p50_us 10.000 -> 15.000 (+50.0%)")
+
+    def test_small_changes_are_noise(self):
+        baseline = {"a[1]": measurement(p50_us=0.2, allocated_blocks=0.1)}
+        current = {"a[1]": measurement(p50_us=0.6, allocated_blocks=0.5)}
+        self.assertEqual(compare(baseline, current), [])
+
+    def test_baseline_round_trip(self):
+        measurements = {"a[1]": measurement(), "b[100]": measurement(p50_us=1.5)}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(path, measurements)
+            self.assertEqual(load_baseline(path), measurements)
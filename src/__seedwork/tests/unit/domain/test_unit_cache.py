@@ -0,0 +1,167 @@
+import threading
+import unittest
+from dataclasses import dataclass
+from typing import Optional
+from __seedwork.domain.cache import CachedSearchableRepository, CacheStats, EntityCache
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.repositories import InMemorySearchableRepository, SearchParams
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+
+@dataclass(slots=True)
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sortable_fields = ["name"]
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def test_hits_return_copies_of_a_snapshot(self):
+        cache = EntityCache()
+        entity = StubEntity(name="some name")
+        self.assertIs(cache.get("key", lambda: entity), entity)
+        entity._set("name", "changed")  # pylint: disable=protected-access
+
+        first = cache.get("key", self.fail)
+        self.assertEqual(first.name, "some name")
+        first._set("name", "changed")  # pylint: disable=protected-access
+        self.assertEqual(cache.get("key", self.fail).name, "some name")
+        self.assertEqual(cache.stats, CacheStats(hits=2, misses=1, loads=1, evictions=0,
+                                                 expirations=0, size=1))
+        self.assertAlmostEqual(cache.stats.hit_ratio, 2 / 3)
+
+    def test_evicts_least_recently_used(self):
+        cache = EntityCache(maxsize=2)
+        for key in ["a", "b"]:
+            cache.get(key, lambda key=key: StubEntity(name=key))
+        cache.get("a", self.fail)
+        cache.get("c", lambda: StubEntity(name="c"))
+        self.assertEqual(cache.get("a", self.fail).name, "a")
+        self.assertEqual(cache.get("b", lambda: StubEntity(name="reloaded")).name, "reloaded")
+        self.assertEqual(cache.stats.evictions, 2)
+        self.assertEqual(cache.stats.size, 2)
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = EntityCache(ttl=10, clock=clock)
+        cache.get("key", lambda: StubEntity(name="old"))
+        clock.now = 9.9
+        self.assertEqual(cache.get("key", self.fail).name, "old")
+        clock.now = 10
+        self.assertEqual(cache.get("key", lambda: StubEntity(name="new")).name, "new")
+        self.assertEqual(cache.stats.expirations, 1)
+
+    def test_errors_are_not_cached(self):
+        cache = EntityCache()
+
+        def fail():
+            raise NotFoundException("not found")
+        with self.assertRaises(NotFoundException):
+            cache.get("key", fail)
+        self.assertEqual(cache.get("key", lambda: StubEntity(name="a")).name, "a")
+        self.assertEqual(cache.stats.loads, 2)
+
+    def test_concurrent_misses_share_one_load(self):
+        cache = EntityCache()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return StubEntity(name="loaded")
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get("key", slow_loader)))
+        owner.start()
+        started.wait()
+        waiters = [threading.Thread(target=lambda: results.append(cache.get("key", slow_loader)))
+                   for _ in range(5)]
+        for waiter in waiters:
+            waiter.start()
+        release.set()
+        for thread in [owner, *waiters]:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([entity.name for entity in results], ["loaded"] * 6)
+        self.assertEqual(len({id(entity) for entity in results}), 6)
+
+    def test_load_invalidated_in_flight_is_not_cached(self):
+        cache = EntityCache()
+
+        def loader():
+            cache.invalidate("key")
+            return StubEntity(name="stale")
+        self.assertEqual(cache.get("key", loader).name, "stale")
+        self.assertEqual(cache.get("key", lambda: StubEntity(name="fresh")).name, "fresh")
+
+
+class TestCachedSearchableRepository(unittest.TestCase):
+    repo: CachedSearchableRepository
+
+    def setUp(self):
+        self.repo = CachedSearchableRepository(StubInMemorySearchableRepository())
+
+    def test_find_by_id_reads_through(self):
+        entity = StubEntity(name="some name")
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(self.repo.find_by_id(entity.unique_entity_id), entity)
+        self.assertEqual(self.repo.cache.stats.hits, 1)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id("fake id")
+
+    def test_writes_invalidate(self):
+        entity = StubEntity(name="a")
+        self.repo.bulk_insert([entity])
+        self.repo.find_by_id(entity.id)
+
+        updated = StubEntity(unique_entity_id=entity.unique_entity_id, name="b")
+        self.repo.update(updated)
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "b")
+        self.repo.insert(StubEntity(unique_entity_id=entity.unique_entity_id, name="c"))
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "c")
+
+        self.repo.patch_many({entity.id: {"name": "d"}})
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "d")
+
+        self.repo.delete(entity.unique_entity_id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entity.id)
+        self.assertEqual(self.repo.cache.stats.size, 0)
+
+        self.repo.insert(entity)
+        self.repo.find_by_id(entity.id)
+        self.repo.bulk_delete([entity.id])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entity.id)
+
+        self.repo.insert(entity)
+        loaded = self.repo.find_by_id(entity.id)
+        loaded._set("name", "e")  # pylint: disable=protected-access
+        loaded._bump_version()  # pylint: disable=protected-access
+        self.repo.compare_and_set(loaded, 0)
+        self.assertEqual((self.repo.find_by_id(entity.id).name, loaded.version), ("e", 1))
+        with self.assertRaises(ConflictException):
+            self.repo.compare_and_set(loaded, 0)
+
+    def test_search_and_find_all_pass_through(self):
+        entities = [StubEntity(name=name) for name in ["b", "a"]]
+        self.repo.bulk_insert(entities)
+        self.assertEqual(self.repo.find_all(), entities)
+        self.assertEqual(self.repo.search(SearchParams(sort="name")).items, entities[::-1])
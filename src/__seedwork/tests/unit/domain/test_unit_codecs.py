@@ -0,0 +1,105 @@
+import importlib.util
+import json
+import sys
+import unittest
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+from unittest.mock import patch
+from __seedwork.domain import codecs
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: Decimal
+    currency: str
+
+
+@dataclass(frozen=True, slots=True)
+class Email(ValueObject):
+    address: str
+    _domain: Optional[str] = field(default=None, init=False)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[Money] = None
+    contact: Optional[Email] = None
+    created_at: Optional[datetime] = field(default_factory=lambda: datetime(2023, 5, 1, 10, 30))
+    duration: timedelta = timedelta(minutes=90)
+
+
+class Point:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, x, y):  # pylint: disable=invalid-name
+        self.x, self.y = x, y  # pylint: disable=invalid-name
+
+
+class TestCodecs(unittest.TestCase):
+
+    def test_value_objects(self):
+        unique_entity_id = UniqueEntityId()
+        self.assertEqual(json.loads(codecs.encode(unique_entity_id)), unique_entity_id.id)
+        self.assertEqual(codecs.decode(codecs.encode(unique_entity_id), UniqueEntityId),
+                         unique_entity_id)
+
+        money = Money(amount=Decimal("9.90"), currency="BRL")
+        self.assertEqual(json.loads(codecs.encode(money)), {"amount": "9.90", "currency": "BRL"})
+        self.assertEqual(codecs.decode(codecs.encode(money), Money), money)
+
+        email = Email(address="user@example.com")
+        self.assertEqual(codecs.encode(email), b'"user@example.com"')
+        self.assertEqual(codecs.decode_many(codecs.encode_many([email, email]), Email),
+                         [email, email])
+
+    def test_entity_round_trip(self):
+        entity = StubEntity(name="some name", price=Money(amount=Decimal("1.5"), currency="USD"),
+                            contact=Email(address="user@example.com"))
+        data = json.loads(codecs.encode(entity))
+        self.assertEqual(data, {
+            "name": "some name",
+            "price": {"amount": "1.5", "currency": "USD"},
+            "contact": "user@example.com",
+            "created_at": "2023-05-01T10:30:00",
+            "duration": 5400.0,
+            "id": entity.id,
+        })
+
+        decoded = codecs.decode(codecs.encode(entity), StubEntity)
+        self.assertEqual(decoded, entity)
+        self.assertIsInstance(decoded.created_at, datetime)
+        self.assertIsNone(decoded._events)  # pylint: disable=protected-access
+        self.assertEqual(decoded.changes(), {})
+
+    def test_entity_defaults_and_nulls(self):
+        entity_id = UniqueEntityId()
+        decoded = codecs.decode(json.dumps({"id": entity_id.id, "name": "a", "created_at": None}),
+                                StubEntity)
+        self.assertEqual(decoded, StubEntity(unique_entity_id=entity_id, name="a",
+                                             created_at=None))
+        with self.assertRaises(KeyError):
+            codecs.decode(json.dumps({"id": entity_id.id}), StubEntity)
+
+    def test_register(self):
+        with self.assertRaises(TypeError):
+            codecs.codec_for(Point)
+        with patch.dict(codecs._CODECS):  # pylint: disable=protected-access
+            codecs.register(Point, lambda point: [point.x, point.y], lambda data: Point(*data))
+            self.assertEqual(codecs.encode(Point(1, 2)), b"[1,2]")
+            self.assertEqual(codecs.decode(b"[1,2]", Point).y, 2)
+
+    def test_standard_library_fallback(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            spec = importlib.util.find_spec("__seedwork.domain.serializers")
+            serializers = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(serializers)
+        self.assertEqual(serializers.JSON_BACKEND, "json")
+        value = {"at": datetime(2023, 5, 1, 10, 30, 15, 123), "price": Decimal("1.50")}
+        self.assertEqual(serializers.dumps(value),
+                         b'{"at":"2023-05-01T10:30:15.000123","price":"1.50"}')
+        self.assertEqual(serializers.loads(serializers.dumps(value)),
+                         json.loads(codecs.dumps(value)))
@@ -49,3 +49,30 @@ class TestEntityUnit(unittest.TestCase):
         entity = StubEntity(prop1="val1", prop2="val2")
         entity._set("prop1", "new_val")
         self.assertEqual(entity.prop1, "new_val")
+
+    def test_tracks_changed_fields(self):
+        entity = StubEntity(prop1="val1", prop2="val2")
+        self.assertEqual(entity.changes(), {})
+        entity._set("prop1", "val1")
+        self.assertEqual(entity.changes(), {})
+
+        entity._set("prop1", "new_val")._set("prop2", "other")._set("prop1", "last")
+        self.assertEqual(entity.changes(), {"prop1": "last", "prop2": "other"})
+        entity.mark_clean()
+        self.assertEqual(entity.changes(), {})
+
+        # equal values of another type still change the field
+        entity._set("prop2", 1)
+        entity.mark_clean()
+        entity._set("prop2", True)
+        self.assertEqual(entity.changes(), {"prop2": True})
+
+    def test_version(self):
+        entity = StubEntity(prop1="val1", prop2="val2")
+        self.assertEqual(entity.version, 0)
+        entity._bump_version()
+        entity._bump_version()
+        self.assertEqual(entity.version, 2)
+        self.assertEqual(entity, StubEntity(unique_entity_id=entity.unique_entity_id,
+                                            prop1="val1", prop2="val2"))
+        self.assertNotIn("_version", entity.to_dict())
@@ -0,0 +1,127 @@
+import unittest
+from dataclasses import dataclass
+from typing import List
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.events import DomainEvent, EventDispatcher, coalesce
+
+
+@dataclass(frozen=True, slots=True)
+class StubCreated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class StubRenamed(DomainEvent):
+    coalesce_key = "name"
+
+    name: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+    def rename(self, name: str) -> None:
+        self._set("name", name)
+        self._record(StubRenamed(self.id, name))
+
+
+class TestEntityEvents(unittest.TestCase):
+
+    def test_pull_events(self):
+        entity = StubEntity(name="a")
+        self.assertIsNone(entity._events)  # pylint: disable=protected-access
+        self.assertEqual(entity.pull_events(), [])
+
+        entity.rename("b")
+        entity.rename("c")
+        self.assertEqual(entity.pull_events(), [StubRenamed(entity.id, "c")])
+        self.assertEqual(entity.pull_events(), [])
+
+    def test_recording_coalesces_pending_events(self):
+        entity = StubEntity(name="a")
+        entity._record(StubCreated(entity.id))  # pylint: disable=protected-access
+        for number in range(1000):
+            entity.rename(f"name {number}")
+            self.assertEqual(len(entity._events), 2)  # pylint: disable=protected-access
+        entity._record(StubCreated(entity.id))  # pylint: disable=protected-access
+        entity.rename("last")
+        self.assertEqual(entity.pull_events(), [StubCreated(entity.id), StubCreated(entity.id),
+                                                StubRenamed(entity.id, "last")])
+
+    def test_events_are_not_part_of_the_value(self):
+        entity = StubEntity(name="a")
+        other = StubEntity(unique_entity_id=entity.unique_entity_id, name="a")
+        entity.rename("a")
+        self.assertEqual(entity, other)
+        self.assertNotIn("_events", entity.to_dict())
+        self.assertNotIn("_events", repr(entity))
+
+
+class TestCoalesce(unittest.TestCase):
+
+    def test_keeps_the_last_event_per_entity_and_key(self):
+        events = [StubCreated("1"), StubRenamed("1", "a"), StubRenamed("2", "x"),
+                  StubRenamed("1", "b"), StubCreated("1"), StubRenamed("2", "y")]
+        self.assertEqual(coalesce(events), [StubCreated("1"), StubRenamed("1", "b"),
+                                            StubCreated("1"), StubRenamed("2", "y")])
+        self.assertEqual(coalesce([]), [])
+
+
+class TestEventDispatcher(unittest.TestCase):
+
+    def test_delivers_batches_to_matching_handlers(self):
+        dispatcher = EventDispatcher(batch_size=3)
+        renamed: List[List[DomainEvent]] = []
+        everything: List[List[DomainEvent]] = []
+        dispatcher.subscribe(StubRenamed, renamed.append)
+        dispatcher.subscribe(DomainEvent, everything.append)
+
+        dispatcher.publish([StubCreated("1"), StubRenamed("1", "a"), StubRenamed("1", "b"),
+                            StubRenamed("1", "c"), StubCreated("2")])
+        self.assertEqual(len(dispatcher), 5)
+        self.assertEqual(dispatcher.dispatch(), 6)
+        self.assertEqual(len(dispatcher), 0)
+        self.assertEqual(renamed, [[StubRenamed("1", "b")], [StubRenamed("1", "c")]])
+        self.assertEqual(everything, [[StubCreated("1"), StubRenamed("1", "b")],
+                                      [StubRenamed("1", "c"), StubCreated("2")]])
+        self.assertEqual(dispatcher.dispatch(), 0)
+
+    def test_collect_pulls_entity_events(self):
+        dispatcher = EventDispatcher()
+        delivered: List[List[DomainEvent]] = []
+        dispatcher.subscribe(StubRenamed, delivered.append)
+        first, second = StubEntity(name="a"), StubEntity(name="x")
+        first.rename("b")
+        second.rename("y")
+        first.rename("c")
+        dispatcher.collect(first, second)
+        self.assertEqual(first.pull_events(), [])
+        dispatcher.dispatch()
+        self.assertEqual(delivered, [[StubRenamed(first.id, "c"), StubRenamed(second.id, "y")]])
+
+    def test_sync_dispatch_refuses_async_handlers(self):
+        dispatcher = EventDispatcher()
+
+        async def handler(_events):
+            pass
+        dispatcher.subscribe(StubCreated, handler)
+        dispatcher.publish([StubCreated("1")])
+        with self.assertRaises(TypeError):
+            dispatcher.dispatch()
+        self.assertEqual(len(dispatcher), 1)
+
+
+class TestEventDispatcherAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_dispatch_async_awaits_async_handlers(self):
+        dispatcher = EventDispatcher()
+        delivered = []
+
+        async def async_handler(events):
+            delivered.append(("async", events))
+        dispatcher.subscribe(StubCreated, async_handler)
+        dispatcher.subscribe(StubCreated, lambda events: delivered.append(("sync", events)))
+        dispatcher.publish([StubCreated("1")])
+        self.assertEqual(await dispatcher.dispatch_async(), 2)
+        self.assertEqual(delivered, [("async", [StubCreated("1")]), ("sync", [StubCreated("1")])])
@@ -0,0 +1,149 @@
+import unittest
+from dataclasses import dataclass
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import InvalidUuidException, ValidationException
+from __seedwork.domain.instrumentation import (
+    INSTRUMENTATION,
+    Instrumentation,
+    MetricsRegistry,
+    TimerStats
+)
+from __seedwork.domain.serializers import to_dicts
+from __seedwork.domain.validators import ValidatorRules, compile_rules
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 0.5
+        return self.now
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_counters_and_timers(self):
+        registry = MetricsRegistry()
+        registry.increment("hits", b="2", a="1")
+        registry.increment("hits", amount=2, a="1", b="2")
+        registry.observe("op", 0.25, operation="x")
+        registry.observe("op", 0.75, operation="x")
+        self.assertEqual(registry.counter("hits", a="1", b="2"), 3)
+        self.assertEqual(registry.counter("hits"), 0)
+        self.assertEqual(registry.timer("op", operation="x"), TimerStats(2, 1.0, 0.75))
+        self.assertEqual(registry.timer("op"), TimerStats(0, 0, 0))
+        registry.clear()
+        self.assertEqual(registry.to_prometheus(), "")
+
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.increment("validation_failures", field="name", message='say "hi"\\\n')
+        registry.increment("domain_events")
+        registry.observe("operation", 0.5, operation="a")
+        registry.observe("operation", 0.25, operation="b")
+        self.assertEqual(registry.to_prometheus(prefix="app_"), "\n".join([
+            "# TYPE app_domain_events_total counter",
+            "app_domain_events_total 1",
+            "# TYPE app_validation_failures_total counter",
+            'app_validation_failures_total{field="name",message="say \\"hi\\"\\\\\\n"} 1',
+            "# TYPE app_operation_seconds summary",
+            'app_operation_seconds_count{operation="a"} 1',
+            'app_operation_seconds_sum{operation="a"} 0.5',
+            'app_operation_seconds_count{operation="b"} 1',
+            'app_operation_seconds_sum{operation="b"} 0.25',
+            "# TYPE app_operation_seconds_max gauge",
+            'app_operation_seconds_max{operation="a"} 0.5',
+            'app_operation_seconds_max{operation="b"} 0.25',
+        ]) + "\n")
+
+    def test_prometheus_keeps_each_family_together(self):
+        registry = MetricsRegistry()
+        registry.observe("operation", 0.5, operation="a")
+        registry.observe("queue", 0.25)
+        self.assertEqual(registry.to_prometheus(), "\n".join([
+            "# TYPE seedwork_operation_seconds summary",
+            'seedwork_operation_seconds_count{operation="a"} 1',
+            'seedwork_operation_seconds_sum{operation="a"} 0.5',
+            "# TYPE seedwork_queue_seconds summary",
+            "seedwork_queue_seconds_count 1",
+            "seedwork_queue_seconds_sum 0.25",
+            "# TYPE seedwork_operation_seconds_max gauge",
+            'seedwork_operation_seconds_max{operation="a"} 0.5',
+            "# TYPE seedwork_queue_seconds_max gauge",
+            "seedwork_queue_seconds_max 0.25",
+        ]) + "\n")
+
+
+class TestInstrumentation(unittest.TestCase):
+    registry: MetricsRegistry
+
+    def setUp(self):
+        self.registry = INSTRUMENTATION.enable(MetricsRegistry())
+        self.addCleanup(INSTRUMENTATION.disable)
+
+    def test_timed(self):
+        instrumentation = Instrumentation(clock=FakeClock())
+        registry = instrumentation.enable()
+        self.assertEqual(instrumentation.timed("add", lambda a, b: a + b, 1, 2), 3)
+        with self.assertRaises(ZeroDivisionError):
+            instrumentation.timed("divide", lambda: 1 / 0)
+        self.assertEqual(registry.timer("operation", operation="add"), TimerStats(1, 0.5, 0.5))
+        self.assertEqual(registry.timer("operation", operation="divide").count, 1)
+        self.assertEqual(registry.counter("operation_errors", operation="divide",
+                                          error="ZeroDivisionError"), 1)
+
+    def test_disabled_records_nothing(self):
+        INSTRUMENTATION.disable()
+        StubEntity(name="a").to_dict()
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityId("fake id")
+        self.assertEqual(self.registry.to_prometheus(), "")
+
+    def test_rule_failures_by_field_and_message(self):
+        rules = compile_rules({"name": "required|max_length:3"})
+        for value in [None, "long", "abc"]:
+            try:
+                rules.validate(name=value)
+            except ValidationException:
+                pass
+        rules.collect(name="longer")
+        rules.check(name=None)
+        with self.assertRaises(ValidationException):
+            ValidatorRules.values(1, "price").string()
+
+        self.assertEqual(self.registry.counter(
+            "validation_failures", field="name", rule="required",
+            message="The field name is required."), 2)
+        self.assertEqual(self.registry.counter(
+            "validation_failures", field="name", rule="max_length",
+            message="The field name cannot exceed 3 characters."), 2)
+        self.assertEqual(self.registry.counter(
+            "validation_failures", field="price", rule="string",
+            message="The field price must be a string."), 1)
+
+    def test_entities_and_ids(self):
+        entity = StubEntity(name="a")
+        entity.to_dict()
+        to_dicts([entity, entity])
+        entity._set("name", "b")  # pylint: disable=protected-access
+        UniqueEntityId(entity.id)
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityId("fake id")
+
+        self.assertEqual(self.registry.timer("operation", operation="StubEntity.to_dict").count, 1)
+        self.assertEqual(self.registry.timer("operation", operation="to_dicts").count, 1)
+        self.assertEqual(self.registry.counter("field_changes", entity="StubEntity", field="name"),
+                         1)
+        self.assertEqual(
+            self.registry.timer("operation", operation="UniqueEntityId.validate").count, 2)
+        self.assertEqual(self.registry.counter(
+            "operation_errors", operation="UniqueEntityId.validate",
+            error="InvalidUuidException"), 1)
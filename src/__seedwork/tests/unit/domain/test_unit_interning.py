@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from __seedwork.domain.interning import Interner
+
+
+class TestInterner(unittest.TestCase):
+
+    def test_shares_equal_values(self):
+        interner = Interner()
+        first = "".join(["Mo", "vie"])
+        second = "".join(["Mov", "ie"])
+        self.assertIsNot(first, second)
+        self.assertIs(interner(first), first)
+        self.assertIs(interner(second), first)
+        created_at = datetime(2022, 1, 1)
+        self.assertIs(interner(created_at), created_at)
+        self.assertIs(interner(datetime(2022, 1, 1)), created_at)
+        self.assertIsNone(interner(None))
+        self.assertEqual(len(interner), 2)
+
+    def test_keeps_types_and_time_zones_apart(self):
+        interner = Interner()
+        self.assertIs(interner(1), 1)
+        self.assertIs(interner(True), True)
+        utc = datetime(2022, 1, 1, 12, tzinfo=timezone.utc)
+        paris = datetime(2022, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(utc, paris)
+        self.assertIs(interner(utc), utc)
+        self.assertIs(interner(paris), paris)
+
+    def test_unhashable_values_are_returned_as_they_are(self):
+        value = ["Movie"]
+        self.assertIs(Interner()(value), value)
+
+    def test_max_size(self):
+        interner = Interner(max_size=1)
+        interner("Movie")
+        series = "".join(["Ser", "ies"])
+        self.assertIs(interner(series), series)
+        self.assertIsNot(interner("".join(["Ser", "ies"])), series)
+        self.assertEqual(len(interner), 1)
+        interner.clear()
+        self.assertEqual(len(interner), 0)
@@ -0,0 +1,449 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+from abc import ABC
+from dataclasses import dataclass, field
+from typing import List, Optional
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.repositories import (
+    AsyncInMemorySearchableRepository,
+    InMemoryRepository,
+    InMemorySearchableRepository,
+    RepositoryInterface,
+    SearchableRepositoryInterface,
+    SearchParams,
+    SearchResult,
+    SortedIndex,
+    decode_cursor,
+    encode_cursor
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+
+@dataclass(slots=True)
+class StubInMemoryRepository(InMemoryRepository[StubEntity]):
+    pass
+
+
+def rename(entity: StubEntity, name: str) -> StubEntity:
+    # pylint: disable=protected-access
+    entity._set("name", name)
+    entity._bump_version()
+    return entity
+
+
+@dataclass(slots=True)
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sortable_fields = ["name", "price"]
+
+    def _apply_filter(self, filter_param: Optional[str]) -> Optional[List[str]]:
+        if filter_param is None:
+            return None
+        return [entity.id for entity in self.items.values() if filter_param in entity.name]
+
+
+@dataclass(slots=True)
+class StubAsyncInMemoryRepository(AsyncInMemorySearchableRepository[StubEntity, str]):
+    sortable_fields = StubInMemorySearchableRepository.sortable_fields
+
+    repository: StubInMemorySearchableRepository = field(
+        default_factory=StubInMemorySearchableRepository)
+
+
+class TestRepositoryInterface(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError):
+            # pylint: disable=abstract-class-instantiated
+            RepositoryInterface()
+        with self.assertRaises(TypeError):
+            # pylint: disable=abstract-class-instantiated
+            SearchableRepositoryInterface()
+
+    def test_is_abstract(self):
+        self.assertTrue(issubclass(SearchableRepositoryInterface, RepositoryInterface))
+        self.assertTrue(issubclass(RepositoryInterface, ABC))
+
+
+class TestSearchParams(unittest.TestCase):
+
+    def test_defaults(self):
+        params = SearchParams()
+        self.assertEqual(params.page, 1)
+        self.assertEqual(params.per_page, 15)
+        self.assertIsNone(params.sort)
+        self.assertIsNone(params.sort_dir)
+        self.assertIsNone(params.filter)
+
+    def test_page_and_per_page_normalization(self):
+        for value, expected in [(None, 1), ("", 1), ("fake", 1), (0, 1), (-1, 1),
+                                ("2", 2), (2.5, 2), (True, 1), (3, 3)]:
+            self.assertEqual(SearchParams(page=value).page, expected, value)
+        for value, expected in [(None, 15), ("fake", 15), (0, 15), (-1, 15), ("5", 5), (10, 10)]:
+            self.assertEqual(SearchParams(per_page=value).per_page, expected, value)
+
+    def test_sort_and_sort_dir_normalization(self):
+        self.assertIsNone(SearchParams(sort="").sort)
+        self.assertEqual(SearchParams(sort=5).sort, "5")
+        self.assertIsNone(SearchParams(sort=None, sort_dir="asc").sort_dir)
+        for value, expected in [(None, "asc"), ("", "asc"), ("fake", "asc"),
+                                ("ASC", "asc"), ("desc", "desc"), ("DESC", "desc")]:
+            self.assertEqual(SearchParams(sort="field", sort_dir=value).sort_dir, expected, value)
+
+    def test_filter_normalization(self):
+        self.assertIsNone(SearchParams(filter="").filter)
+        self.assertEqual(SearchParams(filter="test").filter, "test")
+        self.assertEqual(SearchParams(filter=0).filter, 0)
+
+    def test_cursor_normalization(self):
+        self.assertIsNone(SearchParams().cursor)
+        self.assertIsNone(SearchParams(cursor="").cursor)
+        self.assertEqual(SearchParams(cursor="abc").cursor, "abc")
+
+
+class TestCursor(unittest.TestCase):
+
+    def test_round_trip(self):
+        created_at = datetime(2022, 1, 2, 3, 4, 5, 6)
+        for value in ["name", 10, None, created_at]:
+            cursor = encode_cursor("field", "desc", value, "some id")
+            self.assertEqual(decode_cursor(cursor, "field", "desc"), (value, "some id"))
+
+    def test_invalid_or_foreign_cursors_are_ignored(self):
+        cursor = encode_cursor("field", "asc", "value", "some id")
+        self.assertIsNone(decode_cursor(cursor, "field", "desc"))
+        self.assertIsNone(decode_cursor(cursor, "other", "asc"))
+        self.assertIsNone(decode_cursor(cursor, None, None))
+        self.assertIsNone(decode_cursor(None, "field", "asc"))
+        for invalid in ["fake", "!!!", "bnVsbA==", "WzEsMl0="]:
+            self.assertIsNone(decode_cursor(invalid, "field", "asc"), invalid)
+
+
+class TestSearchResult(unittest.TestCase):
+
+    def test_to_dict(self):
+        entity = StubEntity(name="test")
+        result = SearchResult(items=[entity], total=4, current_page=1, per_page=2,
+                              sort="name", sort_dir="asc", filter="test")
+        self.assertDictEqual(result.to_dict(), {
+            "items": [entity],
+            "total": 4,
+            "current_page": 1,
+            "per_page": 2,
+            "last_page": 2,
+            "sort": "name",
+            "sort_dir": "asc",
+            "filter": "test",
+            "next_cursor": None,
+        })
+
+    def test_last_page(self):
+        self.assertEqual(SearchResult(items=[], total=101, current_page=1, per_page=20).last_page, 6)
+        self.assertEqual(SearchResult(items=[], total=0, current_page=1, per_page=20).last_page, 0)
+
+
+class TestSortedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.original_chunk_size = SortedIndex.CHUNK_SIZE
+        SortedIndex.CHUNK_SIZE = 4
+
+    def tearDown(self):
+        SortedIndex.CHUNK_SIZE = self.original_chunk_size
+
+    def test_add_remove_and_slice_across_chunks(self):
+        index = SortedIndex()
+        values = [7, 3, None, 9, 1, 5, 2, 8, 0, 6, 4, 3]
+        for position, value in enumerate(values):
+            index.add(SortedIndex.entry(value, f"id{position:02}"))
+        expected = sorted(
+            (SortedIndex.entry(value, f"id{position:02}") for position, value in enumerate(values)))
+        self.assertEqual(list(index), expected)
+        self.assertEqual(len(index), len(values))
+
+        ids = [entry[2] for entry in expected]
+        self.assertEqual(index.ids(0, 5), ids[:5])
+        self.assertEqual(index.ids(3, 11), ids[3:11])
+        self.assertEqual(index.ids(0, 3, reverse=True), ids[::-1][:3])
+        self.assertEqual(index.ids(10, 20, reverse=True), ids[::-1][10:])
+        self.assertEqual(index.ids(20, 30), [])
+        self.assertEqual(index.position(SortedIndex.entry(3, "")), 4)
+        self.assertEqual(index.position(SortedIndex.entry(100, "")), len(values))
+
+        index.remove(SortedIndex.entry(3, "id01"))
+        index.remove(SortedIndex.entry(None, "id02"))
+        with self.assertRaises(KeyError):
+            index.remove(SortedIndex.entry(3, "id01"))
+        self.assertEqual(list(index), [entry for entry in expected
+                                       if entry[2] not in ("id01", "id02")])
+
+    def test_update_merges_entries(self):
+        index = SortedIndex([SortedIndex.entry(2, "b")])
+        index.update([SortedIndex.entry(1, "a"), SortedIndex.entry(3, "c")])
+        self.assertEqual(index.ids(0, 3), ["a", "b", "c"])
+
+        entries = [SortedIndex.entry(value, f"id{value:03}") for value in range(0, 400, 2)]
+        index = SortedIndex(entries)
+        for batch in ([SortedIndex.entry(201, "one")],
+                      [SortedIndex.entry(value, f"id{value:03}") for value in range(399, 0, -4)]):
+            with patch.object(SortedIndex, "add", wraps=index.add) as add:
+                index.update(batch)
+            self.assertEqual(add.call_count, len(batch) if len(batch) == 1 else 0)
+            entries = sorted(entries + batch)
+            self.assertEqual(list(index), entries)
+            self.assertEqual(len(index), len(entries))
+            self.assertEqual(index.ids(0, len(entries)), [entry[2] for entry in entries])
+        # merged chunks stay bounded
+        self.assertTrue(all(len(chunk) <= 2 * SortedIndex.CHUNK_SIZE
+                            for chunk in index._chunks))  # pylint: disable=protected-access
+
+
+class TestInMemoryRepository(unittest.TestCase):
+    repo: StubInMemoryRepository
+
+    def setUp(self):
+        self.repo = StubInMemoryRepository()
+
+    def test_items_prop_is_empty_on_init(self):
+        self.assertEqual(self.repo.items, {})
+
+    def test_insert_and_find(self):
+        entity = StubEntity(name="test", price=5)
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(self.repo.find_by_id(entity.unique_entity_id), entity)
+        self.assertEqual(self.repo.find_all(), [entity])
+
+    def test_bulk_insert(self):
+        entities = [StubEntity(name="a"), StubEntity(name="b")]
+        self.repo.bulk_insert(entities)
+        self.assertEqual(self.repo.find_all(), entities)
+
+    def test_find_many(self):
+        entities = [StubEntity(name="a"), StubEntity(name="b")]
+        self.repo.bulk_insert(entities)
+        unknown = UniqueEntityId()
+        expected = {entity.id: entity for entity in entities}
+        self.assertEqual(self.repo.find_many(
+            [entities[0].unique_entity_id, entities[1].id, unknown, "fake id"]), expected)
+        self.assertEqual(RepositoryInterface.find_many(
+            self.repo, [entities[0].id, entities[1].unique_entity_id, unknown]), expected)
+
+    def test_throw_not_found_exception(self):
+        unique_entity_id = UniqueEntityId()
+        for method in (self.repo.find_by_id, self.repo.delete):
+            with self.assertRaises(NotFoundException) as assert_error:
+                method(unique_entity_id)
+            self.assertEqual(assert_error.exception.args[0],
+                             f"Entity not found using ID '{unique_entity_id}'")
+        with self.assertRaises(NotFoundException):
+            self.repo.update(StubEntity(name="test"))
+
+    def test_update_and_delete(self):
+        entity = StubEntity(name="test")
+        self.repo.insert(entity)
+        updated = StubEntity(unique_entity_id=entity.unique_entity_id, name="updated")
+        self.repo.update(updated)
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "updated")
+        self.repo.delete(entity.id)
+        self.assertEqual(self.repo.items, {})
+
+    def test_compare_and_set(self):
+        entity = StubEntity(name="test")
+        self.repo.insert(entity)
+        # the repository shares the instance, the version it wrote still counts
+        self.repo.compare_and_set(rename(entity, "first"), 0)
+        self.assertEqual(self.repo.find_by_id(entity.id).version, 1)
+        with self.assertRaises(ConflictException) as assert_error:
+            self.repo.compare_and_set(rename(entity, "second"), 0)
+        self.assertEqual(assert_error.exception.args[0],
+                         f"Entity '{entity.id}' is at version 1, not the expected 0")
+        self.repo.compare_and_set(entity, 1)
+        with self.assertRaises(NotFoundException):
+            self.repo.compare_and_set(StubEntity(name="unknown"), 0)
+
+    def test_compare_and_set_many_is_all_or_nothing(self):
+        first, second = StubEntity(name="first"), StubEntity(name="second")
+        repo = StubInMemorySearchableRepository(items={first.id: first, second.id: second})
+        renamed = rename(StubEntity(unique_entity_id=first.unique_entity_id, name="first"), "a")
+        stale = rename(StubEntity(unique_entity_id=second.unique_entity_id, name="second"), "b")
+        repo.update(rename(StubEntity(unique_entity_id=second.unique_entity_id,
+                                      name="second"), "concurrent"))
+        with self.assertRaises(ConflictException):
+            repo.compare_and_set_many([(renamed, 0), (stale, 0)])
+        self.assertEqual([entity.name for entity in repo.find_all()], ["first", "concurrent"])
+
+        repo.compare_and_set_many([(renamed, 0), (stale, 1)])
+        self.assertEqual([entity.name for entity in repo.find_all()], ["a", "b"])
+        self.assertEqual(repo.search(SearchParams(filter="a")).items, [renamed])
+        # saving an id twice expects the version written by the first save
+        rename(renamed, "c")
+        with self.assertRaises(ConflictException):
+            repo.compare_and_set_many([(renamed, 1), (renamed, 1)])
+        repo.compare_and_set_many([(renamed, 1), (renamed, 2)])
+        self.assertEqual(repo.find_by_id(renamed.id).version, 2)
+
+    def test_compare_and_set_many_is_abstract(self):
+        class Repository(RepositoryInterface[StubEntity]):  # pylint: disable=abstract-method
+            # pylint: disable=multiple-statements
+            def insert(self, entity): pass
+            def bulk_insert(self, entities): pass
+            def find_by_id(self, entity_id): pass
+            def find_all(self): pass
+            def update(self, entity): pass
+            def delete(self, entity_id): pass
+        with self.assertRaises(TypeError) as assert_error:
+            # pylint: disable=abstract-class-instantiated
+            Repository()
+        self.assertIn("compare_and_set_many", str(assert_error.exception))
+
+
+class TestInMemorySearchableRepository(unittest.TestCase):
+    repo: StubInMemorySearchableRepository
+
+    def setUp(self):
+        self.repo = StubInMemorySearchableRepository()
+
+    def test_search_without_sort_keeps_insertion_order(self):
+        entities = [StubEntity(name=f"entity {i}") for i in range(5)]
+        self.repo.bulk_insert(entities)
+        result = self.repo.search(SearchParams(page=2, per_page=2))
+        self.assertEqual(result, SearchResult(items=entities[2:4], total=5, current_page=2,
+                                              per_page=2, sort=None, sort_dir=None))
+
+    def test_search_sorted_and_paginated(self):
+        entities = [StubEntity(name=name, price=price)
+                    for name, price in [("b", 2), ("a", None), ("d", 1), ("c", 3)]]
+        self.repo.bulk_insert(entities[:2])
+        for entity in entities[2:]:
+            self.repo.insert(entity)
+
+        def names(**kwargs):
+            return [entity.name for entity in self.repo.search(SearchParams(**kwargs)).items]
+
+        self.assertEqual(names(sort="name"), ["a", "b", "c", "d"])
+        self.assertEqual(names(sort="name", sort_dir="desc"), ["d", "c", "b", "a"])
+        self.assertEqual(names(sort="price"), ["a", "d", "b", "c"])
+        self.assertEqual(names(sort="name", page=2, per_page=3), ["d"])
+        self.assertEqual(names(sort="fake"), ["b", "a", "d", "c"])
+
+    def test_search_with_filter(self):
+        self.repo.bulk_insert([StubEntity(name=name)
+                               for name in ["test c", "fake", "test a", "test b"]])
+        result = self.repo.search(SearchParams(filter="test", sort="name", sort_dir="desc",
+                                               per_page=2))
+        self.assertEqual([entity.name for entity in result.items], ["test c", "test b"])
+        self.assertEqual(result.total, 3)
+        self.assertEqual(result.last_page, 2)
+
+    def test_search_by_cursor(self):
+        SortedIndex.CHUNK_SIZE, chunk_size = 2, SortedIndex.CHUNK_SIZE
+        self.addCleanup(setattr, SortedIndex, "CHUNK_SIZE", chunk_size)
+        entities = [StubEntity(name=f"test {i % 4}", price=i % 3 or None) for i in range(11)]
+        self.repo.bulk_insert(entities)
+
+        for params in [{"sort": "name"}, {"sort": "price", "sort_dir": "desc"},
+                       {"sort": "name", "filter": "test 2"},
+                       {"sort": "price", "sort_dir": "desc", "filter": "test"}]:
+            expected = self.repo.search(SearchParams(per_page=100, **params)).items
+            pages, cursor = [], None
+            while True:
+                result = self.repo.search(SearchParams(per_page=3, cursor=cursor, **params))
+                pages.append(result.items)
+                self.assertEqual(result.total, len(expected))
+                cursor = result.next_cursor
+                if cursor is None:
+                    break
+            self.assertEqual([entity for page in pages for entity in page], expected, params)
+            self.assertEqual(pages[0], expected[:3])
+            self.assertTrue(all(pages), params)
+
+    def test_cursor_survives_writes_before_it(self):
+        entities = [StubEntity(name=name) for name in ["a", "b", "c", "d"]]
+        self.repo.bulk_insert(entities)
+        cursor = self.repo.search(SearchParams(sort="name", per_page=2)).next_cursor
+        self.repo.delete(entities[1].id)
+        self.repo.insert(StubEntity(name="a0"))
+        result = self.repo.search(SearchParams(sort="name", per_page=2, cursor=cursor))
+        self.assertEqual(result.items, entities[2:])
+        self.assertIsNone(result.next_cursor)
+
+    def test_unsorted_search_has_no_cursor(self):
+        self.repo.bulk_insert([StubEntity(name="a"), StubEntity(name="b")])
+        self.assertIsNone(self.repo.search(SearchParams(per_page=1)).next_cursor)
+
+    def test_indexes_follow_update_and_delete(self):
+        first, second = StubEntity(name="a"), StubEntity(name="b")
+        self.repo.bulk_insert([first, second])
+        # pylint: disable=protected-access
+        first._set("name", "c")
+        self.repo.update(first)
+        self.assertEqual([entity.name for entity in
+                          self.repo.search(SearchParams(sort="name")).items], ["b", "c"])
+        self.repo.delete(second.id)
+        self.assertEqual(self.repo.search(SearchParams(sort="name")).items, [first])
+        self.assertEqual(len(self.repo.indexes["name"]), 1)
+        self.assertEqual(len(self.repo.indexes["price"]), 1)
+
+    def test_insert_replaces_an_existing_entity(self):
+        entity = StubEntity(name="a")
+        self.repo.insert(entity)
+        self.repo.insert(StubEntity(unique_entity_id=entity.unique_entity_id, name="b"))
+        self.repo.bulk_insert([StubEntity(unique_entity_id=entity.unique_entity_id, name="c")])
+        self.assertEqual(len(self.repo.indexes["name"]), 1)
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "c")
+
+
+class TestAsyncInMemoryRepository(unittest.IsolatedAsyncioTestCase):
+    repo: StubAsyncInMemoryRepository
+
+    def setUp(self):
+        self.repo = StubAsyncInMemoryRepository()
+
+    async def test_entities_are_copied_in_and_out(self):
+        entity = StubEntity(name="some name", price=5)
+        await self.repo.insert(entity)
+        entity._set("name", "changed")  # pylint: disable=protected-access
+        found = await self.repo.find_by_id(entity.id)
+        self.assertEqual(found.name, "some name")
+        self.assertIsNot(found, await self.repo.find_by_id(entity.id))
+
+        found._set("name", "updated")  # pylint: disable=protected-access
+        await self.repo.update(found)
+        result = await self.repo.search(SearchParams(sort="name"))
+        self.assertEqual([item.name for item in result.items], ["updated"])
+        self.assertEqual(result.total, 1)
+
+    async def test_throw_not_found_exception(self):
+        with self.assertRaises(NotFoundException):
+            await self.repo.find_by_id("fake id")
+        with self.assertRaises(NotFoundException):
+            await self.repo.delete("fake id")
+
+    async def test_lock_serializes_holders_and_is_released(self):
+        entity = StubEntity(name="some name")
+        await self.repo.insert(entity)
+        events = []
+
+        async def hold(label):
+            async with self.repo.lock(entity.id):
+                events.append(f"{label} in")
+                await asyncio.sleep(0)
+                events.append(f"{label} out")
+
+        await asyncio.gather(hold("a"), hold("b"), hold("c"))
+        self.assertEqual(events, ["a in", "a out", "b in", "b out", "c in", "c out"])
+        self.assertEqual(self.repo._locks, {})  # pylint: disable=protected-access
+
+    async def test_locks_of_different_entities_do_not_block_each_other(self):
+        async with self.repo.lock("first"):
+            async with self.repo.lock(UniqueEntityId()):
+                self.assertEqual(len(self.repo._locks), 2)  # pylint: disable=protected-access
@@ -0,0 +1,101 @@
+import unittest
+from __seedwork.domain.search import TextIndex, TextSearchResult, tokenize
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize(None), [])
+        self.assertEqual(tokenize(""), [])
+        self.assertEqual(tokenize("Sci-Fi & Ｍovies, 2022!"), ["sci", "fi", "movies", "2022"])
+        self.assertEqual(tokenize("STRASSE Straße"), ["strasse", "strasse"])
+
+
+class TestTextIndex(unittest.TestCase):
+    index: TextIndex
+
+    def setUp(self):
+        self.index = TextIndex(weights=(2, 1))
+        self.index.update([
+            ("1", ("Action movies", "explosions and chases")),
+            ("2", ("Documentary", "real action footage")),
+            ("3", ("Drama", "actors acting")),
+            ("4", ("Action drama", None)),
+        ])
+
+    def test_weights_are_validated(self):
+        for weights in [(), tuple(range(9))]:
+            with self.assertRaises(ValueError):
+                TextIndex(weights=weights)
+
+    def test_empty_query(self):
+        self.assertEqual(self.index.search(" ,. "), TextSearchResult(ids=[], total=0))
+
+    def test_ranks_whole_words_and_fields(self):
+        # whole word in the name, in the description, then prefixes of "acting" / "actors"
+        self.assertEqual(self.index.search("action"),
+                         TextSearchResult(ids=["1", "4", "2"], total=3))
+        self.assertEqual(self.index.search("act"),
+                         TextSearchResult(ids=["1", "4", "2", "3"], total=4))
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.index.search("action dra").ids, ["4"])
+        self.assertEqual(self.index.search("DRAMA Action").ids, ["4"])
+        self.assertEqual(self.index.search("action comedy"), TextSearchResult(ids=[], total=0))
+
+    def test_min_prefix_and_max_expansions(self):
+        self.assertEqual(self.index.search("a").ids, [])
+        self.assertEqual(self.index.search("an").ids, ["1"])
+
+        index = TextIndex(weights=(1,), max_expansions=2)
+        index.update((str(i), (word,)) for i, word in enumerate(["aa", "ab", "ac", "a"]))
+        self.assertEqual(index.search("a").ids, ["3"])
+        # "a" itself plus a single completion
+        index.min_prefix = 1
+        self.assertEqual(index.search("a"), TextSearchResult(ids=["3", "0"], total=2))
+
+    def test_pagination(self):
+        index = TextIndex(weights=(1,))
+        index.update((str(i), (f"movie {i}",)) for i in range(7))
+        self.assertEqual(index.search("movie", page=2, per_page=3),
+                         TextSearchResult(ids=["3", "4", "5"], total=7))
+        self.assertEqual(index.search("movie", page=3, per_page=3),
+                         TextSearchResult(ids=["6"], total=7))
+        self.assertEqual(index.search("movie", page=4, per_page=3).ids, [])
+
+    def test_add_replaces_previous_texts(self):
+        self.index.add("4", ("Comedy", "funny"))
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.search("action").ids, ["1", "2"])
+        self.assertEqual(self.index.search("com").ids, ["4"])
+
+    def test_remove(self):
+        self.index.remove("1")
+        self.index.remove("unknown")
+        self.assertNotIn("1", self.index)
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.search("action").ids, ["4", "2"])
+        self.assertEqual(self.index.search("explosions").total, 0)
+
+    def test_compact(self):
+        self.index.remove("1")
+        self.index.add("2", ("Documentary", "war footage"))
+        expected = {query: self.index.search(query) for query in ["act", "doc", "war", "chases"]}
+        self.index.compact()
+        # pylint: disable=protected-access
+        self.assertEqual(self.index._ids, ["3", "4", "2"])
+        self.assertNotIn("chases", self.index._postings)
+        self.assertEqual({query: self.index.search(query) for query in expected}, expected)
+
+    def test_compacts_once_dead_documents_dominate(self):
+        index = TextIndex(weights=(1,))
+        index.update((str(i), (f"movie {i}",)) for i in range(1100))
+        for _ in range(2):
+            for i in range(1100):
+                index.add(str(i), ("series",))
+        # pylint: disable=protected-access
+        self.assertLess(len(index._ids), 3300)
+        self.assertLess(len(index._deleted), 1100)
+        self.assertEqual(index.search("movie").total, 0)
+        self.assertEqual(index.search("ser").total, 1100)
+        self.assertEqual(index.search("ser", per_page=2).ids, ["0", "1"])
@@ -0,0 +1,74 @@
+import json
+import unittest
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.serializers import serializer_for, to_dict, to_dicts, to_json, to_json_many
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    description: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubMutableFieldEntity(Entity):
+    tags: List[str]
+    owner: Optional[UniqueEntityId] = None
+
+
+def asdict_to_dict(entity: Entity):
+    entity_dict = {key: value for key, value in asdict(entity).items() if not key.startswith("_")}
+    entity_dict.pop("unique_entity_id")
+    entity_dict["id"] = entity.id
+    return entity_dict
+
+
+class TestSerializers(unittest.TestCase):
+
+    def test_serializer_is_built_once_per_class(self):
+        self.assertIs(serializer_for(StubEntity), serializer_for(StubEntity))
+        self.assertIsNot(serializer_for(StubEntity), serializer_for(StubMutableFieldEntity))
+
+    def test_to_dict_matches_asdict(self):
+        entities = [
+            StubEntity(name="test"),
+            StubEntity(name="test", description="description"),
+            StubMutableFieldEntity(tags=["a", "b"]),
+            StubMutableFieldEntity(tags=[], owner=UniqueEntityId()),
+        ]
+        for entity in entities:
+            expected = asdict_to_dict(entity)
+            self.assertEqual(to_dict(entity), expected)
+            self.assertEqual(list(to_dict(entity)), list(expected))
+            self.assertEqual(entity.to_dict(), expected)
+
+    def test_to_dict_copies_mutable_fields(self):
+        entity = StubMutableFieldEntity(tags=["a"])
+        entity_dict = entity.to_dict()
+        entity_dict["tags"].append("b")
+        self.assertEqual(entity.tags, ["a"])
+
+    def test_to_dicts(self):
+        entities = [StubEntity(name="a"), StubMutableFieldEntity(tags=["a"]), StubEntity(name="b")]
+        self.assertEqual(to_dicts(entities), [asdict_to_dict(entity) for entity in entities])
+        self.assertEqual(to_dicts(iter([])), [])
+
+    def test_to_json(self):
+        created_at = datetime(2023, 5, 1, 10, 30, 15, 123)
+        entity = StubEntity(unique_entity_id=UniqueEntityId("9f2ec4aa-010b-4282-addb-6d738cc27676"),
+                            name="test",
+                            created_at=created_at)
+        expected = {
+            "name": "test",
+            "description": None,
+            "created_at": "2023-05-01T10:30:15.000123",
+            "id": "9f2ec4aa-010b-4282-addb-6d738cc27676",
+        }
+        self.assertIsInstance(to_json(entity), bytes)
+        self.assertEqual(json.loads(to_json(entity)), expected)
+        self.assertEqual(json.loads(to_json_many([entity, entity])), [expected, expected])
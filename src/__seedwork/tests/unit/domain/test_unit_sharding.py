@@ -0,0 +1,190 @@
+import threading
+import unittest
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.repositories import InMemorySearchableRepository, SearchParams
+from __seedwork.domain.sharding import HashRing, ShardedRepository, ShardedSearchableRepository
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+
+@dataclass(slots=True)
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sortable_fields = ["name", "price"]
+    default_sort = "name"
+
+    def _apply_filter(self, filter_param: Optional[str]) -> Optional[List[str]]:
+        if filter_param is None:
+            return None
+        return [entity.id for entity in self.items.values() if filter_param in entity.name]
+
+
+def make_sharded(count: int) -> ShardedSearchableRepository:
+    return ShardedSearchableRepository(
+        {f"shard-{i}": StubInMemorySearchableRepository() for i in range(count)})
+
+
+class TestHashRing(unittest.TestCase):
+
+    def test_spreads_keys_and_moves_few_when_a_shard_is_added(self):
+        ring = HashRing()
+        for name in ["a", "b", "c", "d"]:
+            ring.add(name)
+        self.assertEqual(len(ring), 4)
+        self.assertIn("a", ring)
+        keys = [f"key {i}" for i in range(4000)]
+        before = {key: ring.shard_for(key) for key in keys}
+        for count in Counter(before.values()).values():
+            self.assertGreater(count, 500)
+
+        bigger = ring.copy()
+        bigger.add("e")
+        self.assertEqual(len(ring), 4)
+        moved = [key for key in keys if bigger.shard_for(key) != before[key]]
+        self.assertTrue(all(bigger.shard_for(key) == "e" for key in moved))
+        self.assertLess(len(moved), len(keys) / 3)
+
+    def test_invalid_use(self):
+        ring = HashRing()
+        with self.assertRaises(LookupError):
+            ring.shard_for("key")
+        ring.add("a")
+        with self.assertRaises(ValueError):
+            ring.add("a")
+
+
+class TestShardedRepository(unittest.TestCase):
+    repo: ShardedSearchableRepository
+
+    def setUp(self):
+        self.repo = make_sharded(3)
+
+    def test_needs_a_shard(self):
+        with self.assertRaises(ValueError):
+            ShardedRepository({})
+
+    def test_routes_entities_by_id(self):
+        entities = [StubEntity(name=f"entity {i}") for i in range(30)]
+        self.repo.insert(entities[0])
+        self.repo.bulk_insert(entities[1:])
+        for entity in entities:
+            shard = self.repo.shards[self.repo.shard_for(entity.id)]
+            self.assertIs(shard.find_by_id(entity.id), entity)
+            self.assertIs(self.repo.find_by_id(entity.unique_entity_id), entity)
+        self.assertTrue(all(shard.items for shard in self.repo.shards.values()))
+        self.assertCountEqual(self.repo.find_all(), entities)
+
+        renamed = StubEntity(unique_entity_id=entities[0].unique_entity_id, name="renamed")
+        self.repo.update(renamed)
+        self.assertEqual(self.repo.find_by_id(renamed.id).name, "renamed")
+        self.repo.delete(renamed.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(renamed.id)
+
+    def test_batches_are_split_per_shard(self):
+        entities = [StubEntity(name=f"entity {i}") for i in range(30)]
+        self.repo.bulk_insert(entities)
+        self.repo.patch_many({entity.id: {"price": 1.0} for entity in entities[:10]})
+        self.assertEqual([entity.price for entity in self.repo.find_all()].count(1.0), 10)
+        self.repo.bulk_delete(entity.id for entity in entities[:20])
+        self.assertCountEqual(self.repo.find_all(), entities[20:])
+
+        saved = entities[20:]
+        self.repo.compare_and_set_many([(entity, 0) for entity in saved])
+        with self.assertRaises(ConflictException):
+            self.repo.compare_and_set(saved[0], 1)
+
+    def test_search_equals_a_single_repository(self):
+        single = StubInMemorySearchableRepository()
+        entities = [StubEntity(name=f"entity {i % 7}", price=None if i % 5 == 0 else i % 4)
+                    for i in range(40)]
+        single.bulk_insert(entities)
+        self.repo.bulk_insert(entities)
+        for sort in ["name", "price", "unknown"]:
+            for sort_dir in ["asc", "desc"]:
+                for params in [SearchParams(page=page, per_page=6, sort=sort, sort_dir=sort_dir,
+                                            filter=search_filter)
+                               for page in [1, 3, 7, 8] for search_filter in [None, "4"]]:
+                    self.assertEqual(self.repo.search(params), single.search(params))
+
+    def test_search_by_cursor(self):
+        single = StubInMemorySearchableRepository()
+        entities = [StubEntity(name=f"entity {i:02}", price=i % 3) for i in range(25)]
+        single.bulk_insert(entities)
+        self.repo.bulk_insert(entities)
+        for sort_dir in ["asc", "desc"]:
+            params = SearchParams(per_page=4, sort="price", sort_dir=sort_dir)
+            seen = []
+            while True:
+                result = self.repo.search(params)
+                self.assertEqual(result, single.search(params))
+                seen += result.items
+                if result.next_cursor is None:
+                    break
+                params = SearchParams(per_page=4, sort="price", sort_dir=sort_dir,
+                                      cursor=result.next_cursor)
+            self.assertCountEqual(seen, entities)
+
+    def test_search_locks_one_shard_at_a_time(self):
+        self.repo.bulk_insert([StubEntity(name=f"entity {i}") for i in range(30)])
+        held = []
+        locks = self.repo._locks  # pylint: disable=protected-access
+        for shard in self.repo.shards.values():
+            search = shard.search
+
+            def locked_search(params, search=search):
+                held.append(sorted(name for name, lock in locks.items() if lock.locked()))
+                return search(params)
+            object.__setattr__(shard, "search", locked_search)
+        self.assertEqual(self.repo.search(SearchParams(per_page=5)).total, 30)
+        self.assertEqual(held, [["shard-0"], ["shard-1"], ["shard-2"]])
+
+    def test_add_shard_moves_entities_to_it(self):
+        entities = [StubEntity(name=f"entity {i}") for i in range(200)]
+        self.repo.bulk_insert(entities)
+        before = {entity.id: self.repo.shard_for(entity.id) for entity in entities}
+        new_shard = StubInMemorySearchableRepository()
+        moved = self.repo.add_shard("shard-3", new_shard)
+
+        self.assertEqual(len(new_shard.items), moved)
+        self.assertGreater(moved, 0)
+        for entity in entities:
+            owner = self.repo.shard_for(entity.id)
+            self.assertIn(owner, [before[entity.id], "shard-3"])
+            self.assertIs(self.repo.shards[owner].find_by_id(entity.id), entity)
+        self.assertEqual(sum(len(shard.items) for shard in self.repo.shards.values()), 200)
+        with self.assertRaises(ValueError):
+            self.repo.add_shard("shard-3", StubInMemorySearchableRepository())
+
+    def test_add_shard_while_serving(self):
+        entities = [StubEntity(name=f"entity {i}") for i in range(300)]
+        self.repo.bulk_insert(entities)
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                try:
+                    for entity in entities[::10]:
+                        self.repo.find_by_id(entity.id)
+                    self.assertEqual(self.repo.search(SearchParams(per_page=5)).total, 300)
+                except Exception as exc:  # pylint: disable=broad-except
+                    errors.append(exc)
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        for thread in readers:
+            thread.start()
+        for number in range(3, 6):
+            self.repo.add_shard(f"shard-{number}", StubInMemorySearchableRepository())
+        stop.set()
+        for thread in readers:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertCountEqual(self.repo.find_all(), entities)
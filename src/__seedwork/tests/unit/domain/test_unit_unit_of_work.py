@@ -0,0 +1,134 @@
+import unittest
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import patch
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.repositories import InMemorySearchableRepository, SearchParams
+from __seedwork.domain.unit_of_work import PendingChanges, UnitOfWork
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StubEntity(Entity):
+    name: str
+    price: Optional[float] = None
+
+
+@dataclass(slots=True)
+class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity, str]):
+    sortable_fields = ["name"]
+
+
+# pylint: disable=protected-access
+class TestUnitOfWork(unittest.TestCase):
+    repo: StubInMemorySearchableRepository
+    uow: UnitOfWork[StubEntity]
+
+    def setUp(self):
+        self.repo = StubInMemorySearchableRepository()
+        self.entities = [StubEntity(name=f"name {i}", price=i) for i in range(3)]
+        self.repo.bulk_insert(self.entities)
+        self.uow = UnitOfWork(self.repo)
+
+    def test_get_tracks_one_instance(self):
+        entity = self.uow.get(self.entities[0].id)
+        self.assertIs(self.uow.get(self.entities[0].unique_entity_id), entity)
+        with self.assertRaises(NotFoundException):
+            self.uow.get("fake id")
+
+    def test_only_changed_fields_are_written(self):
+        first, second, third = (self.uow.get(entity.id) for entity in self.entities)
+        first._set("name", "changed")
+        second._set("price", 1)  # same value, not a change
+        third._set("name", "other")._set("price", 7.5)
+        self.assertEqual(self.uow.pending(), PendingChanges(
+            new=[], patches={first.id: {"name": "changed", "version": 0},
+                             third.id: {"name": "other", "price": 7.5, "version": 0}},
+            deleted=[]))
+
+        with patch.object(self.repo, "update", wraps=self.repo.update) as update:
+            self.uow.commit()
+            self.assertEqual(update.call_count, 2)
+        self.assertEqual(self.repo.find_by_id(third.id).price, 7.5)
+        # the sort index follows the patched names
+        self.assertEqual(self.repo.search(SearchParams(sort="name")).items[-1], third)
+        self.assertFalse(self.uow.pending())
+        self.assertIsNone(self.uow.commit())
+
+    def test_batches_by_operation(self):
+        new_entity = StubEntity(name="new")
+        calls = []
+        for method in ["bulk_insert", "patch_many", "bulk_delete"]:
+            patcher = patch.object(
+                self.repo, method,
+                side_effect=lambda *args, method=method: calls.append((method, *args)))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        with self.uow as uow:
+            uow.add(new_entity)
+            uow.get(self.entities[0].id)._set("name", "changed")
+            uow.remove(self.entities[1].id)
+            discarded = StubEntity(name="discarded")
+            uow.add(discarded)
+            uow.remove(discarded.id)
+
+        self.assertEqual(calls, [
+            ("bulk_insert", [new_entity]),
+            ("patch_many", {self.entities[0].id: {"name": "changed", "version": 0}}),
+            ("bulk_delete", [self.entities[1].id]),
+        ])
+
+    def test_new_entities_are_tracked_after_commit(self):
+        entity = StubEntity(name="new")
+        self.uow.add(entity)
+        self.uow.commit()
+        self.assertIs(self.repo.find_by_id(entity.id), entity)
+        entity._set("price", 3)
+        self.assertEqual(self.uow.commit().patches, {entity.id: {"price": 3, "version": 0}})
+
+    def test_commit_advances_the_stored_version(self):
+        stale = StubEntity(unique_entity_id=self.entities[0].unique_entity_id, name="stale")
+        entity = self.uow.get(self.entities[0].id)
+        entity._set("name", "committed")._bump_version()
+        self.uow.commit()
+        with self.assertRaises(ConflictException):
+            self.repo.compare_and_set(stale, 0)
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "committed")
+
+    def test_failed_commit_keeps_changes_pending(self):
+        entity = self.uow.get(self.entities[0].id)
+        entity._set("name", "changed")
+        self.uow.remove(self.entities[1].id)
+        self.repo.delete(self.entities[1].id)
+        with self.assertRaises(NotFoundException):
+            self.uow.commit()
+        # the patch landed and in-memory writes do not roll back, so only the delete is pending
+        self.assertEqual(self.repo.find_by_id(entity.id).name, "changed")
+        self.assertEqual(self.uow.pending(), PendingChanges(
+            new=[], patches={}, deleted=[self.entities[1].id]))
+
+    def test_get_skips_removed_entities(self):
+        entity = self.uow.get(self.entities[0].id)
+        self.uow.remove(entity.id)
+        self.assertIsNone(self.uow.get(entity.id))
+        self.uow.remove(self.entities[1].unique_entity_id)
+        self.assertIsNone(self.uow.get(self.entities[1].id))
+        self.assertEqual(self.uow.pending().deleted, [entity.id, self.entities[1].id])
+        self.uow.add(entity)
+        self.assertIs(self.uow.get(entity.id), entity)
+
+    def test_context_manager_skips_commit_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.uow as uow:
+                uow.get(self.entities[0].id)._set("name", "changed")
+                raise RuntimeError()
+        self.assertTrue(self.uow.pending())
+        self.uow.rollback()
+        self.assertFalse(self.uow.pending())
+
+    def test_attach_ignores_earlier_changes(self):
+        entity = StubEntity(name="name")
+        entity._set("name", "changed")
+        self.uow.attach(entity)
+        self.assertFalse(self.uow.pending())
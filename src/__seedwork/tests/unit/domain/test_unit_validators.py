@@ -1,8 +1,18 @@
 from dataclasses import fields
 import unittest
+from unittest.mock import PropertyMock, patch
+from rest_framework.serializers import Serializer
 from __seedwork.domain.exceptions import ValidationException
 
-from __seedwork.domain.validators import ValidatorFieldsInterface, ValidatorRules
+from __seedwork.domain.validators import (
+    DRFValidator,
+    RuleError,
+    RulesValidator,
+    ValidatorFieldsInterface,
+    ValidatorRules,
+    compile_rules,
+    error_fields
+)
 
 
 class TestValidatorRules(unittest.TestCase):
@@ -125,6 +135,12 @@ class TestValidatorRules(unittest.TestCase):
         self.assertEqual("The field prop must be a boolean.",
                          assert_error.exception.args[0])
 
+    def test_exception_carries_the_rule_error(self):
+        with self.assertRaises(ValidationException) as assert_error:
+            ValidatorRules.values("a" * 6, "prop").max_length(5)
+        self.assertEqual(assert_error.exception.error, RuleError("prop", "max_length", (5,)))
+        self.assertEqual(str(assert_error.exception), "The field prop cannot exceed 5 characters.")
+
     def test_valid_combinations_between_rules(self):
         ValidatorRules("test", "prop").required().string()
         ValidatorRules("t" * 5, "prop").required().string().max_length(5)
@@ -134,6 +150,107 @@ class TestValidatorRules(unittest.TestCase):
         # pylint: disable=redundant-unittest-assert
         self.assertTrue(True)
 
+
+class TestCompiledRules(unittest.TestCase):
+    schema = {"name": "required|string|max_length:5", "description": "string",
+              "is_active": "required|boolean"}
+    values = [None, "", "test", "t" * 5, "t" * 6, 5, 0, True, False, 5.0, {}]
+
+    def chain(self, name, description, is_active):
+        ValidatorRules.values(name, "name").required().string().max_length(5)
+        ValidatorRules.values(description, "description").string()
+        ValidatorRules.values(is_active, "is_active").required().boolean()
+
+    def test_fail_fast_matches_validator_rules_chain(self):
+        rules = compile_rules(self.schema)
+        for name in self.values:
+            for description in self.values:
+                for is_active in self.values:
+                    args = (name, description, is_active)
+                    try:
+                        self.chain(*args)
+                        expected = None
+                    except ValidationException as exc:
+                        expected = exc.args[0]
+                    as_dict = dict(zip(self.schema, args))
+                    for check in (rules.check(*args), rules.check_dict(as_dict)):
+                        self.assertEqual(check and check.message, expected, args)
+                    for validate in (
+                        lambda args=args: rules.validate(*args),
+                        lambda kwargs=as_dict: rules.validate(**kwargs),
+                        lambda as_dict=as_dict: rules.validate_dict(dict(as_dict)),
+                    ):
+                        if expected is None:
+                            self.assertIsNone(validate(), args)
+                        else:
+                            with self.assertRaises(ValidationException, msg=args) as assert_error:
+                                validate()
+                            self.assertEqual(assert_error.exception.args[0], expected)
+
+    def test_collect_returns_first_error_of_every_field(self):
+        rules = compile_rules(self.schema)
+        expected = {
+            "name": ["The field name cannot exceed 5 characters."],
+            "description": ["The field description must be a string."],
+            "is_active": ["The field is_active is required."],
+        }
+        self.assertEqual(rules.collect("t" * 6, 5), expected)
+        self.assertEqual(rules.collect_dict({"name": "t" * 6, "description": 5}), expected)
+        self.assertEqual(rules.collect(name=None, is_active="a"), {
+            "name": ["The field name is required."],
+            "is_active": ["The field is_active must be a boolean."],
+        })
+        self.assertEqual(rules.collect("test", None, True), {})
+        self.assertEqual(rules.collect_dict({"name": "test", "is_active": False}), {})
+
+    def test_check_all_matches_collect(self):
+        rules = compile_rules(self.schema)
+        for name in self.values:
+            for is_active in self.values:
+                errors = rules.check_all(name, 5, is_active)
+                self.assertEqual(error_fields(errors), rules.collect(name, 5, is_active))
+                self.assertEqual(rules.check_all_dict({"name": name, "is_active": is_active}),
+                                 [error for error in errors if error.field != "description"])
+
+    def test_rule_errors_are_shared_and_rendered_on_demand(self):
+        rules = compile_rules(self.schema)
+        error = rules.check("t" * 6, None, True)
+        self.assertIs(rules.check("t" * 7, None, True), error)
+        self.assertIs(rules.check_all("t" * 8)[0], error)
+        self.assertEqual(error, RuleError("name", "max_length", (5,)))
+        self.assertEqual(error.message, "The field name cannot exceed 5 characters.")
+        self.assertEqual(str(RuleError("is_active", "boolean")),
+                         "The field is_active must be a boolean.")
+        with self.assertRaises(ValidationException) as assert_error:
+            rules.validate("t" * 6, None, True)
+        self.assertIs(assert_error.exception.error, error)
+        self.assertIsNone(rules.check("test", None, True))
+        self.assertEqual(rules.check_all("test", None, True), [])
+
+    def test_error_fields(self):
+        self.assertEqual(error_fields([
+            RuleError("name", "required"), RuleError("is_active", "boolean"),
+            RuleError("name", "max_length", (5,)),
+        ]), {
+            "name": ["The field name is required.", "The field name cannot exceed 5 characters."],
+            "is_active": ["The field is_active must be a boolean."],
+        })
+        self.assertEqual(error_fields([]), {})
+
+    def test_invalid_schema(self):
+        with self.assertRaises(ValueError) as assert_error:
+            compile_rules({"name": "required|fake"})
+        self.assertEqual(assert_error.exception.args[0], "Unknown validation rule 'fake'")
+
+        for prop in ("not valid", "class", "_private"):
+            with self.assertRaises(ValueError) as assert_error:
+                compile_rules({prop: "required"})
+            self.assertEqual(assert_error.exception.args[0], f"Invalid field name '{prop}'")
+
+        with self.assertRaises(ValueError):
+            compile_rules({"name": "max_length:fake"})
+
+
 class TestValidatorFieldsInterface(unittest.TestCase):
 
     def test_throw_error_when_validate_method_not_implemented(self):
@@ -157,3 +274,51 @@ class TestValidatorFieldsInterface(unittest.TestCase):
         errors_field = fields_class[arg1]
         self.assertEqual(errors_field.name, arg2)
         self.assertIsNone(errors_field.default)
+
+
+class TestDRFValidator(unittest.TestCase):
+
+    @patch.object(Serializer, "is_valid", return_value=True)
+    @patch.object(Serializer, "validated_data", return_value={"field": "value"},
+                  new_callable=PropertyMock)
+    def test_if_validated_data_is_set(self, mock_validated_data: PropertyMock,
+                                      mock_is_valid):
+        validator = DRFValidator()
+        is_valid = validator.validate(Serializer())
+        self.assertTrue(is_valid)
+        self.assertEqual(validator.validated_data, {"field": "value"})
+        self.assertIsNone(validator.errors)
+        mock_validated_data.assert_called()
+        mock_is_valid.assert_called()
+
+    @patch.object(Serializer, "is_valid", return_value=False)
+    @patch.object(Serializer, "errors", return_value={"field": ["some error"]},
+                  new_callable=PropertyMock)
+    def test_if_errors_is_set(self, mock_errors: PropertyMock, mock_is_valid):
+        validator = DRFValidator()
+        is_valid = validator.validate(Serializer())
+        self.assertFalse(is_valid)
+        self.assertEqual(validator.errors, {"field": ["some error"]})
+        self.assertIsNone(validator.validated_data)
+        mock_errors.assert_called()
+        mock_is_valid.assert_called()
+
+
+class TestRulesValidator(unittest.TestCase):
+
+    def test_validate(self):
+        validator = RulesValidator(rules=compile_rules({"name": "required|string",
+                                                        "is_active": "boolean"}))
+        self.assertFalse(validator.validate({"is_active": 5}))
+        self.assertEqual(validator.errors, {
+            "name": ["The field name is required."],
+            "is_active": ["The field is_active must be a boolean."],
+        })
+        self.assertIsNone(validator.validated_data)
+
+        self.assertTrue(validator.validate({"name": "test", "other": 1}))
+        self.assertEqual(validator.validated_data, {"name": "test"})
+        self.assertIsNone(validator.errors)
+
+        self.assertFalse(validator.validate(None))
+        self.assertEqual(validator.errors, {"name": ["The field name is required."]})
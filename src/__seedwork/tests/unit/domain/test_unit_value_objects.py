@@ -1,7 +1,8 @@
 # pylint: disable=protected-access
+import pickle
 import unittest
 import uuid
-from dataclasses import dataclass, is_dataclass, FrozenInstanceError
+from dataclasses import dataclass, field, is_dataclass, FrozenInstanceError
 from unittest.mock import patch
 from abc import ABC
 from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
@@ -19,6 +20,12 @@ class StubTwoProp(ValueObject):
     prop2: str
 
 
+@dataclass(frozen=True)
+class StubInternalProp(ValueObject):
+    prop: str
+    _cache: str = field(default="cache", init=False)
+
+
 class TestValueObject(unittest.TestCase):
     def test_if_is_a_dataclass(self):
         self.assertTrue(is_dataclass(ValueObject))
@@ -41,6 +48,9 @@ class TestValueObject(unittest.TestCase):
         vo2 = StubTwoProp(prop1="value1", prop2="value2")
         self.assertEqual('{"prop1": "value1", "prop2": "value2"}', str(vo2))
 
+        vo3 = StubInternalProp(prop="value")
+        self.assertEqual("value", str(vo3))
+
     def test_is_immutable(self):
         with self.assertRaises(FrozenInstanceError):
             vo1 = StubOneProp(prop="value")
@@ -96,3 +106,69 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
         with self.assertRaises(FrozenInstanceError):
             value_object = UniqueEntityId()
             value_object.id = "test"
+
+    def test_generate_many(self):
+        ids = UniqueEntityId.generate_many(100)
+        self.assertEqual(len(ids), 100)
+        self.assertEqual(len({unique_entity_id.id for unique_entity_id in ids}), 100)
+        for unique_entity_id in ids:
+            self.assertIsInstance(unique_entity_id, UniqueEntityId)
+            parsed = uuid.UUID(unique_entity_id.id)
+            self.assertEqual(str(parsed), unique_entity_id.id)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+        self.assertEqual(UniqueEntityId.generate_many(0), [])
+
+    def test_generate_many_time_ordered(self):
+        ids = UniqueEntityId.generate_many(5000, time_ordered=True)
+        ids += UniqueEntityId.generate_many(10, time_ordered=True)
+        self.assertEqual([unique_entity_id.id for unique_entity_id in ids],
+                         sorted(unique_entity_id.id for unique_entity_id in ids))
+        self.assertEqual(len({unique_entity_id.id for unique_entity_id in ids}), len(ids))
+        for unique_entity_id in ids:
+            parsed = uuid.UUID(unique_entity_id.id)
+            self.assertEqual(parsed.version, 7)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_trusted_skips_validation(self):
+        with patch.object(
+            UniqueEntityId,
+            "_UniqueEntityId__validate",
+            autospec=True,
+        ) as mock_validate:
+            value_object = UniqueEntityId.trusted("9f2ec4aa-010b-4282-addb-6d738cc27676")
+            mock_validate.assert_not_called()
+        self.assertEqual(value_object, UniqueEntityId("9f2ec4aa-010b-4282-addb-6d738cc27676"))
+        self.assertEqual(str(value_object), "9f2ec4aa-010b-4282-addb-6d738cc27676")
+
+    def test_from_bytes(self):
+        uuid_value = uuid.uuid4()
+        value_object = UniqueEntityId.from_bytes(uuid_value.bytes)
+        self.assertEqual(value_object.to_bytes(), uuid_value.bytes)
+        self.assertEqual(value_object.id, str(uuid_value))
+        self.assertIs(value_object.id, value_object.id)
+        self.assertEqual(value_object, UniqueEntityId(uuid_value))
+        self.assertEqual(hash(value_object), hash(UniqueEntityId(uuid_value)))
+        self.assertEqual(repr(value_object), f"UniqueEntityId(id='{uuid_value}')")
+
+        for invalid in (b"", b"1" * 15, b"1" * 17, str(uuid_value), bytearray(16)):
+            with self.assertRaises(InvalidUuidException):
+                UniqueEntityId.from_bytes(invalid)
+
+    def test_to_bytes(self):
+        uuid_value = uuid.uuid4()
+        self.assertEqual(UniqueEntityId(uuid_value).to_bytes(), uuid_value.bytes)
+
+    def test_generate(self):
+        value_object = UniqueEntityId.generate()
+        parsed = uuid.UUID(value_object.id)
+        self.assertEqual(parsed.version, 4)
+        self.assertEqual(parsed.bytes, value_object.to_bytes())
+        self.assertNotEqual(value_object, UniqueEntityId.generate())
+
+    def test_compact_id_survives_pickle(self):
+        value_object = UniqueEntityId.generate()
+        self.assertEqual(pickle.loads(pickle.dumps(value_object)), value_object)
+        with self.assertRaises(AttributeError):
+            value_object.fake  # pylint: disable=pointless-statement
@@ -0,0 +1,100 @@
+import copy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from __seedwork.domain.events import EventDispatcher
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.repositories import SearchParams
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+
+
+@dataclass(frozen=True, slots=True)
+class BulkCommandResult:
+    affected: int
+    unchanged: int
+    errors: Dict[str, str]
+
+
+@dataclass(slots=True, frozen=True)
+class BulkCategoryCommands:
+    """Changes many categories with one load and one compare-and-set write.
+
+    Categories are changed with `Category.bulk_update`, so each distinct
+    value is validated once and categories already in the requested state
+    are skipped. The changed ones are saved with a single
+    `compare_and_set_many`. If that batch conflicts with a concurrent write,
+    they are saved one at a time instead, and the conflicting ids are
+    reported in `errors`. With a repository whose batches are only atomic
+    per part, like a sharded one, ids saved by another part of the batch
+    are reported too. Events of the saved categories are queued on `events`
+    when it is given, like the use cases do.
+    Changes are made on copies of the loaded categories, so a repository
+    handing out the instances it stores only sees the ones it saved.
+    """
+    category_repo: CategoryRepository
+    events: Optional[EventDispatcher] = None
+    page_size: int = 10_000
+
+    def activate_where(self, search_filter: Optional[str] = None) -> BulkCommandResult:
+        """Activates the categories a search with this filter finds, all of them for None."""
+        return self._transition(search_filter, True)
+
+    def deactivate_where(self, search_filter: Optional[str] = None) -> BulkCommandResult:
+        return self._transition(search_filter, False)
+
+    def bulk_update(self, changes: Dict[str, Dict[str, Any]]) -> BulkCommandResult:
+        """Applies `{category id: {field: value}}`; unknown ids are reported in `errors`."""
+        changes = {str(entity_id): fields for entity_id, fields in changes.items()}
+        found = self.category_repo.find_many(changes)
+        errors = {entity_id: f"Entity not found using ID '{entity_id}'"
+                  for entity_id in changes if entity_id not in found}
+        return self._update(list(found.values()), changes, errors)
+
+    def _transition(self, search_filter: Optional[str], is_active: bool) -> BulkCommandResult:
+        matches = self._find_where(search_filter)
+        pending = [category for category in matches if category.is_active is not is_active]
+        changes = dict.fromkeys((category.id for category in pending), {"is_active": is_active})
+        return self._update(pending, changes, {}, len(matches) - len(pending))
+
+    def _find_where(self, search_filter: Optional[str]) -> List[Category]:
+        """Pages through the search by keyset on `created_at`, which no transition changes."""
+        matches: List[Category] = []
+        cursor = None
+        while True:
+            page = self.category_repo.search(SearchParams(
+                per_page=self.page_size, sort="created_at", sort_dir="asc",
+                filter=search_filter, cursor=cursor))
+            matches += page.items
+            cursor = page.next_cursor
+            if cursor is None:
+                return matches
+
+    def _update(self, categories: List[Category], changes: Dict[str, Dict[str, Any]],
+                errors: Dict[str, str], unchanged: int = 0) -> BulkCommandResult:
+        categories = [copy.copy(category) for category in categories]
+        versions = {category.id: category.version for category in categories}
+        result = Category.bulk_update(categories, changes)
+        errors.update(result.errors)
+        expected = [(category, versions[category.id]) for category in result.changed]
+        saved = result.changed
+        if expected:
+            try:
+                self.category_repo.compare_and_set_many(expected)
+            except (ConflictException, NotFoundException):
+                saved = self._save_each(expected, errors)
+        if self.events is not None:
+            self.events.collect(*saved)
+        return BulkCommandResult(affected=len(saved), unchanged=result.unchanged + unchanged,
+                                 errors=errors)
+
+    def _save_each(self, expected: List[Tuple[Category, int]],
+                   errors: Dict[str, str]) -> List[Category]:
+        saved = []
+        for category, version in expected:
+            try:
+                self.category_repo.compare_and_set(category, version)
+            except (ConflictException, NotFoundException) as exc:
+                errors[category.id] = exc.args[0]
+            else:
+                saved.append(category)
+        return saved
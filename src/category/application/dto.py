@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from category.domain.entities import Category
+
+
+@dataclass(slots=True, frozen=True)
+class CategoryOutput:
+    id: str  # pylint: disable=invalid-name
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_entity(cls, category: Category) -> 'CategoryOutput':
+        return cls(id=category.id, name=category.name, description=category.description,
+                   is_active=category.is_active, created_at=category.created_at)
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Optional
+from __seedwork.application.dto import PaginationOutput, SearchInput
+from __seedwork.application.use_cases import UseCase
+from __seedwork.domain.events import EventDispatcher
+from category.application.dto import CategoryOutput
+from category.domain.entities import Category
+from category.domain.events import CategoryDeleted
+from category.domain.repositories import CategoryAsyncRepository
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoryUseCase(UseCase['CreateCategoryUseCase.Input', CategoryOutput]):
+    """Writing use cases queue the recorded events on `events`, when given,
+    once the repository accepted the change; dispatching is up to its owner."""
+    category_repo: CategoryAsyncRepository
+    events: Optional[EventDispatcher] = None
+
+    async def execute(self, input_param: 'CreateCategoryUseCase.Input') -> CategoryOutput:
+        category = Category(name=input_param.name,
+                            description=input_param.description,
+                            is_active=input_param.is_active)
+        await self.category_repo.insert(category)
+        if self.events is not None:
+            self.events.collect(category)
+        return CategoryOutput.from_entity(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        name: str
+        description: Optional[str] = None
+        is_active: Optional[bool] = True
+
+
+@dataclass(slots=True, frozen=True)
+class GetCategoryUseCase(UseCase['GetCategoryUseCase.Input', CategoryOutput]):
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'GetCategoryUseCase.Input') -> CategoryOutput:
+        category = await self.category_repo.find_by_id(input_param.id)
+        return CategoryOutput.from_entity(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str  # pylint: disable=invalid-name
+
+
+@dataclass(slots=True, frozen=True)
+class ListCategoriesUseCase(UseCase[SearchInput[str], PaginationOutput[CategoryOutput]]):
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: SearchInput[str]) -> PaginationOutput[CategoryOutput]:
+        result = await self.category_repo.search(input_param.to_search_params())
+        return PaginationOutput.from_search_result(
+            result, [CategoryOutput.from_entity(category) for category in result.items])
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoryUseCase(UseCase['UpdateCategoryUseCase.Input', CategoryOutput]):
+    """Reads, changes and saves the category under its repository lock.
+
+    Concurrent updates of one category are applied one after the other, each
+    on top of the previous write, instead of racing from the same snapshot.
+    """
+    category_repo: CategoryAsyncRepository
+    events: Optional[EventDispatcher] = None
+
+    async def execute(self, input_param: 'UpdateCategoryUseCase.Input') -> CategoryOutput:
+        async with self.category_repo.lock(input_param.id):
+            category = await self.category_repo.find_by_id(input_param.id)
+            if input_param.name is not None:
+                category.update(input_param.name, input_param.description)
+            if input_param.is_active is True:
+                category.activate()
+            elif input_param.is_active is False:
+                category.deactivate()
+            await self.category_repo.update(category)
+            if self.events is not None:
+                self.events.collect(category)
+        return CategoryOutput.from_entity(category)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        """Leave `name` out to only change `is_active`; `description` goes with `name`."""
+        id: str  # pylint: disable=invalid-name
+        name: Optional[str] = None
+        description: Optional[str] = None
+        is_active: Optional[bool] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoryUseCase(UseCase['DeleteCategoryUseCase.Input', None]):
+    category_repo: CategoryAsyncRepository
+    events: Optional[EventDispatcher] = None
+
+    async def execute(self, input_param: 'DeleteCategoryUseCase.Input') -> None:
+        async with self.category_repo.lock(input_param.id):
+            await self.category_repo.delete(input_param.id)
+            if self.events is not None:
+                self.events.publish([CategoryDeleted(str(input_param.id))])
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str  # pylint: disable=invalid-name
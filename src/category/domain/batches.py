@@ -0,0 +1,239 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import accumulate, compress, repeat
+from typing import Dict, Iterable, Iterator, List, Optional
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIMESTAMP = -(2 ** 63)
+# rows rebuilt at a time while iterating
+_BLOCK = 4096
+
+# is_active column codes
+_FALSE, _TRUE, _NONE = 0, 1, 2
+_FLAG_CODES = {False: _FALSE, True: _TRUE, None: _NONE}
+_FLAG_VALUES = (False, True, None)
+# translation tables turning the column into a 0/1 mask for one code
+_FLAG_MASKS = {code: bytes(byte == code for byte in range(256)) for code in _FLAG_CODES.values()}
+
+
+@dataclass(slots=True)
+class _StringColumn:
+    """UTF-8 values packed end to end; value i is data[offsets[i]:offsets[i + 1]].
+
+    Offsets are 32 bits, so a single batch holds up to 4 GiB of text per column.
+    """
+    data: bytearray = field(default_factory=bytearray)
+    offsets: array = field(default_factory=lambda: array("I", [0]))
+    nulls: bytearray = field(default_factory=bytearray)
+
+    def append(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.data += value.encode()
+        self.offsets.append(len(self.data))
+        self.nulls.append(value is None)
+
+    def extend(self, values: List[Optional[str]]) -> None:
+        encoded = [b"" if value is None else value.encode() for value in values]
+        self.offsets.extend(accumulate(map(len, encoded), initial=len(self.data)))
+        # accumulate starts with the current end, which is already stored
+        del self.offsets[len(self.offsets) - len(encoded) - 1]
+        self.data += b"".join(encoded)
+        self.nulls += bytes(value is None for value in values)
+
+    def get(self, index: int) -> Optional[str]:
+        if self.nulls[index]:
+            return None
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode()
+
+    def values(self, start: int, stop: int) -> List[Optional[str]]:
+        """Values of rows [start, stop), decoding ASCII text in one go."""
+        offsets = self.offsets[start:stop + 1]
+        data = self.data[offsets[0]:offsets[-1]]
+        if data.isascii():
+            # byte offsets are character offsets
+            text, base = data.decode(), offsets[0]
+            values = [text[begin - base:end - base] for begin, end in zip(offsets, offsets[1:])]
+        else:
+            view, base = memoryview(data), offsets[0]
+            values = [str(view[begin - base:end - base], "utf-8")
+                      for begin, end in zip(offsets, offsets[1:])]
+        nulls = self.nulls[start:stop]
+        if nulls.count(1):
+            for index in compress(range(len(values)), nulls):
+                values[index] = None
+        return values
+
+    def select(self, indices: List[int]) -> '_StringColumn':
+        column = _StringColumn(nulls=bytearray(self.nulls[index] for index in indices))
+        data, offsets = self.data, self.offsets
+        for index in indices:
+            column.data += data[offsets[index]:offsets[index + 1]]
+            column.offsets.append(len(column.data))
+        return column
+
+
+@dataclass(slots=True)
+class _TimestampColumn:
+    """Naive datetimes as runs of equal values, in microseconds since the epoch.
+
+    Run i covers the rows from starts[i] up to the next run. Categories
+    created together share their timestamp, so a whole import usually takes
+    one run, and the rebuilt categories share one datetime per run too.
+    """
+    starts: array = field(default_factory=lambda: array("I"))
+    values: array = field(default_factory=lambda: array("q"))
+    size: int = 0
+
+    def append(self, value: Optional[datetime]) -> None:
+        _check_naive(value)
+        micros = _NO_TIMESTAMP if value is None else (value - _EPOCH) // _MICROSECOND
+        if not self.values or self.values[-1] != micros:
+            self.starts.append(self.size)
+            self.values.append(micros)
+        self.size += 1
+
+    def get(self, index: int) -> Optional[datetime]:
+        return _datetime(self.values[bisect_right(self.starts, index) - 1])
+
+    def values_between(self, start: int, stop: int) -> List[Optional[datetime]]:
+        starts = self.starts
+        run = bisect_right(starts, start) - 1
+        values: List[Optional[datetime]] = []
+        while start < stop:
+            end = min(starts[run + 1] if run + 1 < len(starts) else self.size, stop)
+            values += repeat(_datetime(self.values[run]), end - start)
+            start, run = end, run + 1
+        return values
+
+    def select(self, indices: List[int]) -> '_TimestampColumn':
+        column = _TimestampColumn()
+        for index in indices:
+            column.append(self.get(index))
+        return column
+
+
+def _check_naive(value: Optional[datetime]) -> None:
+    if value is not None and value.tzinfo is not None:
+        raise ValueError("CategoryBatch only stores naive created_at values")
+
+
+def _datetime(micros: int) -> Optional[datetime]:
+    return None if micros == _NO_TIMESTAMP else _EPOCH + micros * _MICROSECOND
+
+
+@dataclass(slots=True)
+class CategoryBatch:
+    """Categories stored column by column in compact arrays.
+
+    Ids are kept as 16 raw bytes, strings as packed UTF-8, `is_active` as one
+    byte and naive `created_at` values as runs of equal timestamps. Ids and
+    text are kept whole, so they make up most of what a row costs: about
+    70 bytes for a short name and description, some 6 times less than the
+    category itself.
+    Entities are rebuilt column by column on demand, without running
+    validation again.
+    """
+    ids: bytearray = field(default_factory=bytearray)
+    names: _StringColumn = field(default_factory=_StringColumn)
+    descriptions: _StringColumn = field(default_factory=_StringColumn)
+    is_active: bytearray = field(default_factory=bytearray)
+    created_at: _TimestampColumn = field(default_factory=_TimestampColumn)
+
+    @classmethod
+    def from_entities(cls, categories: Iterable[Category]) -> 'CategoryBatch':
+        batch = cls()
+        batch.extend(categories)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.is_active)
+
+    def __getitem__(self, index: int) -> Category:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CategoryBatch index out of range")
+        return Category.restore(
+            unique_entity_id=UniqueEntityId.from_bytes(bytes(self.ids[16 * index:16 * index + 16])),
+            name=self.names.get(index),
+            description=self.descriptions.get(index),
+            is_active=_FLAG_VALUES[self.is_active[index]],
+            created_at=self.created_at.get(index),
+        )
+
+    def __iter__(self) -> Iterator[Category]:
+        for start in range(0, len(self), _BLOCK):
+            yield from self._rows(start, min(start + _BLOCK, len(self)))
+
+    def to_entities(self) -> List[Category]:
+        return self._rows(0, len(self))
+
+    def append(self, category: Category) -> None:
+        self.created_at.append(category.created_at)
+        self.ids += category.unique_entity_id.to_bytes()
+        self.names.append(category.name)
+        self.descriptions.append(category.description)
+        self.is_active.append(_FLAG_CODES[category.is_active])
+
+    def extend(self, categories: Iterable[Category]) -> None:
+        categories = list(categories)
+        for category in categories:
+            _check_naive(category.created_at)
+        for category in categories:
+            self.created_at.append(category.created_at)
+        self.ids += b"".join(category.unique_entity_id.to_bytes() for category in categories)
+        self.names.extend([category.name for category in categories])
+        self.descriptions.extend([category.description for category in categories])
+        self.is_active += bytes(_FLAG_CODES[category.is_active] for category in categories)
+
+    def activate(self, indices: Optional[Iterable[int]] = None) -> None:
+        self._set_flags(_TRUE, indices)
+
+    def deactivate(self, indices: Optional[Iterable[int]] = None) -> None:
+        self._set_flags(_FALSE, indices)
+
+    def indices_where(self, is_active: Optional[bool]) -> List[int]:
+        mask = self.is_active.translate(_FLAG_MASKS[_FLAG_CODES[is_active]])
+        return list(compress(range(len(self)), mask))
+
+    def count_by_is_active(self) -> Dict[Optional[bool], int]:
+        return {value: self.is_active.count(code) for value, code in _FLAG_CODES.items()}
+
+    def select(self, indices: Iterable[int]) -> 'CategoryBatch':
+        indices = list(indices)
+        return CategoryBatch(
+            ids=bytearray(b"".join(self.ids[16 * index:16 * index + 16] for index in indices)),
+            names=self.names.select(indices),
+            descriptions=self.descriptions.select(indices),
+            is_active=bytearray(self.is_active[index] for index in indices),
+            created_at=self.created_at.select(indices),
+        )
+
+    def filter(self, is_active: Optional[bool]) -> 'CategoryBatch':
+        return self.select(self.indices_where(is_active))
+
+    def _rows(self, start: int, stop: int) -> List[Category]:
+        """Rows [start, stop) rebuilt in one pass over each column."""
+        if start >= stop:
+            return []
+        return list(map(
+            Category.restore,
+            UniqueEntityId.many_from_bytes(self.ids[16 * start:16 * stop]),
+            self.names.values(start, stop),
+            self.descriptions.values(start, stop),
+            map(_FLAG_VALUES.__getitem__, self.is_active[start:stop]),
+            self.created_at.values_between(start, stop),
+        ))
+
+    def _set_flags(self, code: int, indices: Optional[Iterable[int]]) -> None:
+        if indices is None:
+            self.is_active[:] = bytes((code,)) * len(self)
+            return
+        flags = self.is_active
+        for index in indices:
+            flags[index] = code
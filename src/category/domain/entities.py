@@ -1,8 +1,17 @@
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from __seedwork.domain.entities import Entity
-from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.instrumentation import INSTRUMENTATION
+from __seedwork.domain.interning import Interner
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryUpdated
+)
+from category.domain.validators import CATEGORY_RULES
 
 # pylint: disable=unnecessary-lambda
 
@@ -17,24 +26,279 @@ class Category(Entity):
     )
 
     def __new__(cls, **kwargs): # python`s constructor
+        if INSTRUMENTATION.enabled:
+            return INSTRUMENTATION.timed("Category.__new__", cls._new, kwargs)
         cls.validate(name=kwargs.get("name"),
                      description=kwargs.get("description"),
                      is_active=kwargs.get("is_active"))
         return super(Category, cls).__new__(cls)
 
+    def __post_init__(self):
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.timed("Category.__post_init__", self._post_init)
+        else:
+            self._record(CategoryCreated(self.id, self.name, self.description, self.is_active))
+
+    # bodies of __new__ and __post_init__ when timed; both inline them when disabled
+    @classmethod
+    def _new(cls, kwargs: Dict[str, Any]) -> 'Category':
+        cls.validate(name=kwargs.get("name"),
+                     description=kwargs.get("description"),
+                     is_active=kwargs.get("is_active"))
+        return super(Category, cls).__new__(cls)
+
+    def _post_init(self) -> None:
+        self._record(CategoryCreated(self.id, self.name, self.description, self.is_active))
+
+    def __reduce__(self):
+        # unpickling would call __new__ without arguments, so rebuild trusted instead
+        return (self.restore, (self.unique_entity_id, self.name, self.description,
+                               self.is_active, self.created_at, self._version))
+
+    def __copy__(self):
+        return self.restore(self.unique_entity_id, self.name, self.description,
+                            self.is_active, self.created_at, self._version)
+
     def update(self, name: str, description: Union[None, str]) -> None:
+        """Changing nothing records no event."""
         self.validate(name, description)
+        self._update(name, description)
+
+    def _update(self, name: str, description: Union[None, str]) -> None:
+        if name == self.name and description == self.description:
+            return
         self._set("name", name)
         self._set("description", description)
+        self._bump_version()
+        self._record(CategoryUpdated(self.id, name, description))
 
     def activate(self) -> None:
-        self._set("is_active", True)
+        if self.is_active is not True:
+            self._set("is_active", True)
+            self._bump_version()
+            self._record(CategoryActivated(self.id))
 
     def deactivate(self) -> None:
-        self._set("is_active", False)
+        if self.is_active is not False:
+            self._set("is_active", False)
+            self._bump_version()
+            self._record(CategoryDeactivated(self.id))
 
     @classmethod
     def validate(cls, name: str, description: str, is_active: bool = None) -> None:
-        ValidatorRules.values(name, "name").required().string().max_length(255)
-        ValidatorRules.values(description, "description").string()
-        ValidatorRules.values(is_active, "is_active").boolean()
+        if INSTRUMENTATION.enabled:
+            INSTRUMENTATION.timed("Category.validate", CATEGORY_RULES.validate,
+                                  name, description, is_active)
+        else:
+            CATEGORY_RULES.validate(name, description, is_active)
+
+    @classmethod
+    def restore(cls,
+                unique_entity_id: UniqueEntityId,
+                name: str,
+                description: Optional[str],
+                is_active: Optional[bool],
+                created_at: Optional[datetime],
+                version: int = 0) -> 'Category':
+        """Rebuilds a category from trusted data, skipping validation and events."""
+        category = object.__new__(cls)
+        _set_unique_entity_id(category, unique_entity_id)
+        _set_events(category, None)
+        _set_dirty(category, None)
+        _set_version(category, version)
+        _set_name(category, name)
+        _set_description(category, description)
+        _set_is_active(category, is_active)
+        _set_created_at(category, created_at)
+        return category
+
+    @classmethod
+    def bulk_create(cls, rows: Iterable[Dict[str, Any]],
+                    interner: Optional[Interner] = None) -> 'CategoryBulkResult':
+        """Validates rows column by column and builds every valid category.
+
+        Rows take the same keys as the constructor. Invalid rows are reported
+        by index with the message `Category.validate` would raise; categories
+        without `created_at` share one timestamp taken for the whole call.
+        Like `restore`, it records no events: bulk loads are not one change
+        per category. With an `interner`, equal names, descriptions and
+        timestamps are shared between the categories.
+        """
+        if INSTRUMENTATION.enabled:
+            return INSTRUMENTATION.timed("Category.bulk_create", cls._bulk_create, rows, interner)
+        return cls._bulk_create(rows, interner)
+
+    @classmethod
+    def _bulk_create(cls, rows: Iterable[Dict[str, Any]],
+                     interner: Optional[Interner]) -> 'CategoryBulkResult':
+        rows = rows if isinstance(rows, list) else list(rows)
+        names = [row.get("name") for row in rows]
+        descriptions = [row.get("description") for row in rows]
+        flags = [row.get("is_active", True) for row in rows]
+
+        # the column checks only cover the common shape of a valid row,
+        # anything else goes through the full rules for the exact message
+        suspects = sorted({
+            *(index for index, name in enumerate(names) if not _is_valid_name(name)),
+            *(index for index, description in enumerate(descriptions)
+              if not _is_valid_description(description)),
+            *(index for index, flag in enumerate(flags) if not _is_valid_flag(flag)),
+        })
+        # each rule fails with one shared RuleError, so its message is rendered once
+        errors: Dict[int, str] = {}
+        check = CATEGORY_RULES.check
+        for index in suspects:
+            error = check(names[index], descriptions[index], flags[index])
+            if error is not None:
+                errors[index] = error.message
+
+        now = datetime.now()
+        intern = _unchanged
+        if interner is not None:
+            names = list(map(interner, names))
+            descriptions = list(map(interner, descriptions))
+            intern = interner
+        new_ids = iter(UniqueEntityId.generate_many(len(rows) - len(errors)))
+        restore = cls.restore
+        entities = []
+        for index, row in enumerate(rows):
+            if errors and index in errors:
+                continue
+            entities.append(restore(
+                row.get("unique_entity_id") or next(new_ids),
+                names[index],
+                descriptions[index],
+                flags[index],
+                intern(row["created_at"]) if "created_at" in row else now,
+            ))
+        return CategoryBulkResult(entities=entities, errors=errors)
+
+    @classmethod
+    def bulk_update(cls, categories: Iterable['Category'],
+                    changes: Dict[str, Dict[str, Any]]) -> 'CategoryBulkUpdateResult':
+        """Applies `{category id: {field: value}}` to the categories with that id.
+
+        Fields are `name`, `description` and `is_active`; those left out keep
+        their value, and an `is_active` of None too, like in
+        `UpdateCategoryUseCase`. Only values that differ from the current
+        ones are validated, each distinct one once with the rules of
+        `Category.validate`, which reports the same first error; invalid
+        changes are reported by id and not applied. Changes go through
+        `update`, `activate` and `deactivate`, so versions and events are the
+        same as one call at a time, and categories left as they were are only
+        counted, like those without an entry in `changes`.
+        """
+        if INSTRUMENTATION.enabled:
+            return INSTRUMENTATION.timed("Category.bulk_update", cls._bulk_update,
+                                         categories, changes)
+        return cls._bulk_update(categories, changes)
+
+    @classmethod
+    def _bulk_update(cls, categories: Iterable['Category'],
+                     changes: Dict[str, Dict[str, Any]]) -> 'CategoryBulkUpdateResult':
+        checked: Dict[tuple, Optional[str]] = {}
+
+        def error_of(field_name: str, value: Any) -> Optional[str]:
+            # types are part of the key: 1 == True, but only True is a boolean
+            key = (field_name, type(value), value)
+            try:
+                return checked[key]
+            except KeyError:
+                error = checked[key] = _field_error(field_name, value)
+                return error
+            except TypeError:  # unhashable values are checked every time
+                return _field_error(field_name, value)
+
+        changed: List[Category] = []
+        unchanged = 0
+        errors: Dict[str, str] = {}
+        for category in categories:
+            fields = changes.get(category.id)
+            if fields is None:
+                unchanged += 1
+                continue
+            unknown = fields.keys() - _CHANGEABLE_FIELDS
+            if unknown:
+                errors[category.id] = f"Cannot change the '{min(unknown)}' field of a category"
+                continue
+            values = {"name": category.name, "description": category.description,
+                      "is_active": category.is_active}
+            error = None
+            # in the order Category.validate checks them
+            for field_name, current in values.items():
+                value = fields.get(field_name, current)
+                if value is None and field_name == "is_active":
+                    continue
+                # pylint: disable-next=unidiomatic-typecheck
+                if value != current or type(value) is not type(current):
+                    error = error_of(field_name, value)
+                    if error is not None:
+                        break
+                    values[field_name] = value
+            if error is not None:
+                errors[category.id] = error
+                continue
+            version = category.version
+            # pylint: disable-next=protected-access
+            category._update(values["name"], values["description"])
+            if values["is_active"] is True:
+                category.activate()
+            elif values["is_active"] is False:
+                category.deactivate()
+            if category.version == version:
+                unchanged += 1
+            else:
+                changed.append(category)
+        return CategoryBulkUpdateResult(changed=changed, unchanged=unchanged, errors=errors)
+
+
+# the slot descriptors' setters write a frozen instance about twice as fast as
+# object.__setattr__, which matters when rows are rebuilt by the thousand
+_set_unique_entity_id = vars(Entity)["unique_entity_id"].__set__
+_set_events = vars(Entity)["_events"].__set__
+_set_dirty = vars(Entity)["_dirty"].__set__
+_set_version = vars(Entity)["_version"].__set__
+_set_name = vars(Category)["name"].__set__
+_set_description = vars(Category)["description"].__set__
+_set_is_active = vars(Category)["is_active"].__set__
+_set_created_at = vars(Category)["created_at"].__set__
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryBulkUpdateResult:
+    changed: List[Category]
+    unchanged: int
+    errors: Dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryBulkResult:
+    entities: List[Category]
+    errors: Dict[int, str]
+
+
+_CHANGEABLE_FIELDS = frozenset(("name", "description", "is_active"))
+
+
+def _unchanged(value: Any) -> Any:
+    return value
+
+
+def _field_error(field_name: str, value: Any) -> Optional[str]:
+    """First failure of one field under the category rules, the others are not looked at."""
+    for error in CATEGORY_RULES.check_all(**{field_name: value}):
+        if error.field == field_name:
+            return error.message
+    return None
+
+
+def _is_valid_name(value: Any) -> bool:
+    return type(value) is str and 0 < len(value) <= 255  # pylint: disable=unidiomatic-typecheck
+
+
+def _is_valid_description(value: Any) -> bool:
+    return value is None or type(value) is str  # pylint: disable=unidiomatic-typecheck
+
+
+def _is_valid_flag(value: Any) -> bool:
+    return value is True or value is False or value is None
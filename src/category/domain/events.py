@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+from __seedwork.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryCreated(DomainEvent):
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryUpdated(DomainEvent):
+    coalesce_key = "details"
+
+    name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryActivated(DomainEvent):
+    coalesce_key = "is_active"
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryDeactivated(DomainEvent):
+    coalesce_key = "is_active"
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryDeleted(DomainEvent):
+    pass
@@ -0,0 +1,14 @@
+import abc
+from __seedwork.domain.repositories import (
+    AsyncSearchableRepositoryInterface,
+    SearchableRepositoryInterface
+)
+from category.domain.entities import Category
+
+
+class CategoryRepository(SearchableRepositoryInterface[Category, str], abc.ABC):
+    pass
+
+
+class CategoryAsyncRepository(AsyncSearchableRepositoryInterface[Category, str], abc.ABC):
+    pass
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Dict
+from __seedwork.domain.validators import (
+    CompiledRules,
+    DRFValidator,
+    RulesValidator,
+    ValidatorFieldsInterface,
+    compile_rules
+)
+
+CATEGORY_RULES = compile_rules({
+    "name": "required|string|max_length:255",
+    "description": "string",
+    "is_active": "boolean",
+})
+
+
+@dataclass(slots=True)
+class CategoryValidator(RulesValidator):
+    rules: CompiledRules = CATEGORY_RULES
+
+
+@cache
+def _category_rules() -> type:
+    """Builds the DRF serializer on first use, so only DRF users import DRF.
+
+    Its fields accept exactly what CATEGORY_RULES accepts: strings are taken
+    as they are, neither coerced from other types nor trimmed, and
+    `is_active` is True, False or None.
+    """
+    from rest_framework import serializers  # pylint: disable=import-outside-toplevel
+
+    class StrictCharField(serializers.CharField):
+        def __init__(self, **kwargs):
+            super().__init__(trim_whitespace=False, **kwargs)
+
+        def to_internal_value(self, data):
+            if not isinstance(data, str):
+                self.fail("invalid")
+            return data
+
+    class StrictBooleanField(serializers.BooleanField):
+        def to_internal_value(self, data):
+            if data is not True and data is not False:
+                self.fail("invalid", input=data)
+            return data
+
+    class CategoryRules(serializers.Serializer):  # pylint: disable=abstract-method
+        name = StrictCharField(max_length=255)
+        description = StrictCharField(required=False, allow_null=True, allow_blank=True)
+        is_active = StrictBooleanField(required=False, allow_null=True)
+        created_at = serializers.DateTimeField(required=False)
+
+    CategoryRules.__module__ = __name__
+    return CategoryRules
+
+
+def __getattr__(name: str) -> Any:
+    if name == "CategoryRules":
+        return _category_rules()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class CategoryDRFValidator(DRFValidator):
+    def validate(self, data: Dict[str, Any]) -> bool:
+        rules = _category_rules()(data=data if data is not None else {})
+        return super().validate(rules)
+
+
+class CategoryValidatorFactory:
+
+    @staticmethod
+    def create(use_drf: bool = False) -> ValidatorFieldsInterface:
+        return CategoryDRFValidator() if use_drf else CategoryValidator()
@@ -0,0 +1,113 @@
+"""Category import tooling.
+
+Run from src/:
+    python -m category.infra.cli generate categories.jsonl --rows 2000000
+    python -m category.infra.cli import categories.jsonl --output valid.jsonl --rejected rejected.jsonl
+    python -m category.infra.cli import categories.jsonl --workers 8
+"""
+import argparse
+import json
+import sys
+import time
+from contextlib import ExitStack
+from typing import List, Optional
+from category.infra.parallel import parallel_import
+from category.infra.pipelines import (
+    import_categories,
+    read_csv,
+    read_jsonl,
+    write_csv,
+    write_jsonl
+)
+
+
+def generate(path: str, rows: int, invalid_every: int = 0) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            file.write("name,description,is_active\n")
+        for index in range(rows):
+            invalid = invalid_every and index % invalid_every == invalid_every - 1
+            name = "" if invalid else f"Category {index}"
+            if path.endswith(".csv"):
+                file.write(f"{name},Description {index},{'true' if index % 2 else 'false'}\n")
+            else:
+                file.write(json.dumps({"name": name, "description": f"Description {index}",
+                                       "is_active": bool(index % 2)}) + "\n")
+
+
+def run_import(path: str, chunk_size: int, output: Optional[str], rejected: Optional[str],
+               workers: int = 1) -> dict:
+    is_csv = path.endswith(".csv")
+    counts = {"accepted": 0, "rejected": 0}
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        source = stack.enter_context(open(path, encoding="utf-8", newline=""))
+        if workers <= 1:
+            rows = read_csv(source) if is_csv else read_jsonl(source)
+            chunks = import_categories(rows, chunk_size=chunk_size)
+        else:
+            chunks = parallel_import(source, is_csv, workers=workers, chunk_size=chunk_size)
+        rejected_file = stack.enter_context(open(rejected, "w", encoding="utf-8")) \
+            if rejected else None
+
+        def count_and_reject(chunk):
+            counts["accepted"] += len(chunk.entities)
+            counts["rejected"] += len(chunk.rejected)
+            if rejected_file:
+                for row in chunk.rejected:
+                    rejected_file.write(json.dumps(
+                        {"line": row.line, "error": row.error, "data": row.data},
+                        default=str) + "\n")
+
+        def accepted_entities():
+            for chunk in chunks:
+                count_and_reject(chunk)
+                yield from chunk.entities
+
+        entities = accepted_entities()
+        if output is None:
+            # counting the chunks is enough, their entities are never built
+            for chunk in chunks:
+                count_and_reject(chunk)
+        elif output.endswith(".csv"):
+            write_csv(entities, stack.enter_context(open(output, "w", encoding="utf-8", newline="")))
+        else:
+            write_jsonl(entities, stack.enter_context(open(output, "wb")))
+
+    elapsed = time.perf_counter() - started
+    total = counts["accepted"] + counts["rejected"]
+    return {**counts, "rows": total, "seconds": elapsed,
+            "rows_per_second": total / elapsed if elapsed else 0.0}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m category.infra.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="write a synthetic JSONL or CSV file")
+    generate_parser.add_argument("path")
+    generate_parser.add_argument("--rows", type=int, default=1_000_000)
+    generate_parser.add_argument("--invalid-every", type=int, default=0,
+                                 help="make every Nth row invalid")
+
+    import_parser = commands.add_parser("import", help="validate a JSONL or CSV file")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--chunk-size", type=int, default=10_000)
+    import_parser.add_argument("--output", help="write valid categories to this JSONL/CSV file")
+    import_parser.add_argument("--rejected", help="write rejected rows to this JSONL file")
+    import_parser.add_argument("--workers", type=int, default=1,
+                               help="validate chunks in this many processes")
+
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        generate(args.path, args.rows, args.invalid_every)
+        return 0
+
+    stats = run_import(args.path, args.chunk_size, args.output, args.rejected, args.workers)
+    print(f"{stats['rows']} rows ({stats['accepted']} accepted, {stats['rejected']} rejected) "
+          f"in {stats['seconds']:.2f}s: {stats['rows_per_second']:,.0f} rows/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Parallel import: chunks of a JSONL or CSV file are parsed, validated and built
+in worker processes.
+
+The parent only cuts the file into chunks of whole lines and sends each one
+as a single string, so it does no work per row and the import scales with
+the workers. Workers send each chunk back as a `CategoryBatch` (a handful of
+byte arrays) plus its rejected rows instead of pickling one dataclass graph
+per category; only chunks holding timezone-aware `created_at` values, which
+a batch cannot store, travel as plain entities. `parallel_import` hands the
+batches on as they are, entities are only rebuilt when they are read.
+Chunks come back in input order and at most `max_pending` are in flight, so
+memory stays bounded like the serial pipeline.
+"""
+import io
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Deque, Iterator, List, Optional, Tuple, Union
+from category.domain.batches import CategoryBatch
+from category.domain.entities import Category
+from category.infra.pipelines import ImportChunk, RejectedRow, import_categories, read_csv, \
+    read_jsonl
+
+
+def parallel_import_batches(
+    file: IO[str],
+    is_csv: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+    max_pending: Optional[int] = None
+) -> Iterator[Tuple[Union[CategoryBatch, List[Category]], List[RejectedRow]]]:
+    """Imports a text file opened with `newline=""`, `chunk_size` lines per chunk."""
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    header = file.readline() if is_csv else ""
+    chunks = _text_chunks(file, chunk_size, is_csv, first_line=2 if is_csv else 1)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: Deque[Future] = deque()
+    try:
+        while True:
+            while len(pending) < max_pending and (chunk := next(chunks, None)) is not None:
+                pending.append(executor.submit(_import_chunk, header, *chunk, is_csv))
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_import(
+    file: IO[str],
+    is_csv: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+    max_pending: Optional[int] = None
+) -> Iterator[ImportChunk]:
+    for batch, rejected in parallel_import_batches(file, is_csv, workers, chunk_size,
+                                                   max_pending):
+        yield ImportChunk(batch, rejected)
+
+
+def _text_chunks(file: IO[str], chunk_size: int, is_csv: bool,
+                 first_line: int) -> Iterator[Tuple[str, int, int]]:
+    """`(text, number of its first line, line count)` for runs of `chunk_size` lines.
+
+    A CSV chunk ends where its quotes are balanced, so a quoted value
+    spanning lines is never cut in two.
+    """
+    while lines := list(islice(file, chunk_size)):
+        text = "".join(lines)
+        if is_csv:
+            while text.count('"') % 2 and (line := file.readline()):
+                lines.append(line)
+                text += line
+        yield text, first_line, len(lines)
+        first_line += len(lines)
+
+
+def _import_chunk(
+    header: str, text: str, first_line: int, lines: int, is_csv: bool
+) -> Tuple[Union[CategoryBatch, List[Category]], List[RejectedRow]]:
+    # the header is read as the line right before the chunk
+    rows = read_csv(io.StringIO(header + text, newline=""), start=first_line - 1) if is_csv \
+        else read_jsonl(io.StringIO(text, newline=""), start=first_line)
+    chunks = list(import_categories(rows, chunk_size=lines))
+    if not chunks:
+        return CategoryBatch(), []
+    chunk, = chunks
+    try:
+        return CategoryBatch.from_entities(chunk.entities), chunk.rejected
+    except ValueError:
+        return chunk.entities, chunk.rejected
@@ -0,0 +1,136 @@
+"""Streaming import and export of categories.
+
+Readers yield one `SourceRow` per record, `import_categories` validates them
+in fixed-size chunks through `Category.bulk_create`, and writers consume any
+iterable of categories, so memory stays bounded by the chunk size whatever
+the file size. An `Interner` given to `import_categories` is shared by every
+chunk, so repeated names, descriptions and timestamps are kept once.
+"""
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.interning import Interner
+from __seedwork.domain.serializers import to_dict, to_json
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+
+CSV_FIELDS = ["id", "name", "description", "is_active", "created_at"]
+_CSV_FLAGS = {"true": True, "1": True, "false": False, "0": False}
+
+
+@dataclass(frozen=True, slots=True)
+class SourceRow:
+    line: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    line: int
+    data: Optional[Dict[str, Any]]
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class ImportChunk:
+    """`entities` is a list, or a `CategoryBatch` rebuilding them as they are read."""
+    entities: Sequence[Category]
+    rejected: List[RejectedRow]
+
+
+def read_jsonl(file: IO[str], start: int = 1) -> Iterator[SourceRow]:
+    """`start` is the number of the file's first line, for files cut out of a bigger one."""
+    for line, text in enumerate(file, start=start):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError as exc:
+            yield SourceRow(line, None, f"Invalid JSON: {exc}")
+            continue
+        if isinstance(data, dict):
+            yield SourceRow(line, data)
+        else:
+            yield SourceRow(line, None, "Invalid JSON: expected an object")
+
+
+def read_csv(file: IO[str], start: int = 1) -> Iterator[SourceRow]:
+    """Empty cells are read as missing values; is_active accepts true/false/1/0.
+
+    `start` is the number of the header line, like for `read_jsonl`.
+    """
+    reader = csv.DictReader(file)
+    for row in reader:
+        data = {key: value for key, value in row.items() if key is not None and value != ""}
+        if "is_active" in data:
+            data["is_active"] = _CSV_FLAGS.get(data["is_active"].lower(), data["is_active"])
+        yield SourceRow(reader.line_num + start - 1, data)
+
+
+def import_categories(rows: Iterable[SourceRow], chunk_size: int = 10_000,
+                      interner: Optional[Interner] = None) -> Iterator[ImportChunk]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        rejected: List[RejectedRow] = []
+        accepted: List[SourceRow] = []
+        kwargs: List[Dict[str, Any]] = []
+        for row in chunk:
+            if row.error is not None:
+                rejected.append(RejectedRow(row.line, row.data, row.error))
+                continue
+            try:
+                kwargs.append(_to_kwargs(row.data))
+            except ValueError as exc:
+                rejected.append(RejectedRow(row.line, row.data, exc.args[0]))
+                continue
+            accepted.append(row)
+
+        result = Category.bulk_create(kwargs, interner)
+        for index, error in result.errors.items():
+            rejected.append(RejectedRow(accepted[index].line, accepted[index].data, error))
+        rejected.sort(key=lambda rejected_row: rejected_row.line)
+        yield ImportChunk(result.entities, rejected)
+
+
+def write_jsonl(categories: Iterable[Category], file: IO[bytes]) -> int:
+    count = 0
+    for category in categories:
+        file.write(to_json(category))
+        file.write(b"\n")
+        count += 1
+    return count
+
+
+def write_csv(categories: Iterable[Category], file: IO[str]) -> int:
+    writer = csv.DictWriter(file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for category in categories:
+        row = to_dict(category)
+        if row["created_at"] is not None:
+            row["created_at"] = row["created_at"].isoformat()
+        if row["is_active"] is not None:
+            row["is_active"] = "true" if row["is_active"] else "false"
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _to_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    kwargs = {key: data[key] for key in ("name", "description", "is_active") if key in data}
+    if data.get("id") is not None:
+        try:
+            kwargs["unique_entity_id"] = UniqueEntityId(data["id"])
+        except (InvalidUuidException, AttributeError, TypeError) as exc:
+            raise ValueError(InvalidUuidException().args[0]) from exc
+    if data.get("created_at") is not None:
+        try:
+            kwargs["created_at"] = datetime.fromisoformat(data["created_at"])
+        except (TypeError, ValueError) as exc:
+            raise ValueError("The field created_at must be an ISO 8601 datetime.") from exc
+    return kwargs
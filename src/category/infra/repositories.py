@@ -0,0 +1,53 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+from __seedwork.domain.repositories import (
+    AsyncInMemorySearchableRepository,
+    InMemorySearchableRepository,
+    SortedIndex
+)
+from category.domain.entities import Category
+from category.domain.repositories import CategoryAsyncRepository, CategoryRepository
+
+
+@dataclass(slots=True)
+class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepository[Category, str]):
+    """The filter is a case-insensitive prefix of the category name, as text."""
+
+    sortable_fields = ["name", "created_at"]
+    lookup_indexes = {"name_lookup": lambda category: category.name.casefold()}
+    default_sort = "created_at"
+    default_sort_dir = "desc"
+
+    def _apply_filter(self, filter_param: Optional[str]) -> Optional[List[str]]:
+        if filter_param is None:
+            return None
+        lower, upper = name_prefix_bounds(filter_param)
+        index = self.indexes["name_lookup"]
+        start = index.position(SortedIndex.entry(lower, ""))
+        stop = len(index) if upper is None else index.position(SortedIndex.entry(upper, ""))
+        return index.ids(start, stop)
+
+
+def name_prefix_bounds(search_filter: Any) -> Tuple[str, Optional[str]]:
+    """`[lower, upper)` range of the casefolded names starting with the filter.
+
+    Filters that are not strings match as their text. `upper` is None when
+    no string is above every match: the filter is empty or only made of
+    the last code point.
+    """
+    prefix = str(search_filter).casefold()
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return prefix, None
+    return prefix, stem[:-1] + chr(ord(stem[-1]) + 1)
+
+
+@dataclass(slots=True)
+class CategoryAsyncInMemoryRepository(
+    CategoryAsyncRepository,
+    AsyncInMemorySearchableRepository[Category, str]
+):
+    sortable_fields = CategoryInMemoryRepository.sortable_fields
+
+    repository: CategoryInMemoryRepository = field(default_factory=CategoryInMemoryRepository)
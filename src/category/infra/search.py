@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Iterable, List
+from __seedwork.domain.events import DomainEvent, EventDispatcher
+from __seedwork.domain.search import TextIndex, TextSearchResult
+from category.domain.entities import Category
+from category.domain.events import CategoryCreated, CategoryDeleted, CategoryUpdated
+
+
+@dataclass(slots=True)
+class CategorySearchIndex:
+    """Type-ahead search over category names (weight 2) and descriptions (weight 1).
+
+    Kept current by `handle`, the dispatcher handler for category events;
+    `bulk_add` indexes categories loaded without events.
+    """
+    index: TextIndex = field(default_factory=lambda: TextIndex(weights=(2, 1)))
+
+    def subscribe(self, dispatcher: EventDispatcher) -> None:
+        for event_type in (CategoryCreated, CategoryUpdated, CategoryDeleted):
+            dispatcher.subscribe(event_type, self.handle)
+
+    def handle(self, events: List[DomainEvent]) -> None:
+        for event in events:
+            if isinstance(event, (CategoryCreated, CategoryUpdated)):
+                self.index.add(event.entity_id, (event.name, event.description))
+            elif isinstance(event, CategoryDeleted):
+                self.index.remove(event.entity_id)
+
+    def add(self, category: Category) -> None:
+        self.index.add(category.id, (category.name, category.description))
+
+    def bulk_add(self, categories: Iterable[Category]) -> None:
+        self.index.update((category.id, (category.name, category.description))
+                          for category in categories)
+
+    def remove(self, entity_id: str) -> None:
+        self.index.remove(entity_id)
+
+    def search(self, query: str, page: int = 1, per_page: int = 15) -> TextSearchResult:
+        return self.index.search(query, page, per_page)
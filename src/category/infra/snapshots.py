@@ -0,0 +1,296 @@
+"""Binary snapshots of a whole category collection, read through `mmap`.
+
+`write_snapshot` streams categories to a file in one pass and
+`CategorySnapshot.open` maps it without parsing anything, so a worker can
+start serving from a large catalog right away. Categories are only built
+when they are accessed, and single fields can be read without building them.
+
+Layout, little-endian, each array aligned on 8 bytes:
+
+    header      magic, format version, CRC-32 of the rest, count, heap size
+    heap        UTF-8 names and descriptions, end to end
+    offsets     uint64 * (2 * count + 1); string k is heap[offsets[k]:offsets[k + 1]],
+                the name of category i is string 2i and its description 2i + 1
+    ids         16 raw UUID bytes per category
+    created_at  int64 microseconds since the epoch, naive datetimes only
+    flags       one byte per category: is_active code, then the null bits
+
+Snapshots are written to a temporary file renamed into place, so readers
+never see half a snapshot. Opening checks the magic, version and sizes, and
+the checksum unless `verify=False`.
+"""
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from __seedwork.domain.exceptions import InvalidUuidException, NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+
+MAGIC = b"CATSNAP\0"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIQQ")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIMESTAMP = -(2 ** 63)
+
+# flags byte: the low two bits hold is_active, the others mark null strings
+_FLAG_CODES = {False: 0, True: 1, None: 2}
+_FLAG_VALUES = (False, True, None)
+_ACTIVE_BITS = 0b11
+_NULL_NAME = 0b100
+_NULL_DESCRIPTION = 0b1000
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# categories materialized at a time when iterating
+_CHUNK = 4096
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def write_snapshot(path: Union[str, os.PathLike], categories: Iterable[Category]) -> int:
+    """Writes the categories to `path` and returns how many were written.
+
+    Strings go to the file as categories come; the fixed-width columns,
+    about 40 bytes per category, are kept until the end.
+    """
+    offsets = array("Q", [0])
+    ids = bytearray()
+    created_at = array("q")
+    flags = bytearray()
+    temporary = f"{os.fspath(path)}.tmp"
+    try:
+        with open(temporary, "wb", buffering=1 << 20) as file:
+            file.write(bytes(_HEADER.size))
+            checksum, position = 0, 0
+            for category in categories:
+                timestamp = category.created_at
+                if timestamp is not None and timestamp.tzinfo is not None:
+                    raise ValueError("Snapshots only store naive created_at values")
+                flag = _FLAG_CODES[category.is_active]
+                for value, null_bit in ((category.name, _NULL_NAME),
+                                        (category.description, _NULL_DESCRIPTION)):
+                    if value is None:
+                        flag |= null_bit
+                    else:
+                        encoded = value.encode()
+                        file.write(encoded)
+                        checksum = zlib.crc32(encoded, checksum)
+                        position += len(encoded)
+                    offsets.append(position)
+                ids += category.unique_entity_id.to_bytes()
+                created_at.append(_NO_TIMESTAMP if timestamp is None
+                                  else (timestamp - _EPOCH) // _MICROSECOND)
+                flags.append(flag)
+
+            count = len(flags)
+            padding = bytes(-(_HEADER.size + position) % 8)
+            if not _LITTLE_ENDIAN:
+                offsets.byteswap()
+                created_at.byteswap()
+            for section in (padding, offsets, ids, created_at, flags):
+                file.write(section)
+                checksum = zlib.crc32(section, checksum)
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, 0, checksum, count, position))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return count
+
+
+@dataclass(slots=True)
+class CategorySnapshot:
+    """Read-only view of a snapshot file; see the module documentation.
+
+    Indexing builds a new `Category` each time, with `Category.restore`.
+    Field readers decode one value straight from the mapping. Snapshots must
+    be closed, or used as context managers, before the file can be removed
+    on every platform.
+    """
+    _file: Optional[mmap.mmap] = None
+    _count: int = 0
+    _heap: memoryview = None
+    _offsets: Union[memoryview, array] = None
+    _ids: memoryview = None
+    _created_at: Union[memoryview, array] = None
+    _flags: memoryview = None
+    _positions: Optional[Dict[bytes, int]] = field(default=None, repr=False)
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike], verify: bool = True) -> 'CategorySnapshot':
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise SnapshotError(f"{path} is not a category snapshot")
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls._from_mapping(mapping, size, verify)
+        except BaseException:
+            mapping.close()
+            raise
+
+    @classmethod
+    def _from_mapping(cls, mapping: mmap.mmap, size: int, verify: bool) -> 'CategorySnapshot':
+        magic, version, _, checksum, count, heap_size = _HEADER.unpack_from(mapping)
+        if magic != MAGIC:
+            raise SnapshotError("Not a category snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}, expected {VERSION}")
+        start = _HEADER.size + heap_size + (-(_HEADER.size + heap_size) % 8)
+        bounds = [start]
+        for width in (8 * (2 * count + 1), 16 * count, 8 * count, count):
+            bounds.append(bounds[-1] + width)
+        if bounds[-1] != size:
+            raise SnapshotError("Truncated or oversized snapshot")
+        view = memoryview(mapping)
+        if verify and zlib.crc32(view[_HEADER.size:]) != checksum:
+            view.release()
+            raise SnapshotError("Snapshot checksum mismatch")
+
+        offsets = view[bounds[0]:bounds[1]]
+        created_at = view[bounds[2]:bounds[3]]
+        if _LITTLE_ENDIAN:
+            offsets, created_at = offsets.cast("Q"), created_at.cast("q")
+        else:
+            offsets, created_at = array("Q", bytes(offsets)), array("q", bytes(created_at))
+            offsets.byteswap()
+            created_at.byteswap()
+        snapshot = cls(
+            _file=mapping,
+            _count=count,
+            _heap=view[_HEADER.size:_HEADER.size + heap_size],
+            _offsets=offsets,
+            _ids=view[bounds[1]:bounds[2]],
+            _created_at=created_at,
+            _flags=view[bounds[3]:bounds[4]],
+        )
+        view.release()
+        return snapshot
+
+    def __enter__(self) -> 'CategorySnapshot':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        for view in (self._heap, self._offsets, self._ids, self._created_at, self._flags):
+            if isinstance(view, memoryview):
+                view.release()
+        self._file.close()
+        self._file = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Category:
+        index = self._position(index)
+        raw_id = bytes(self._ids[16 * index:16 * index + 16])
+        return Category.restore(
+            unique_entity_id=UniqueEntityId.from_bytes(raw_id),
+            name=self._string(2 * index, _NULL_NAME, index),
+            description=self._string(2 * index + 1, _NULL_DESCRIPTION, index),
+            is_active=_FLAG_VALUES[self._flags[index] & _ACTIVE_BITS],
+            created_at=self.created_at(index),
+        )
+
+    def __iter__(self) -> Iterator[Category]:
+        for start in range(0, self._count, _CHUNK):
+            yield from self._materialize(start, min(start + _CHUNK, self._count))
+
+    def to_entities(self) -> List[Category]:
+        return list(self)
+
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> Category:
+        """Looks the id up in an index built on the first call."""
+        self._require_open()
+        if self._positions is None:
+            ids = self._ids.tobytes()
+            self._positions = {ids[start:start + 16]: start >> 4
+                               for start in range(0, len(ids), 16)}
+        try:
+            key = entity_id.to_bytes() if isinstance(entity_id, UniqueEntityId) \
+                else UniqueEntityId(entity_id).to_bytes()
+            return self[self._positions[key]]
+        except (InvalidUuidException, KeyError, TypeError) as exc:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from exc
+
+    def id_bytes(self, index: int) -> memoryview:
+        """The 16 raw bytes of the id, a view into the file to release before closing it."""
+        index = self._position(index)
+        return self._ids[16 * index:16 * index + 16]
+
+    def name(self, index: int) -> Optional[str]:
+        index = self._position(index)
+        return self._string(2 * index, _NULL_NAME, index)
+
+    def description(self, index: int) -> Optional[str]:
+        index = self._position(index)
+        return self._string(2 * index + 1, _NULL_DESCRIPTION, index)
+
+    def is_active(self, index: int) -> Optional[bool]:
+        return _FLAG_VALUES[self._flags[self._position(index)] & _ACTIVE_BITS]
+
+    def created_at(self, index: int) -> Optional[datetime]:
+        timestamp = self._created_at[self._position(index)]
+        return None if timestamp == _NO_TIMESTAMP else _EPOCH + timestamp * _MICROSECOND
+
+    def _require_open(self) -> None:
+        if self._file is None:
+            raise ValueError("Snapshot is closed")
+
+    def _position(self, index: int) -> int:
+        self._require_open()
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("CategorySnapshot index out of range")
+        return index
+
+    def _materialize(self, start: int, stop: int) -> List[Category]:
+        """Builds a range of categories from copies of their slices of each column."""
+        self._require_open()
+        restore, from_bytes = Category.restore, UniqueEntityId.from_bytes
+        offsets = self._offsets[2 * start:2 * stop + 1].tolist()
+        base = offsets[0]
+        heap = self._heap[base:offsets[-1]].tobytes()
+        ids = self._ids[16 * start:16 * stop].tobytes()
+        flags = self._flags[start:stop].tobytes()
+        entities = []
+        # categories created together share a timestamp, and so a datetime here
+        last_timestamp, last_created_at = None, None
+        for index, timestamp in enumerate(self._created_at[start:stop].tolist()):
+            if timestamp != last_timestamp:
+                last_timestamp = timestamp
+                last_created_at = None if timestamp == _NO_TIMESTAMP \
+                    else _EPOCH + timedelta(microseconds=timestamp)
+            flag = flags[index]
+            name_start, description_start, end = offsets[2 * index:2 * index + 3]
+            entities.append(restore(
+                from_bytes(ids[16 * index:16 * index + 16]),
+                None if flag & _NULL_NAME
+                else heap[name_start - base:description_start - base].decode(),
+                None if flag & _NULL_DESCRIPTION
+                else heap[description_start - base:end - base].decode(),
+                _FLAG_VALUES[flag & _ACTIVE_BITS],
+                last_created_at,
+            ))
+        return entities
+
+    def _string(self, string: int, null_bit: int, index: int) -> Optional[str]:
+        if self._flags[index] & null_bit:
+            return None
+        offsets = self._offsets
+        return str(self._heap[offsets[string]:offsets[string + 1]], "utf-8")
@@ -0,0 +1,408 @@
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.interning import Interner
+from __seedwork.domain.repositories import (
+    SearchParams,
+    SearchResult,
+    conflict,
+    decode_cursor,
+    encode_cursor
+)
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.repositories import name_prefix_bounds
+
+# created_at is stored as fixed-width ISO text and '' stands for None, so the
+# column is never NULL and (created_at, id) row values compare in index order
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id BLOB PRIMARY KEY NOT NULL,
+    name TEXT NOT NULL,
+    name_lookup TEXT NOT NULL,
+    description TEXT,
+    is_active INTEGER,
+    created_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS categories_name ON categories (name, id);
+CREATE INDEX IF NOT EXISTS categories_created_at ON categories (created_at, id);
+CREATE INDEX IF NOT EXISTS categories_name_lookup ON categories (name_lookup, id);
+"""
+
+_COLUMNS = "id, name, description, is_active, created_at, version"
+_INSERT = "INSERT INTO categories " \
+          "(id, name, name_lookup, description, is_active, created_at, version) " \
+          "VALUES (?, ?, ?, ?, ?, ?, ?)"
+_UPSERT = _INSERT + " ON CONFLICT (id) DO UPDATE SET name = excluded.name, " \
+    "name_lookup = excluded.name_lookup, description = excluded.description, " \
+    "is_active = excluded.is_active, created_at = excluded.created_at, " \
+    "version = excluded.version"
+_UPDATE = "UPDATE categories SET name = ?, name_lookup = ?, description = ?, is_active = ?, " \
+          "created_at = ?, version = ? WHERE id = ?"
+_COMPARE_AND_SET = _UPDATE + " AND version = ?"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM categories WHERE id = ?"
+_SELECT_ALL = f"SELECT {_COLUMNS} FROM categories ORDER BY rowid"
+_SELECT_MANY = f"SELECT {_COLUMNS} FROM categories WHERE id IN ({{}})"
+_DELETE = "DELETE FROM categories WHERE id = ?"
+_SELECT_IDS = "SELECT id FROM categories WHERE id IN ({})"
+_SELECT_VERSIONS = "SELECT id, version FROM categories WHERE id IN ({})"
+
+Row = Tuple[bytes, str, str, Optional[str], Optional[int], str, int]
+
+
+@dataclass(slots=True)
+class CategorySqliteRepository(CategoryRepository):
+    """Categories in a SQLite file, one connection per thread.
+
+    Statements are constant strings, so each connection's statement cache
+    keeps them prepared. Rows are mapped back with `Category.restore`: they
+    were validated on their way in. Ids live as 16-byte blobs. `insert` and
+    `bulk_insert` refuse existing ids, `bulk_upsert` replaces them.
+
+    With an `interner`, loaded categories share equal names, descriptions
+    and timestamps, for callers that keep many of them in memory.
+
+    Rows keep the entity `version`: `insert`, `update` and the bulk writes
+    store it as is, `compare_and_set_many` only where the stored version is
+    the expected one. `patch_many` stores the patched `version`, or adds one
+    to the stored version when the patch has none.
+
+    `created_at` values are compared as stored text. That is their time order
+    for naive datetimes, which is what categories get by default.
+    """
+
+    sortable_fields = ["name", "created_at"]
+    default_sort = "created_at"
+    default_sort_dir = "desc"
+
+    database: str
+    interner: Optional[Interner] = None
+    _local: threading.local = field(init=False, default_factory=threading.local)
+    _connections: List[sqlite3.Connection] = field(init=False, default_factory=list)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self):
+        connection = self.connection
+        connection.executescript(SCHEMA)
+        # files created before versions were stored
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(categories)")}
+        if "version" not in columns:
+            connection.execute(
+                "ALTER TABLE categories ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # each connection stays in its thread, `close` is the one exception
+            connection = sqlite3.connect(self.database, cached_statements=256,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            # random ids and names touch pages all over the indexes on insert
+            connection.execute("PRAGMA cache_size = -65536")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def insert(self, entity: Category) -> None:
+        with self._transaction() as connection:
+            connection.execute(_INSERT, _to_row(entity))
+
+    def bulk_insert(self, entities: Iterable[Category]) -> None:
+        with self._transaction() as connection:
+            connection.executemany(_INSERT, map(_to_row, entities))
+
+    def bulk_upsert(self, entities: Iterable[Category]) -> None:
+        with self._transaction() as connection:
+            connection.executemany(_UPSERT, map(_to_row, entities))
+
+    def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> Category:
+        row = self.connection.execute(_SELECT_BY_ID, (_id_bytes(entity_id),)).fetchone()
+        if row is None:
+            raise _not_found(entity_id)
+        return _to_entity(row, self.interner)
+
+    def find_many(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> Dict[str, Category]:
+        """`SELECT ... WHERE id IN (...)` by chunks of 500 ids."""
+        keys = list({_id_bytes(entity_id): None for entity_id in entity_ids})
+        connection, interner = self.connection, self.interner
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            for row in connection.execute(_SELECT_MANY.format(", ".join("?" * len(chunk))), chunk):
+                category = _to_entity(row, interner)
+                found[category.id] = category
+        return found
+
+    def find_all(self) -> List[Category]:
+        interner = self.interner
+        return [_to_entity(row, interner) for row in self.connection.execute(_SELECT_ALL)]
+
+    def update(self, entity: Category) -> None:
+        row = _to_row(entity)
+        with self._transaction() as connection:
+            if not connection.execute(_UPDATE, (*row[1:], row[0])).rowcount:
+                raise _not_found(entity.id)
+
+    def delete(self, entity_id: Union[str, UniqueEntityId]) -> None:
+        with self._transaction() as connection:
+            if not connection.execute(_DELETE, (_id_bytes(entity_id),)).rowcount:
+                raise _not_found(entity_id)
+
+    def patch_many(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """One `UPDATE` per distinct set of changed fields, all in one transaction.
+
+        Nothing is written when an id is unknown.
+        """
+        batches: Dict[Tuple[str, ...], List[str]] = {}
+        for entity_id, fields in changes.items():
+            batches.setdefault(tuple(sorted(fields)), []).append(entity_id)
+        with self._transaction() as connection:
+            for names, entity_ids in batches.items():
+                keys = [_id_bytes(entity_id) for entity_id in entity_ids]
+                rows = [(*(value for name in names
+                           for value in _column_values(name, changes[entity_id][name])), key)
+                        for entity_id, key in zip(entity_ids, keys)]
+                if connection.executemany(_patch_sql(names), rows).rowcount != len(rows):
+                    self._raise_missing(connection, keys, entity_ids)
+
+    def bulk_delete(self, entity_ids: Iterable[Union[str, UniqueEntityId]]) -> None:
+        """Deletes every id or, when one is unknown, none of them."""
+        by_key = {_id_bytes(entity_id): entity_id for entity_id in entity_ids}
+        keys, entity_ids = list(by_key), list(by_key.values())
+        with self._transaction() as connection:
+            if connection.executemany(_DELETE, [(key,) for key in keys]).rowcount != len(keys):
+                self._raise_missing(connection, keys, entity_ids)
+
+    def compare_and_set_many(self, entities: Iterable[Tuple[Category, int]]) -> None:
+        """One `UPDATE ... WHERE id = ? AND version = ?` per entity, in one transaction."""
+        entities = list(entities)
+        rows = []
+        for entity, expected_version in entities:
+            row = _to_row(entity)
+            rows.append((*row[1:], row[0], expected_version))
+        with self._transaction() as connection:
+            if connection.executemany(_COMPARE_AND_SET, rows).rowcount != len(rows):
+                self._raise_stale(connection, entities)
+
+    def search(self, input_params: SearchParams[str]) -> SearchResult[Category, str]:
+        """Same results as the in-memory repository; cursors page by keyset, not OFFSET."""
+        sort, sort_dir = input_params.sort, input_params.sort_dir
+        if sort not in self.sortable_fields:
+            sort, sort_dir = self.default_sort, self.default_sort_dir
+        per_page = input_params.per_page
+        cursor = decode_cursor(input_params.cursor, sort, sort_dir)
+
+        where: List[object] = []
+        if input_params.filter is not None:
+            lower, upper = name_prefix_bounds(input_params.filter)
+            # SQLite sorts every text below every blob, so an empty blob leaves it open
+            where += [lower, b"" if upper is None else upper]
+        args = list(where)
+        if cursor is not None:
+            value, entity_id = cursor
+            try:
+                args += [_to_db(sort, value), uuid.UUID(entity_id).bytes]
+            except (AttributeError, TypeError, ValueError):
+                cursor = None
+        args += [per_page + 1, 0 if cursor is not None else (input_params.page - 1) * per_page]
+
+        connection = self.connection
+        total = self._count(connection, where)
+        rows = connection.execute(
+            _search_sql(sort, sort_dir == "desc", bool(where), cursor is not None), args
+        ).fetchall()
+
+        items = [_to_entity(row, self.interner) for row in rows[:per_page]]
+        next_cursor = None
+        if len(rows) > per_page:
+            next_cursor = encode_cursor(sort, sort_dir, getattr(items[-1], sort), items[-1].id)
+
+        return SearchResult(
+            items=items,
+            total=total,
+            current_page=input_params.page,
+            per_page=per_page,
+            sort=sort,
+            sort_dir=sort_dir,
+            filter=input_params.filter,
+            next_cursor=next_cursor
+        )
+
+    def _count(self, connection: sqlite3.Connection, where: List[object]) -> int:
+        """Unfiltered totals are cached until this thread writes or `data_version`
+        reports a commit from another connection."""
+        if where:
+            return connection.execute(_count_sql(True), where).fetchone()[0]
+        version = connection.execute("PRAGMA data_version").fetchone()[0]
+        cached = getattr(self._local, "total", None)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        total = connection.execute(_count_sql(False)).fetchone()[0]
+        self._local.total = (version, total)
+        return total
+
+    @staticmethod
+    def _raise_missing(connection: sqlite3.Connection, keys: List[bytes],
+                       entity_ids: Iterable[Union[str, UniqueEntityId]]) -> None:
+        """Undoes the batch, then reports the first id that is not stored."""
+        connection.rollback()
+        found = set()
+        # stays below SQLite's default limit of 999 host parameters
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            found.update(row[0] for row in connection.execute(
+                _SELECT_IDS.format(", ".join("?" * len(chunk))), chunk))
+        for key, entity_id in zip(keys, entity_ids):
+            if key not in found:
+                raise _not_found(entity_id)
+        raise _not_found(None)
+
+    @staticmethod
+    def _raise_stale(connection: sqlite3.Connection,
+                     entities: List[Tuple[Category, int]]) -> None:
+        """Undoes the batch, then reports the first entity that could not be saved."""
+        connection.rollback()
+        keys = list({entity.unique_entity_id.to_bytes(): None for entity, _ in entities})
+        stored = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            stored.update(connection.execute(
+                _SELECT_VERSIONS.format(", ".join("?" * len(chunk))), chunk))
+        for entity, expected_version in entities:
+            key = entity.unique_entity_id.to_bytes()
+            if key not in stored:
+                raise _not_found(entity.id)
+            if stored[key] != expected_version:
+                raise conflict(entity.id, expected_version, stored[key])
+            # a later save of the same id expects the version this one wrote
+            stored[key] = entity.version
+        raise ConflictException("The batch was changed concurrently")
+
+    @contextmanager
+    def transaction(self) -> Iterator[bool]:
+        """The writes of the block, from this thread, commit together or roll back."""
+        with self._transaction():
+            yield True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self.connection
+        self._local.total = None
+        if getattr(self._local, "in_transaction", False):
+            # the outermost block commits or rolls back
+            yield connection
+            return
+        self._local.in_transaction = True
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._local.in_transaction = False
+
+
+@lru_cache(maxsize=None)
+def _search_sql(sort: str, descending: bool, filtered: bool, keyset: bool) -> str:
+    conditions = ["name_lookup >= ? AND name_lookup < ?"] if filtered else []
+    if keyset:
+        conditions.append(f"({sort}, id) {'<' if descending else '>'} (?, ?)")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    direction = "DESC" if descending else "ASC"
+    return f"SELECT {_COLUMNS} FROM categories{where} " \
+           f"ORDER BY {sort} {direction}, id {direction} LIMIT ? OFFSET ?"
+
+
+@lru_cache(maxsize=None)
+def _patch_sql(names: Tuple[str, ...]) -> str:
+    columns = [f"{column} = ?" for name in names for column in _PATCH_COLUMNS[name][0]]
+    if "version" not in names:
+        columns.append("version = version + 1")
+    return f"UPDATE categories SET {', '.join(columns)} WHERE id = ?"
+
+
+def _column_values(name: str, value: Any) -> tuple:
+    try:
+        return _PATCH_COLUMNS[name][1](value)
+    except KeyError as exc:
+        raise ValueError(f"Cannot patch the '{name}' field of a category") from exc
+
+
+@lru_cache(maxsize=None)
+def _count_sql(filtered: bool) -> str:
+    where = " WHERE name_lookup >= ? AND name_lookup < ?" if filtered else ""
+    return f"SELECT COUNT(*) FROM categories{where}"
+
+
+# the columns each category field is stored in, and how to compute them
+_PATCH_COLUMNS: Dict[str, Tuple[Tuple[str, ...], Callable[[Any], tuple]]] = {
+    "name": (("name", "name_lookup"), lambda value: (value, value.casefold())),
+    "description": (("description",), lambda value: (value,)),
+    "is_active": (("is_active",), lambda value: (None if value is None else int(value),)),
+    "created_at": (("created_at",), lambda value: (_to_db("created_at", value),)),
+    "version": (("version",), lambda value: (value,)),
+}
+
+
+def _to_row(category: Category) -> Row:
+    is_active = category.is_active
+    return (
+        category.unique_entity_id.to_bytes(),
+        category.name,
+        category.name.casefold(),
+        category.description,
+        None if is_active is None else int(is_active),
+        _to_db("created_at", category.created_at),
+        category.version,
+    )
+
+
+def _to_entity(row: Row, interner: Optional[Interner] = None) -> Category:
+    entity_id, name, description, is_active, created_at, version = row
+    created_at = datetime.fromisoformat(created_at) if created_at else None
+    if interner is not None:
+        name, description, created_at = interner(name), interner(description), interner(created_at)
+    return Category.restore(
+        unique_entity_id=UniqueEntityId.from_bytes(entity_id),
+        name=name,
+        description=description,
+        is_active=None if is_active is None else bool(is_active),
+        created_at=created_at,
+        version=version,
+    )
+
+
+def _to_db(sort: str, value: object) -> object:
+    if sort != "created_at":
+        return value
+    return "" if value is None else value.isoformat(timespec="microseconds")
+
+
+def _id_bytes(entity_id: Union[str, UniqueEntityId]) -> bytes:
+    if isinstance(entity_id, UniqueEntityId):
+        return entity_id.to_bytes()
+    try:
+        return uuid.UUID(entity_id).bytes
+    except (AttributeError, TypeError, ValueError):
+        # never stored, so the lookup below finds nothing
+        return b""
+
+
+def _not_found(entity_id: Union[str, UniqueEntityId]) -> NotFoundException:
+    return NotFoundException(f"Entity not found using ID '{entity_id}'")
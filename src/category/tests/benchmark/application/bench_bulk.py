@@ -0,0 +1,79 @@
+"""Run from src/: python -m category.tests.benchmark.application.bench_bulk [size]
+
+Deactivates `size` categories, half of them already inactive, and renames
+them, first one category at a time (load, change, save) and then with the
+bulk commands, against the in-memory and the SQLite repositories.
+"""
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+from category.application.bulk import BulkCategoryCommands
+from category.domain.entities import Category
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import CategorySqliteRepository
+
+
+def make_categories(size: int):
+    return Category.bulk_create(
+        {"name": f"Category {i}", "is_active": i % 2 == 0} for i in range(size)).entities
+
+
+def deactivate_each(repo, ids):
+    for entity_id in ids:
+        category = repo.find_by_id(entity_id)
+        category.deactivate()
+        repo.update(category)
+
+
+def rename_each(repo, ids):
+    for entity_id in ids:
+        category = repo.find_by_id(entity_id)
+        category.update(f"Renamed {category.name}", "Renamed in bulk")
+        repo.update(category)
+
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def bench_repository(label: str, make_repo, size: int):
+    print(f"\n{label}, {size} categories")
+    for operation, each, bulk in [
+        ("deactivate", deactivate_each,
+         lambda commands, ids: commands.deactivate_where()),
+        ("rename", rename_each,
+         lambda commands, ids: commands.bulk_update(
+             {entity_id: {"name": f"Renamed {entity_id[:8]}", "description": "Renamed in bulk"}
+              for entity_id in ids})),
+    ]:
+        times = []
+        for run in (each, bulk):
+            repo = make_repo()
+            categories = make_categories(size)
+            repo.bulk_insert(categories)
+            ids = [category.id for category in categories]
+            if run is each:
+                times.append(timed(partial(each, repo, ids)))
+            else:
+                times.append(timed(partial(bulk, BulkCategoryCommands(repo), ids)))
+            close = getattr(repo, "close", None)
+            if close is not None:
+                close()
+        print(f"  {operation:<10} one at a time {times[0] * 1e3:10.1f} ms   "
+              f"bulk {times[1] * 1e3:8.1f} ms   {times[0] / times[1]:5.1f}x")
+
+
+def bench_bulk(size: int):
+    bench_repository("in memory", CategoryInMemoryRepository, size)
+    with tempfile.TemporaryDirectory() as directory:
+        files = iter(range(4))
+        bench_repository("SQLite", lambda: CategorySqliteRepository(
+            os.path.join(directory, f"categories-{next(files)}.db")), size)
+
+
+if __name__ == "__main__":
+    bench_bulk(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
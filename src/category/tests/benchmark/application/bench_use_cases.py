@@ -0,0 +1,66 @@
+"""Run from src/: python -m category.tests.benchmark.application.bench_use_cases [requests] [concurrency] [size]
+
+Serves a mix of get / list / update / create requests from one event loop,
+`concurrency` at a time, with updates aimed at a small hot set of categories
+so many of them queue on the same entity lock. Latency is measured from
+the moment a request gets its concurrency slot.
+"""
+import asyncio
+import random
+import sys
+import time
+from __seedwork.application.dto import SearchInput
+from category.application.use_cases import (
+    CreateCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from category.domain.entities import Category
+from category.infra.repositories import CategoryAsyncInMemoryRepository
+
+HOT_SET = 10
+
+
+async def load_test(requests: int, concurrency: int, size: int):
+    repo = CategoryAsyncInMemoryRepository()
+    await repo.bulk_insert(Category.bulk_create(
+        {"name": f"Category {index}"} for index in range(size)).entities)
+    ids = list(repo.repository.items)
+    hot_ids = ids[:HOT_SET]
+    get, search = GetCategoryUseCase(repo), ListCategoriesUseCase(repo)
+    update, create = UpdateCategoryUseCase(repo), CreateCategoryUseCase(repo)
+    scenarios = [
+        (50, lambda: get.execute(GetCategoryUseCase.Input(random.choice(ids)))),
+        (20, lambda: search.execute(SearchInput(page=random.randrange(1, 50), sort="name"))),
+        (25, lambda: update.execute(UpdateCategoryUseCase.Input(
+            random.choice(hot_ids), is_active=random.random() < 0.5))),
+        (5, lambda: create.execute(CreateCategoryUseCase.Input(name="Benchmark"))),
+    ]
+    requests_to_run = random.choices([scenario for _, scenario in scenarios],
+                                     weights=[weight for weight, _ in scenarios], k=requests)
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def serve(request):
+        async with semaphore:
+            started = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(serve(request) for request in requests_to_run))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"\n{requests} requests, {concurrency} concurrent, {size} categories")
+    print(f"  throughput {requests / elapsed:12,.0f} req/s")
+    for percentile in (50, 99):
+        latency = latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)]
+        print(f"  p{percentile:<9} {latency * 1e6:12.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(load_test(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+                          int(sys.argv[2]) if len(sys.argv) > 2 else 5_000,
+                          int(sys.argv[3]) if len(sys.argv) > 3 else 100_000))
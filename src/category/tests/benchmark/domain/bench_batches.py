@@ -0,0 +1,48 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_batches [size]
+
+Compares the memory a CategoryBatch keeps with a list of the same
+categories, then the time it takes to rebuild them with building them
+through `Category.bulk_create`.
+"""
+import sys
+import time
+from __seedwork.tests.benchmark.runner import measure, retained_bytes
+from category.domain.batches import CategoryBatch
+from category.domain.entities import Category
+
+
+def make_categories(size: int):
+    return Category.bulk_create(
+        [{"name": f"Category {i}", "description": f"Description of category {i}",
+          "is_active": i % 3 != 0} for i in range(size)]
+    ).entities
+
+
+def bench_memory(size: int):
+    categories, entities_size = retained_bytes(
+        lambda: [category for category in make_categories(size) if category.id])
+    batch, batch_size = retained_bytes(lambda: CategoryBatch.from_entities(categories))
+
+    print(f"\nretained memory for {size} categories")
+    print(f"  list[Category]  {entities_size / size:8.1f} bytes/row")
+    print(f"  CategoryBatch   {batch_size / size:8.1f} bytes/row  "
+          f"({entities_size / batch_size:.1f}x smaller)")
+
+    started = time.perf_counter()
+    counts = batch.count_by_is_active()
+    batch.deactivate(batch.indices_where(True))
+    elapsed = time.perf_counter() - started
+    print(f"\ncount + deactivate all active ({counts[True]} rows): {elapsed * 1e3:.2f} ms")
+
+    rows = [{"name": category.name, "description": category.description,
+             "is_active": category.is_active} for category in categories]
+    print(f"\nbuilding {size} categories")
+    for label, build in [("Category.bulk_create", lambda: Category.bulk_create(rows)),
+                         ("CategoryBatch.to_entities", batch.to_entities),
+                         ("iter(CategoryBatch)", lambda: list(batch))]:
+        seconds = measure(build, repeat=3)
+        print(f"  {label:<26} {seconds / size * 1e6:6.2f} us/row")
+
+
+if __name__ == "__main__":
+    bench_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,48 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_codecs"""
+import json
+from datetime import datetime
+from __seedwork.domain import codecs
+from __seedwork.domain.serializers import JSON_BACKEND
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.tests.benchmark.runner import measure, report
+from category.domain.entities import Category
+
+SIZE = 10_000
+
+
+def from_dict(data):
+    """Rebuilding from `to_dict` output by hand, through the validating constructor."""
+    return Category(unique_entity_id=UniqueEntityId(data["id"]), name=data["name"],
+                    description=data["description"], is_active=data["is_active"],
+                    created_at=datetime.fromisoformat(data["created_at"]))
+
+
+def bench_codecs():
+    categories = Category.bulk_create(
+        [{"name": f"Category {i}", "description": "Some description"} for i in range(SIZE)]
+    ).entities
+    category = categories[0]
+    timings = {
+        "json.dumps(to_dict, default=str)": measure(
+            lambda: json.dumps(category.to_dict(), default=str), number=SIZE),
+        "codecs.encode": measure(lambda: codecs.encode(category), number=SIZE),
+        "codecs.encode_many (per item)": measure(lambda: codecs.encode_many(categories)),
+    }
+    report(f"encode one category, JSON backend: {JSON_BACKEND}", timings,
+           baseline="json.dumps(to_dict, default=str)", unit_count=SIZE)
+
+    encoded = json.dumps(category.to_dict(), default=str)
+    encoded_many = codecs.encode_many(categories)
+    timings = {
+        "json.loads + Category(...)": measure(lambda: from_dict(json.loads(encoded)),
+                                              number=SIZE),
+        "codecs.decode": measure(lambda: codecs.decode(encoded, Category), number=SIZE),
+        "codecs.decode_many (per item)": measure(
+            lambda: codecs.decode_many(encoded_many, Category)),
+    }
+    report("decode one category", timings,
+           baseline="json.loads + Category(...)", unit_count=SIZE)
+
+
+if __name__ == "__main__":
+    bench_codecs()
@@ -0,0 +1,28 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_entities"""
+from category.domain.entities import Category
+from __seedwork.tests.benchmark.runner import measure, report
+
+SIZE = 10_000
+
+
+def make_rows(size: int):
+    return [{"name": f"Category {i}", "description": "Some description", "is_active": i % 2 == 0}
+            for i in range(size)]
+
+
+def constructor_loop(rows):
+    return [Category(**row) for row in rows]
+
+
+def bench_bulk_create():
+    rows = make_rows(SIZE)
+    timings = {
+        "Category(**row) loop": measure(lambda: constructor_loop(rows)),
+        "Category.bulk_create": measure(lambda: Category.bulk_create(rows)),
+    }
+    report(f"bulk create ({SIZE} rows)", timings,
+           baseline="Category(**row) loop", unit_count=SIZE)
+
+
+if __name__ == "__main__":
+    bench_bulk_create()
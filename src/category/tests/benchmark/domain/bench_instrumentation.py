@@ -0,0 +1,61 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_instrumentation
+
+Prices instrumentation per call: the bare `enabled` check, each hot path
+with instrumentation off next to a copy of its code without the check, and
+the same path with instrumentation on.
+"""
+from __seedwork.domain.instrumentation import INSTRUMENTATION, MetricsRegistry
+from __seedwork.domain.serializers import serializer_for
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.tests.benchmark.runner import measure, report
+from category.domain.entities import Category
+from category.domain.validators import CATEGORY_RULES
+
+NUMBER = 100_000
+
+
+class Uninstrumented:
+    """The instrumented methods as they were before the checks."""
+
+    @classmethod
+    def validate(cls, name, description, is_active=None):
+        CATEGORY_RULES.validate(name, description, is_active)
+
+    @staticmethod
+    def to_dict(entity):
+        return serializer_for(type(entity))(entity)
+
+
+def bench_instrumentation():
+    category = Category(name="Movie", description="description")
+    id_value = category.id
+    scenarios = {
+        "Category.validate": (lambda: Uninstrumented.validate("Movie", "description", True),
+                              lambda: Category.validate("Movie", "description", True)),
+        "Entity.to_dict": (lambda: Uninstrumented.to_dict(category), category.to_dict),
+        "UniqueEntityId(id)": (None, lambda: UniqueEntityId(id_value)),
+        "Category(...)": (None, lambda: Category(name="Movie", description="description")),
+    }
+
+    check = {
+        "lambda: None": measure(lambda: None, number=NUMBER),
+        "lambda: INSTRUMENTATION.enabled": measure(lambda: INSTRUMENTATION.enabled,
+                                                   number=NUMBER),
+    }
+    report("the disabled check alone", check, baseline="lambda: None", unit_count=NUMBER)
+
+    for name, (direct, instrumented) in scenarios.items():
+        timings = {}
+        if direct is not None:
+            timings["without the check"] = measure(direct, number=NUMBER)
+        timings["instrumentation off"] = measure(instrumented, number=NUMBER)
+        INSTRUMENTATION.enable(MetricsRegistry())
+        try:
+            timings["instrumentation on"] = measure(instrumented, number=NUMBER)
+        finally:
+            INSTRUMENTATION.disable()
+        report(name, timings, baseline=next(iter(timings)), unit_count=NUMBER)
+
+
+if __name__ == "__main__":
+    bench_instrumentation()
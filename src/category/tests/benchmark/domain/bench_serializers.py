@@ -0,0 +1,41 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_serializers"""
+import json
+from dataclasses import asdict
+from __seedwork.domain.serializers import to_dicts, to_json_many
+from __seedwork.tests.benchmark.runner import measure, report
+from category.domain.entities import Category
+
+SIZE = 10_000
+
+
+def asdict_to_dict(entity):
+    """The former Entity.to_dict implementation."""
+    entity_dict = asdict(entity)
+    entity_dict.pop("unique_entity_id")
+    entity_dict["id"] = str(entity.unique_entity_id)
+    return entity_dict
+
+
+def bench_serializers():
+    categories = Category.bulk_create(
+        [{"name": f"Category {i}", "description": "Some description"} for i in range(SIZE)]
+    ).entities
+    timings = {
+        "asdict to_dict loop": measure(lambda: [asdict_to_dict(c) for c in categories]),
+        "Entity.to_dict loop": measure(lambda: [c.to_dict() for c in categories]),
+        "to_dicts": measure(lambda: to_dicts(categories)),
+    }
+    report(f"to_dict ({SIZE} categories)", timings,
+           baseline="asdict to_dict loop", unit_count=SIZE)
+
+    timings = {
+        "json.dumps(asdict, default=str)": measure(
+            lambda: json.dumps([asdict_to_dict(c) for c in categories], default=str).encode()),
+        "to_json_many": measure(lambda: to_json_many(categories)),
+    }
+    report(f"JSON bytes ({SIZE} categories)", timings,
+           baseline="json.dumps(asdict, default=str)", unit_count=SIZE)
+
+
+if __name__ == "__main__":
+    bench_serializers()
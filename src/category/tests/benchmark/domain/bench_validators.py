@@ -0,0 +1,108 @@
+"""Run from src/: python -m category.tests.benchmark.domain.bench_validators"""
+from django.conf import settings
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import ValidatorRules, error_fields
+from __seedwork.tests.benchmark.runner import measure, report
+from category.domain.entities import Category
+from category.domain.validators import CATEGORY_RULES, CategoryValidatorFactory
+
+NUMBER = 100_000
+# one valid row, then a missing name, a long name, a bad description and a bad flag
+ROWS = [("Movie", None, True), (None, None, True), ("m" * 256, None, True),
+        ("Movie", 5, True), ("Movie", None, "yes")]
+
+
+def validator_rules_chain(name, description, is_active):
+    """The former Category.validate implementation."""
+    ValidatorRules.values(name, "name").required().string().max_length(255)
+    ValidatorRules.values(description, "description").string()
+    ValidatorRules.values(is_active, "is_active").boolean()
+
+
+def bench_validate():
+    timings = {
+        "ValidatorRules chain": measure(
+            lambda: validator_rules_chain("Movie", "Some description", True), number=NUMBER),
+        "Category.validate (compiled)": measure(
+            lambda: Category.validate("Movie", "Some description", True), number=NUMBER),
+    }
+    report("validate on valid input", timings, baseline="ValidatorRules chain", unit_count=NUMBER)
+
+
+def raised_message(validate, row):
+    try:
+        validate(*row)
+    except ValidationException as exc:
+        return exc.args[0]
+    return None
+
+
+def collected_by_chain(name, description, is_active):
+    """Every field's first failure by the ValidatorRules chain, as collect returns them."""
+    errors = {}
+    for field, rules in [
+        ("name", lambda: ValidatorRules.values(name, "name").required().string().max_length(255)),
+        ("description", lambda: ValidatorRules.values(description, "description").string()),
+        ("is_active", lambda: ValidatorRules.values(is_active, "is_active").boolean()),
+    ]:
+        try:
+            rules()
+        except ValidationException as exc:
+            errors[field] = [exc.args[0]]
+    return errors
+
+
+def bench_invalid():
+    number = NUMBER // len(ROWS)
+    check = CATEGORY_RULES.check
+    timings = {
+        "ValidatorRules chain, raising": measure(
+            lambda: [raised_message(validator_rules_chain, row) for row in ROWS], number=number),
+        "compiled validate, raising": measure(
+            lambda: [raised_message(CATEGORY_RULES.validate, row) for row in ROWS],
+            number=number),
+        "compiled check": measure(lambda: [check(*row) for row in ROWS], number=number),
+        "compiled check, message": measure(
+            lambda: [error and error.message for error in map(check, *zip(*ROWS))],
+            number=number),
+    }
+    report("first failure, 4 of 5 rows invalid", timings,
+           baseline="ValidatorRules chain, raising", unit_count=number * len(ROWS))
+
+    timings = {
+        "ValidatorRules chain, raising": measure(
+            lambda: [collected_by_chain(*row) for row in ROWS], number=number),
+        "compiled collect": measure(
+            lambda: [CATEGORY_RULES.collect(*row) for row in ROWS], number=number),
+        "error_fields(check_all)": measure(
+            lambda: [error_fields(CATEGORY_RULES.check_all(*row)) for row in ROWS],
+            number=number),
+    }
+    report("ErrorFields, 4 of 5 rows invalid", timings,
+           baseline="ValidatorRules chain, raising", unit_count=number * len(ROWS))
+
+    rows = [dict(zip(("name", "description", "is_active"), ROWS[i % len(ROWS)]))
+            for i in range(10_000)]
+    timings = {"Category.bulk_create": measure(lambda: Category.bulk_create(rows), repeat=5)}
+    report("Category.bulk_create, 10,000 rows, 4 of 5 invalid", timings,
+           baseline="Category.bulk_create", unit_count=len(rows))
+
+
+def bench_validator_fields():
+    if not settings.configured:
+        settings.configure(USE_I18N=False)
+    data = {"name": "Movie", "description": "Some description", "is_active": True}
+    fast, drf = CategoryValidatorFactory.create(), CategoryValidatorFactory.create(use_drf=True)
+    number = NUMBER // 10
+    timings = {
+        "CategoryDRFValidator": measure(lambda: drf.validate(data), number=number),
+        "CategoryValidator": measure(lambda: fast.validate(data), number=number),
+    }
+    report("validator fields on valid dict", timings,
+           baseline="CategoryDRFValidator", unit_count=number)
+
+
+if __name__ == "__main__":
+    bench_validate()
+    bench_invalid()
+    bench_validator_fields()
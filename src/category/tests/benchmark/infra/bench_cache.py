@@ -0,0 +1,45 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_cache [size] [hot_ids]
+
+Reads categories by id from a SQLite repository, with and without the
+read-through cache, where 95% of reads go to `hot_ids` categories.
+"""
+import os
+import random
+import sys
+import tempfile
+from __seedwork.domain.cache import CachedSearchableRepository, EntityCache
+from __seedwork.tests.benchmark.runner import report, measure
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+READS = 50_000
+
+
+def bench_cache(size: int, hot_ids: int):
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CategorySqliteRepository(os.path.join(directory, "categories.db"))
+        repo.bulk_insert(Category.bulk_create(
+            {"name": f"Category {index}"} for index in range(size)).entities)
+        ids = [category.id for category in repo.find_all()]
+        hot = ids[:hot_ids]
+        reads = [random.choice(hot) if random.random() < 0.95 else random.choice(ids)
+                 for _ in range(READS)]
+        cached = CachedSearchableRepository(repo, EntityCache(maxsize=2 * hot_ids, ttl=60))
+
+        def read_all(target):
+            for entity_id in reads:
+                target.find_by_id(entity_id)
+
+        timings = {
+            "sqlite find_by_id": measure(lambda: read_all(repo), repeat=3),
+            "cached find_by_id": measure(lambda: read_all(cached), repeat=3),
+        }
+        report(f"{READS} reads, {size} categories, 95% on {hot_ids} ids",
+               timings, "sqlite find_by_id", READS)
+        print(f"  {cached.cache.stats}")
+        repo.close()
+
+
+if __name__ == "__main__":
+    bench_cache(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+                int(sys.argv[2]) if len(sys.argv) > 2 else 5_000)
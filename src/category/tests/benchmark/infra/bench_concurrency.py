@@ -0,0 +1,123 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_concurrency [threads] [categories]
+
+Many threads rename a few hot categories stored in SQLite: load one, spend
+`WORK` seconds deciding (validation, a remote call), save it. Compares
+saving under one global lock, under a lock per category, and optimistic
+compare-and-set retried on conflicts, with plain unguarded updates as the
+reference that loses writes. Lost updates are the renames missing from the
+stored versions at the end.
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from __seedwork.domain.exceptions import ConflictException
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+OPERATIONS = 200
+WORK = 0.0002
+
+
+def rename(repo, entity_id: str, name: str) -> None:
+    category = repo.find_by_id(entity_id)
+    time.sleep(WORK)
+    category.update(name, None)
+    repo.update(category)
+
+
+def global_lock():
+    lock = threading.Lock()
+
+    def save(repo, entity_id: str, name: str) -> int:
+        with lock:
+            rename(repo, entity_id, name)
+        return 0
+    return save
+
+
+def lock_per_category():
+    locks = defaultdict(threading.Lock)
+
+    def save(repo, entity_id: str, name: str) -> int:
+        with locks[entity_id]:
+            rename(repo, entity_id, name)
+        return 0
+    return save
+
+
+def compare_and_set():
+    def save(repo, entity_id: str, name: str) -> int:
+        retries = 0
+        while True:
+            category = repo.find_by_id(entity_id)
+            expected_version = category.version
+            time.sleep(WORK)
+            category.update(name, None)
+            try:
+                repo.compare_and_set(category, expected_version)
+                return retries
+            except ConflictException:
+                retries += 1
+    return save
+
+
+def unguarded():
+    def save(repo, entity_id: str, name: str) -> int:
+        rename(repo, entity_id, name)
+        return 0
+    return save
+
+
+STRATEGIES = {
+    "global lock": global_lock,
+    "lock per category": lock_per_category,
+    "compare-and-set": compare_and_set,
+    "unguarded (loses writes)": unguarded,
+}
+
+
+def run(strategy, threads: int, size: int):
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CategorySqliteRepository(os.path.join(directory, "categories.db"))
+        categories = [Category(name=f"Category {i}") for i in range(size)]
+        repo.bulk_insert(categories)
+        ids = [category.id for category in categories]
+        save = strategy()
+        retries = [0] * threads
+        start = threading.Barrier(threads + 1)
+
+        def worker(number: int):
+            picks = random.Random(number)
+            start.wait()
+            for operation in range(OPERATIONS):
+                retries[number] += save(repo, picks.choice(ids), f"Renamed {number}-{operation}")
+
+        workers = [threading.Thread(target=worker, args=(number,)) for number in range(threads)]
+        for thread in workers:
+            thread.start()
+        start.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        lost = threads * OPERATIONS - sum(category.version for category in repo.find_all())
+        repo.close()
+    return threads * OPERATIONS / elapsed, sum(retries), lost
+
+
+def bench_concurrency(threads: int, size: int):
+    print(f"\n{threads} threads renaming {size} categories, {OPERATIONS} renames each, "
+          f"{WORK * 1e6:.0f} us of work per rename")
+    print(f"  {'strategy':<26} {'renames/s':>10} {'retries':>8} {'lost':>6}")
+    for name, strategy in STRATEGIES.items():
+        throughput, retries, lost = run(strategy, threads, size)
+        print(f"  {name:<26} {throughput:>10,.0f} {retries:>8} {lost:>6}")
+
+
+if __name__ == "__main__":
+    bench_concurrency(int(sys.argv[1]) if len(sys.argv) > 1 else 16,
+                      int(sys.argv[2]) if len(sys.argv) > 2 else 64)
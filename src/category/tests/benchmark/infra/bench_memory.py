@@ -0,0 +1,77 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_memory [size]
+
+Retained bytes per `Category` loaded with and without an `Interner`, on a
+synthetic catalog shaped like a multi-tenant one: names come from a shared
+vocabulary of 2,000, descriptions from 200 templates and timestamps from 50
+import batches, so most values repeat. Categories are loaded the way large
+catalogs are, from JSON lines through `import_categories` and back from
+SQLite through `find_all`; every string and datetime they hold is a fresh
+object. The interner's own pool is included in its numbers.
+"""
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from __seedwork.domain.interning import Interner
+from __seedwork.tests.benchmark.runner import retained_bytes
+from category.infra.pipelines import import_categories, read_jsonl
+from category.infra.sqlite import CategorySqliteRepository
+
+NAMES = 2_000
+DESCRIPTIONS = 200
+BATCHES = 50
+
+
+def make_jsonl(size: int) -> str:
+    random.seed(42)
+    names = [f"{random.choice(['Action', 'Drama', 'Kids', 'Docs', 'Live'])} {i}"
+             for i in range(NAMES)]
+    descriptions = [f"Titles curated for the {i} collection, refreshed every week"
+                    for i in range(DESCRIPTIONS)] + [None]
+    start = datetime(2022, 1, 1)
+    batches = [(start + timedelta(days=i)).isoformat() for i in range(BATCHES)]
+    return "".join(json.dumps({"name": random.choice(names),
+                               "description": random.choice(descriptions),
+                               "is_active": random.random() < 0.9,
+                               "created_at": random.choice(batches)}) + "\n"
+                   for _ in range(size))
+
+
+def load_jsonl(text: str, interner=None):
+    return [category for chunk in import_categories(read_jsonl(io.StringIO(text)),
+                                                    interner=interner)
+            for category in chunk.entities]
+
+
+def bench_memory(size: int):
+    text = make_jsonl(size)
+    print(f"\nretained memory per category, {size} categories")
+    categories, plain = retained_bytes(lambda: load_jsonl(text))
+    _, interned = retained_bytes(lambda: load_jsonl(text, Interner()))
+    report("import_categories", plain, interned, size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "categories.db")
+        writer = CategorySqliteRepository(database)
+        writer.bulk_insert(categories)
+        writer.close()
+        del categories
+        plain_repo = CategorySqliteRepository(database)
+        interned_repo = CategorySqliteRepository(database, interner=Interner())
+        _, plain = retained_bytes(plain_repo.find_all)
+        _, interned = retained_bytes(interned_repo.find_all)
+        report("find_all", plain, interned, size)
+        plain_repo.close()
+        interned_repo.close()
+
+
+def report(title: str, plain: int, interned: int, size: int):
+    print(f"  {title:<20} {plain / size:8.1f} -> {interned / size:8.1f} bytes/category  "
+          f"({plain / interned:.2f}x smaller)")
+
+
+if __name__ == "__main__":
+    bench_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
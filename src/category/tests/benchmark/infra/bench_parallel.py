@@ -0,0 +1,56 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_parallel [rows] [max_workers]
+
+Imports a generated JSONL file with the serial pipeline, then with the
+parallel import for 1..max_workers processes (defaults to the CPU count),
+and prints what the parent spends per row cutting the file into chunks:
+the parallel import cannot go faster than that, whatever the worker count.
+Throughput only rises with `workers` up to the number of CPUs.
+"""
+import os
+import pickle
+import sys
+import tempfile
+import time
+from category.domain.batches import CategoryBatch
+from category.infra.cli import generate
+from category.infra.parallel import _text_chunks, parallel_import_batches
+from category.infra.pipelines import import_categories, read_jsonl
+
+CHUNK_SIZE = 10_000
+
+
+def throughput(path: str, rows: int, consume) -> float:
+    with open(path, encoding="utf-8", newline="") as file:
+        started = time.perf_counter()
+        consume(file)
+        return rows / (time.perf_counter() - started)
+
+
+def bench_parallel(rows: int, max_workers: int):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "categories.jsonl")
+        generate(path, rows, invalid_every=20)
+        serial = throughput(path, rows, lambda file: sum(
+            len(chunk.entities) + len(chunk.rejected)
+            for chunk in import_categories(read_jsonl(file), CHUNK_SIZE)))
+        parent = throughput(path, rows, lambda file: sum(
+            1 for _ in _text_chunks(file, CHUNK_SIZE, False, 1)))
+        print(f"\n{rows} rows, chunks of {CHUNK_SIZE}, {os.cpu_count()} CPUs")
+        print(f"  serial     {serial:12,.0f} rows/s")
+        print(f"  parent     {parent:12,.0f} rows/s  {1e6 / parent:.2f} us/row cutting chunks")
+        for workers in range(1, max_workers + 1):
+            parallel = throughput(path, rows, lambda file, workers=workers: sum(
+                len(batch) + len(rejected) for batch, rejected in
+                parallel_import_batches(file, workers=workers, chunk_size=CHUNK_SIZE)))
+            print(f"  {workers:2} workers {parallel:12,.0f} rows/s  {parallel / serial:5.2f}x")
+
+        with open(path, encoding="utf-8", newline="") as file:
+            chunk = next(import_categories(read_jsonl(file), CHUNK_SIZE))
+    print(f"\npickled chunk of {CHUNK_SIZE}: "
+          f"list[Category] {len(pickle.dumps(chunk.entities)) / 1024:,.0f} KiB, "
+          f"CategoryBatch {len(pickle.dumps(CategoryBatch.from_entities(chunk.entities))) / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    bench_parallel(int(sys.argv[1]) if len(sys.argv) > 1 else 400_000,
+                   int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1)
@@ -0,0 +1,27 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_pipelines [rows]
+
+Streams a synthetic multi-million-row file through the import pipeline and
+reports throughput and the process peak RSS, which should not grow with the
+number of rows.
+"""
+import os
+import resource
+import sys
+import tempfile
+from category.infra import cli
+
+
+def bench_import(rows: int):
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ("jsonl", "csv"):
+            path = os.path.join(directory, f"categories.{extension}")
+            cli.generate(path, rows, invalid_every=100)
+            output = os.path.join(directory, f"valid.{extension}")
+            stats = cli.run_import(path, chunk_size=10_000, output=output, rejected=None)
+            peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{extension:>5}: {stats['rows']} rows, {stats['rejected']} rejected, "
+                  f"{stats['rows_per_second']:,.0f} rows/s, peak RSS {peak_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    bench_import(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
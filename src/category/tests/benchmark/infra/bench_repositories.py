@@ -0,0 +1,52 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_repositories [size]"""
+import random
+import sys
+import time
+from __seedwork.domain.repositories import SearchParams
+from __seedwork.tests.benchmark.runner import measure
+from category.domain.entities import Category
+from category.infra.repositories import CategoryInMemoryRepository
+
+QUERIES = 200
+
+
+def build_repository(size: int) -> CategoryInMemoryRepository:
+    rows = [{"name": f"Category {random.randrange(size):08}"} for _ in range(size)]
+    repo = CategoryInMemoryRepository()
+    started = time.perf_counter()
+    repo.bulk_insert(Category.bulk_create(rows).entities)
+    print(f"bulk_insert {size} categories: {time.perf_counter() - started:.2f}s")
+    return repo
+
+
+def bench_search(size: int):
+    repo = build_repository(size)
+    pages = size // 15
+    scenarios = {
+        "find_by_id": lambda ids: repo.find_by_id(random.choice(ids)),
+        "default sort, random page": lambda _: repo.search(
+            SearchParams(page=random.randrange(1, pages))),
+        "sort by name, random page": lambda _: repo.search(
+            SearchParams(sort="name", sort_dir=random.choice(["asc", "desc"]),
+                         page=random.randrange(1, pages))),
+        "filter by name prefix": lambda _: repo.search(
+            SearchParams(filter=f"category {random.randrange(size):08}"[:-2], sort="name")),
+        "insert + update + delete": lambda _: _write_cycle(repo),
+    }
+    ids = list(repo.items)
+    print(f"\nper query at {size} categories")
+    for name, scenario in scenarios.items():
+        seconds = measure(lambda scenario=scenario: scenario(ids), number=QUERIES)
+        print(f"  {name:<28} {seconds / QUERIES * 1e6:10.1f} us/op")
+
+
+def _write_cycle(repo: CategoryInMemoryRepository):
+    category = Category(name="Benchmark")
+    repo.insert(category)
+    category.update("Benchmark updated", None)
+    repo.update(category)
+    repo.delete(category.id)
+
+
+if __name__ == "__main__":
+    bench_search(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
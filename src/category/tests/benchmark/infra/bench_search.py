@@ -0,0 +1,84 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_search [size]
+
+Indexes `size` categories whose names and descriptions draw words from a
+30k-word vocabulary, then times type-ahead queries built from real
+categories: a whole word, a 3-letter prefix, and a word plus a prefix.
+Incremental updates and deletes are timed on the full index.
+"""
+import random
+import string
+import sys
+import time
+import tracemalloc
+from category.domain.entities import Category
+from category.infra.search import CategorySearchIndex
+
+VOCABULARY = 30_000
+QUERIES = 2_000
+
+
+def make_vocabulary(size: int):
+    random.seed(42)
+    words = set()
+    while len(words) < size:
+        words.add("".join(random.choices(string.ascii_lowercase, k=random.randint(4, 10))))
+    return sorted(words)
+
+
+def make_categories(size: int, words):
+    rows = ({"name": " ".join(random.choices(words, k=random.randint(1, 3))).title(),
+             "description": " ".join(random.choices(words, k=random.randint(3, 8)))}
+            for _ in range(size))
+    return Category.bulk_create(rows).entities
+
+
+def percentile(timings, percent: int) -> float:
+    return sorted(timings)[min(len(timings) - 1, len(timings) * percent // 100)]
+
+
+def bench_search(size: int):
+    words = make_vocabulary(VOCABULARY)
+    categories = make_categories(size, words)
+    tracemalloc.start()
+    measured = CategorySearchIndex()
+    measured.bulk_add(categories)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del measured
+    index = CategorySearchIndex()
+    started = time.perf_counter()
+    index.bulk_add(categories)
+    elapsed = time.perf_counter() - started
+    print(f"\nindexed {size} categories in {elapsed:.1f}s, {memory / 2 ** 20:.0f} MiB")
+
+    samples = random.sample(categories, QUERIES)
+    queries = {
+        "whole word": [category.name.split()[0] for category in samples],
+        "3-letter prefix": [category.name.split()[0][:3] for category in samples],
+        "word + prefix": [f"{category.name.split()[0]} {category.description.split()[0][:4]}"
+                          for category in samples],
+    }
+    print(f"per query ({QUERIES} queries each)")
+    for name, texts in queries.items():
+        timings, totals = [], []
+        for text in texts:
+            started = time.perf_counter()
+            result = index.search(text)
+            timings.append(time.perf_counter() - started)
+            totals.append(result.total)
+        print(f"  {name:<16} p50 {percentile(timings, 50) * 1e3:7.3f} ms  "
+              f"p99 {percentile(timings, 99) * 1e3:7.3f} ms  "
+              f"median hits {percentile(totals, 50)}")
+
+    started = time.perf_counter()
+    for category in samples:
+        category.update(f"{category.name} Renamed", category.description)
+        index.add(category)
+    for category in samples[:QUERIES // 2]:
+        index.remove(category.id)
+    elapsed = time.perf_counter() - started
+    print(f"  {QUERIES} updates + {QUERIES // 2} deletes: {elapsed / (1.5 * QUERIES) * 1e6:.1f} us/op")
+
+
+if __name__ == "__main__":
+    bench_search(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,202 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_sharding [threads] [size]
+
+Many threads find, rename and create categories in a sharded store of SQLite
+files, one file per shard, for 1 to 8 shards. Each shard serializes its own
+calls, so throughput grows with the shard count as long as the time spent
+inside a shard is not spent holding the GIL: `LATENCY` stands for the round
+trip to a database server and is slept while the shard is held, 0 runs the
+files alone. The last lines time a scatter-gather search, searches mixed
+with writes (against a store locking every shard for the whole search, as
+searches used to) and the online move of entities to a shard added under
+load.
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+from __seedwork.domain.repositories import SearchParams
+from __seedwork.domain.sharding import ShardedSearchableRepository
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+OPERATIONS = 300
+LATENCIES = (0.0, 0.0005)
+
+
+@dataclass(slots=True)
+class RemoteCategoryRepository(CategorySqliteRepository):
+    """A SQLite file answering after `latency` seconds, like a server would."""
+    latency: float = 0.0
+
+    def find_by_id(self, entity_id):
+        time.sleep(self.latency)
+        return CategorySqliteRepository.find_by_id(self, entity_id)
+
+    def insert(self, entity):
+        time.sleep(self.latency)
+        CategorySqliteRepository.insert(self, entity)
+
+    def update(self, entity):
+        time.sleep(self.latency)
+        CategorySqliteRepository.update(self, entity)
+
+    def search(self, input_params):
+        time.sleep(self.latency)
+        return CategorySqliteRepository.search(self, input_params)
+
+
+class LockAllShardsRepository(ShardedSearchableRepository):
+    """Holds every shard for the whole of a search, so writes wait for it."""
+
+    def _read_shards(self, read: Callable) -> List:
+        names = sorted(self.shards)
+        with self._locked(names):
+            return [read(self.shards[name]) for name in names]
+
+
+def make_store(directory: str, shards: int, latency: float,
+               store=ShardedSearchableRepository) -> ShardedSearchableRepository:
+    return store({
+        f"shard-{number}": RemoteCategoryRepository(
+            os.path.join(directory, f"shard-{number}.db"), latency=latency)
+        for number in range(shards)})
+
+
+def close(store: ShardedSearchableRepository) -> None:
+    for shard in store.shards.values():
+        shard.close()
+
+
+def run(store: ShardedSearchableRepository, ids, threads: int, during=None) -> float:
+    start = threading.Barrier(threads + 1)
+
+    def worker(number: int):
+        picks = random.Random(number)
+        start.wait()
+        for operation in range(OPERATIONS):
+            choice = operation % 10
+            if choice < 6:
+                store.find_by_id(picks.choice(ids))
+            elif choice < 9:
+                category = store.find_by_id(picks.choice(ids))
+                category.update(f"Renamed {number}-{operation}", None)
+                store.update(category)
+            else:
+                store.insert(Category(name=f"New {number}-{operation}"))
+
+    workers = [threading.Thread(target=worker, args=(number,)) for number in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    if during is not None:
+        during()
+    for thread in workers:
+        thread.join()
+    return threads * OPERATIONS / (time.perf_counter() - started)
+
+
+def bench_throughput(threads: int, size: int, latency: float):
+    print(f"\n{threads} threads, {size} categories, {OPERATIONS} operations each "
+          f"(60% find, 30% rename, 10% insert), {latency * 1e3:.1f} ms per shard call")
+    print(f"  {'shards':>6} {'ops/s':>10} {'speedup':>8}")
+    baseline = None
+    for shards in (1, 2, 4, 8):
+        with tempfile.TemporaryDirectory() as directory:
+            store = make_store(directory, shards, latency)
+            categories = Category.bulk_create(
+                {"name": f"Category {i}"} for i in range(size)).entities
+            store.bulk_insert(categories)
+            throughput = run(store, [category.id for category in categories], threads)
+            close(store)
+        baseline = baseline or throughput
+        print(f"  {shards:>6} {throughput:>10,.0f} {throughput / baseline:>7.1f}x")
+
+
+def run_mixed(store: ShardedSearchableRepository, ids, threads: int) -> Tuple[float, float]:
+    """Searches and renames per second, a quarter of the threads searching."""
+    searchers = threads // 4
+    counts = [0, 0]
+    start = threading.Barrier(threads + 1)
+
+    def searcher(number: int):
+        start.wait()
+        for operation in range(OPERATIONS // 10):
+            store.search(SearchParams(page=1 + (number + operation) % 5, per_page=15,
+                                      sort="name"))
+            counts[0] += 1
+
+    def writer(number: int):
+        picks = random.Random(number)
+        start.wait()
+        for operation in range(OPERATIONS):
+            category = store.find_by_id(picks.choice(ids))
+            category.update(f"Renamed {number}-{operation}", None)
+            store.update(category)
+            counts[1] += 1
+
+    workers = [threading.Thread(target=searcher if number < searchers else writer,
+                                args=(number,)) for number in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return counts[0] / elapsed, counts[1] / elapsed
+
+
+def bench_search_under_writes(threads: int, size: int, latency: float):
+    print(f"\n  {threads // 4} threads searching and {threads - threads // 4} renaming "
+          f"over 4 shards, {latency * 1e3:.1f} ms per shard call")
+    print(f"  {'search locks':>18} {'searches/s':>11} {'renames/s':>10}")
+    for label, store_class in [("one shard", ShardedSearchableRepository),
+                               ("every shard", LockAllShardsRepository)]:
+        with tempfile.TemporaryDirectory() as directory:
+            store = make_store(directory, 4, latency, store_class)
+            categories = Category.bulk_create(
+                {"name": f"Category {i}"} for i in range(size)).entities
+            store.bulk_insert(categories)
+            searches, renames = run_mixed(store, [category.id for category in categories],
+                                          threads)
+            close(store)
+        print(f"  {label:>18} {searches:>11,.0f} {renames:>10,.0f}")
+
+
+def bench_search_and_rebalance(threads: int, size: int, latency: float):
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory, 4, latency)
+        categories = Category.bulk_create(
+            {"name": f"Category {i}"} for i in range(size)).entities
+        store.bulk_insert(categories)
+        started = time.perf_counter()
+        for page in range(1, 11):
+            store.search(SearchParams(page=page, per_page=15, sort="name"))
+        search_time = (time.perf_counter() - started) / 10
+        print(f"\n  search over 4 shards, pages 1 to 10  {search_time * 1e3:8.2f} ms per page")
+
+        moved = []
+
+        def add_shard():
+            started = time.perf_counter()
+            moved.append(store.add_shard("shard-4", RemoteCategoryRepository(
+                os.path.join(directory, "shard-4.db"), latency=latency)))
+            moved.append(time.perf_counter() - started)
+        throughput = run(store, [category.id for category in categories], threads, add_shard)
+        print(f"  adding a 5th shard under load        {moved[1] * 1e3:8.2f} ms to move "
+              f"{moved[0]} categories, {throughput:,.0f} ops/s meanwhile")
+        close(store)
+
+
+if __name__ == "__main__":
+    THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    for LATENCY in LATENCIES:
+        bench_throughput(THREADS, SIZE, LATENCY)
+    bench_search_under_writes(THREADS, SIZE, LATENCIES[-1])
+    bench_search_and_rebalance(THREADS, SIZE, LATENCIES[-1])
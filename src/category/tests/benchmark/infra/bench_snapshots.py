@@ -0,0 +1,66 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_snapshots [size]
+
+Cold start of a worker holding `size` categories: reloading them from a JSON
+export with the trusted codec against opening a binary snapshot, with and
+without the checksum, then reading one category and all of them.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from functools import partial
+from __seedwork.domain import codecs
+from category.domain.entities import Category
+from category.infra.snapshots import CategorySnapshot, write_snapshot
+
+
+def make_categories(size: int):
+    return Category.bulk_create(
+        {"name": f"Category {i}", "description": f"Description of category {i}",
+         "is_active": i % 3 != 0} for i in range(size)).entities
+
+
+def timed(func):
+    started = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - started
+
+
+def bench_snapshots(size: int):
+    categories = make_categories(size)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "categories.json")
+        snapshot_path = os.path.join(directory, "categories.snap")
+        with open(json_path, "wb") as file:
+            file.write(codecs.encode_many(categories))
+        _, write_time = timed(lambda: write_snapshot(snapshot_path, categories))
+        del categories
+        print(f"\n{size} categories: JSON {os.path.getsize(json_path) / 2 ** 20:.1f} MiB, "
+              f"snapshot {os.path.getsize(snapshot_path) / 2 ** 20:.1f} MiB "
+              f"written in {write_time * 1e3:.0f} ms")
+
+        def reload_json():
+            with open(json_path, "rb") as file:
+                return codecs.decode_many(file.read(), Category)
+        _, json_time = timed(reload_json)
+        print(f"  JSON reload, all entities      {json_time * 1e3:10.2f} ms")
+
+        for verify in (True, False):
+            snapshot, open_time = timed(partial(CategorySnapshot.open, snapshot_path, verify))
+            print(f"  snapshot open, verify={verify!s:<5}   {open_time * 1e3:10.2f} ms  "
+                  f"({json_time / open_time:,.0f}x faster)")
+            snapshot.close()
+
+        with CategorySnapshot.open(snapshot_path) as snapshot:
+            index = random.randrange(size)
+            _, first_time = timed(lambda: snapshot[index])
+            _, entities_time = timed(snapshot.to_entities)
+            _, lookup_time = timed(lambda: snapshot.find_by_id(snapshot[index].id))
+        print(f"  snapshot, one category         {first_time * 1e6:10.2f} us")
+        print(f"  snapshot, all entities         {entities_time * 1e3:10.2f} ms")
+        print(f"  snapshot, first find_by_id     {lookup_time * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    bench_snapshots(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,53 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_sqlite [size]
+
+Bulk inserts `size` categories into a temporary SQLite file, then reads
+pages deep into the default order by OFFSET and by keyset cursor.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from __seedwork.domain.repositories import SearchParams
+from __seedwork.tests.benchmark.runner import measure
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+BATCH = 50_000
+QUERIES = 50
+
+
+def bench_sqlite(size: int):
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CategorySqliteRepository(os.path.join(directory, "categories.db"))
+        started = time.perf_counter()
+        for start in range(0, size, BATCH):
+            repo.bulk_insert(Category.bulk_create(
+                {"name": f"Category {random.randrange(size):08}"}
+                for _ in range(min(BATCH, size - start))).entities)
+        elapsed = time.perf_counter() - started
+        print(f"\nbulk_insert {size} categories: {elapsed:.2f}s, {size / elapsed:,.0f} rows/s")
+
+        ids = [category.id for category in repo.search(SearchParams(per_page=1000)).items]
+        last_page = size // 15
+        deep_page = repo.search(SearchParams(page=last_page - 1))
+        scenarios = {
+            "find_by_id": lambda: repo.find_by_id(random.choice(ids)),
+            "first page": lambda: repo.search(SearchParams()),
+            f"page {last_page - 1} by OFFSET": lambda: repo.search(SearchParams(page=last_page - 1)),
+            f"page {last_page} by cursor": lambda: repo.search(
+                SearchParams(cursor=deep_page.next_cursor)),
+            "sort by name, page 1000 by OFFSET": lambda: repo.search(
+                SearchParams(sort="name", page=1000)),
+            "filter by name prefix": lambda: repo.search(
+                SearchParams(filter=f"category {random.randrange(size):08}"[:-2], sort="name")),
+        }
+        print(f"per query at {size} categories")
+        for name, scenario in scenarios.items():
+            seconds = measure(scenario, number=QUERIES, repeat=3)
+            print(f"  {name:<36} {seconds / QUERIES * 1e3:10.3f} ms/op")
+        repo.close()
+
+
+if __name__ == "__main__":
+    bench_sqlite(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
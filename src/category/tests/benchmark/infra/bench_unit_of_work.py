@@ -0,0 +1,60 @@
+"""Run from src/: python -m category.tests.benchmark.infra.bench_unit_of_work [size] [touched]
+
+One request loads `touched` categories from a SQLite file of `size`: a third
+is renamed, a third deactivated or reactivated and a third left as it was.
+Saving each with `update` rewrites every row in its own transaction; the
+unit of work sends the changed columns in one transaction.
+"""
+import itertools
+import os
+import random
+import sys
+import tempfile
+from __seedwork.domain.unit_of_work import UnitOfWork
+from __seedwork.tests.benchmark.runner import measure, report
+from category.domain.entities import Category
+from category.infra.sqlite import CategorySqliteRepository
+
+
+def bench_unit_of_work(size: int, touched: int):
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CategorySqliteRepository(os.path.join(directory, "categories.db"))
+        repo.bulk_insert(Category.bulk_create(
+            {"name": f"Category {index}"} for index in range(size)).entities)
+        ids = [category.id for category in repo.find_all()]
+        rounds = itertools.count()
+
+        def change(category: Category, position: int, round_number: int) -> None:
+            if position % 3 == 0:
+                category.update(f"Category {round_number}", category.description)
+            elif position % 3 == 1:
+                if round_number % 2:
+                    category.deactivate()
+                else:
+                    category.activate()
+            else:
+                category.update(category.name, category.description)
+
+        def save_each():
+            round_number = next(rounds)
+            for position, entity_id in enumerate(random.sample(ids, touched)):
+                category = repo.find_by_id(entity_id)
+                change(category, position, round_number)
+                repo.update(category)
+
+        def unit_of_work():
+            round_number = next(rounds)
+            with UnitOfWork(repo) as uow:
+                for position, entity_id in enumerate(random.sample(ids, touched)):
+                    change(uow.get(entity_id), position, round_number)
+
+        report(f"saving {touched} touched categories out of {size}",
+               {"update per category": measure(save_each, repeat=5),
+                "unit of work": measure(unit_of_work, repeat=5)},
+               baseline="update per category", unit_count=touched)
+        repo.close()
+
+
+if __name__ == "__main__":
+    bench_unit_of_work(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+                       int(sys.argv[2]) if len(sys.argv) > 2 else 500)
@@ -0,0 +1,178 @@
+"""Run from src/: python -m category.tests.benchmark.suite [--save] [--threshold 0.25] ...
+
+Profiles the domain hot paths at several input sizes: throughput, latency
+percentiles and allocations (see `runner.profile`). Results are compared
+with the JSON baseline and the run exits with status 1 when a metric got
+worse by more than the threshold; `--save` records the run as the new
+baseline instead. Baselines only compare on the machine that made them, so
+none is committed: without one nothing is gated and the run exits with
+status 2 (`NO_BASELINE`), never passing silently.
+Tail latencies are noisier than the rest, so they get looser thresholds
+by default (`TAIL_THRESHOLDS`, override with `--metric-threshold p99_us=0.5`).
+"""
+import argparse
+import itertools
+import os
+import sys
+from dataclasses import fields
+from typing import Callable, Dict, List
+from __seedwork.domain.serializers import to_dicts
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.tests.benchmark.runner import (
+    Measurement,
+    compare,
+    load_baseline,
+    profile,
+    save_baseline
+)
+from category.domain.entities import Category
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+SIZES = (1, 100, 10_000)
+TAIL_THRESHOLDS = {"p90_us": 0.5, "p99_us": 1.0}
+# exit status of a run that had no baseline to compare with
+NO_BASELINE = 2
+
+
+def make_rows(size: int) -> List[dict]:
+    return [{"name": f"Category {i}", "description": "Some description", "is_active": i % 2 == 0}
+            for i in range(size)]
+
+
+def make_categories(size: int) -> List[Category]:
+    return Category.bulk_create(make_rows(size)).entities
+
+
+def unique_entity_ids(size: int) -> Callable[[], object]:
+    return lambda: [UniqueEntityId() for _ in range(size)]
+
+
+def generate_many(size: int) -> Callable[[], object]:
+    return lambda: UniqueEntityId.generate_many(size)
+
+
+def constructor(size: int) -> Callable[[], object]:
+    rows = make_rows(size)
+    return lambda: [Category(**row) for row in rows]
+
+
+def bulk_create(size: int) -> Callable[[], object]:
+    rows = make_rows(size)
+    return lambda: Category.bulk_create(rows)
+
+
+def validate(size: int) -> Callable[[], object]:
+    rows = make_rows(size)
+    return lambda: [Category.validate(row["name"], row["description"], row["is_active"])
+                    for row in rows]
+
+
+def to_dict(size: int) -> Callable[[], object]:
+    categories = make_categories(size)
+    return lambda: [category.to_dict() for category in categories]
+
+
+def to_dicts_batch(size: int) -> Callable[[], object]:
+    categories = make_categories(size)
+    return lambda: to_dicts(categories)
+
+
+def update(size: int) -> Callable[[], object]:
+    """Every call renames each category, then pulls its event like a use case does."""
+    categories = make_categories(size)
+    names = itertools.cycle(["Movie", "Series"])
+
+    def run():
+        name = next(names)
+        for category in categories:
+            category.update(name, "Some description")
+            category.pull_events()
+    return run
+
+
+def activate(size: int) -> Callable[[], object]:
+    categories = make_categories(size)
+
+    def run():
+        for category in categories:
+            category.deactivate()
+            category.activate()
+            category.pull_events()
+    return run
+
+
+CASES: Dict[str, Callable[[int], Callable[[], object]]] = {
+    "UniqueEntityId()": unique_entity_ids,
+    "UniqueEntityId.generate_many": generate_many,
+    "Category()": constructor,
+    "Category.bulk_create": bulk_create,
+    "Category.validate": validate,
+    "Category.to_dict": to_dict,
+    "to_dicts": to_dicts_batch,
+    "Category.update": update,
+    "Category.deactivate + activate": activate,
+}
+
+
+def run_suite(sizes=SIZES, only: str = "") -> Dict[str, Measurement]:
+    measurements = {}
+    print(f"{'case':<42} {'items/s':>12} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} "
+          f"{'peak B':>8} {'blocks':>7}")
+    for name, case in CASES.items():
+        if only not in name:
+            continue
+        for size in sizes:
+            calls = min(200, max(10, 100_000 // size))
+            measurement = profile(case(size), items=size, calls=calls,
+                                  memory_calls=min(20, calls))
+            key = f"{name}[{size}]"
+            measurements[key] = measurement
+            print(f"{key:<42} {measurement.items_per_second:>12,.0f} "
+                  f"{measurement.p50_us:>10,.1f} {measurement.p90_us:>10,.1f} "
+                  f"{measurement.p99_us:>10,.1f} {measurement.peak_bytes:>8,.0f} "
+                  f"{measurement.allocated_blocks:>7,.1f}")
+    return measurements
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m category.tests.benchmark.suite")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative regression per metric (default 0.25)")
+    parser.add_argument("--metric-threshold", action="append", default=[],
+                        metavar="METRIC=RATIO", help="threshold for one metric, repeatable")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="comma separated input sizes")
+    parser.add_argument("--case", default="", help="only run cases whose name contains this")
+    args = parser.parse_args(argv)
+    metric_thresholds = dict(TAIL_THRESHOLDS)
+    metrics = {metric_field.name for metric_field in fields(Measurement)}
+    for option in args.metric_threshold:
+        metric, _, ratio = option.partition("=")
+        if metric not in metrics:
+            parser.error(f"unknown metric {metric!r}, choose from {', '.join(sorted(metrics))}")
+        metric_thresholds[metric] = float(ratio)
+
+    measurements = run_suite([int(size) for size in args.sizes.split(",")], args.case)
+    if args.save:
+        save_baseline(args.baseline, measurements)
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"\nNO GATE: no baseline at {args.baseline}, nothing was compared; "
+              f"run with --save on this machine to create it")
+        return NO_BASELINE
+    regressions = compare(load_baseline(args.baseline), measurements, args.threshold,
+                          metric_thresholds)
+    if regressions:
+        print(f"\n{len(regressions)} regressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
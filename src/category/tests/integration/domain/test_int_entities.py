@@ -88,4 +88,27 @@ class TestCategoryIntegration(unittest.TestCase):
             category.update(name=new_name, description="Nice movie")
         except ValidationException as err:
             self.fail(f"Some prop is not valid. Error: {err.args[0]}")
-            
\ No newline at end of file
+            
+    def test_bulk_create_reports_invalid_rows(self):
+        result = Category.bulk_create([
+            {"name": None},
+            {"name": "Movie"},
+            {"name": ""},
+            {"name": 5},
+            {"name": "t" * 256},
+            {"name": "Movie", "description": 5},
+            {"name": "Movie", "is_active": 5},
+            {"name": 5, "description": 5, "is_active": 5},
+            {"name": "Movie", "description": None, "is_active": False},
+        ])
+        self.assertEqual(result.errors, {
+            0: "The field name is required.",
+            2: "The field name is required.",
+            3: "The field name must be a string.",
+            4: "The field name cannot exceed 255 characters.",
+            5: "The field description must be a string.",
+            6: "The field is_active must be a boolean.",
+            7: "The field name must be a string.",
+        })
+        self.assertEqual([category.name for category in result.entities], ["Movie", "Movie"])
+        self.assertFalse(result.entities[1].is_active)
@@ -0,0 +1,52 @@
+import unittest
+from itertools import product
+from django.conf import settings
+from category.domain.validators import CategoryDRFValidator, CategoryValidatorFactory
+
+if not settings.configured:
+    settings.configure(USE_I18N=False)
+
+
+class TestCategoryDRFValidatorIntegration(unittest.TestCase):
+    validator: CategoryDRFValidator
+
+    def setUp(self):
+        self.validator = CategoryValidatorFactory.create(use_drf=True)
+
+    def test_invalid_cases(self):
+        invalid_data = [
+            (None, {"name": ["This field is required."]}),
+            ({"name": None}, {"name": ["This field may not be null."]}),
+            ({"name": ""}, {"name": ["This field may not be blank."]}),
+            ({"name": "t" * 256}, {"name": ["Ensure this field has no more than 255 characters."]}),
+            ({"name": "Movie", "is_active": "fake"}, {"is_active": ["Must be a valid boolean."]}),
+            ({"name": 5}, {"name": ["Not a valid string."]}),
+            ({"name": "Movie", "description": 5}, {"description": ["Not a valid string."]}),
+            ({"name": "Movie", "is_active": "true"}, {"is_active": ["Must be a valid boolean."]}),
+        ]
+        for data, errors in invalid_data:
+            self.assertFalse(self.validator.validate(data), data)
+            self.assertEqual(self.validator.errors, errors)
+
+    def test_valid_cases(self):
+        self.assertTrue(self.validator.validate({"name": "Movie", "description": None,
+                                                 "is_active": False}))
+        self.assertIsNone(self.validator.errors)
+        self.assertEqual(self.validator.validated_data,
+                         {"name": "Movie", "description": None, "is_active": False})
+
+    def test_accepts_what_the_category_rules_accept(self):
+        rules = CategoryValidatorFactory.create()
+        missing = object()
+        names = [missing, None, "", "  ", "Movie", " Movie ", "t" * 255, "t" * 256, 5, True]
+        descriptions = [missing, None, "", "  ", "Nice movie", 5, False]
+        flags = [missing, None, True, False, "true", "false", 1, 0, "fake"]
+        for values in product(names, descriptions, flags):
+            data = {field: value for field, value in zip(["name", "description", "is_active"],
+                                                         values) if value is not missing}
+            accepted = rules.validate(data)
+            self.assertEqual(self.validator.validate(data), accepted, data)
+            if accepted:
+                self.assertEqual(self.validator.validated_data, rules.validated_data, data)
+            else:
+                self.assertEqual(self.validator.errors.keys(), rules.errors.keys(), data)
@@ -0,0 +1,81 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from category.domain.batches import CategoryBatch
+from category.infra import cli
+from category.infra.parallel import parallel_import, parallel_import_batches
+from category.infra.pipelines import import_categories, read_csv, read_jsonl
+
+
+def make_jsonl(count):
+    lines = []
+    for line in range(1, count + 1):
+        name = "" if line % 7 == 0 else f"Category {line}"
+        lines.append("{not json" if line % 11 == 0 else json.dumps(
+            {"name": name, "is_active": line % 2 == 0,
+             "created_at": "2023-05-01T10:30:15.000123"}))
+    return "\n".join(lines) + "\n"
+
+
+def without_id(category):
+    category_dict = category.to_dict()
+    del category_dict["id"]
+    return category_dict
+
+
+class TestParallelImportIntegration(unittest.TestCase):
+
+    def test_keeps_input_order_and_rejected_rows(self):
+        text = make_jsonl(500)
+        serial = list(import_categories(read_jsonl(io.StringIO(text)), chunk_size=40))
+        parallel = list(parallel_import(io.StringIO(text), workers=2, chunk_size=40,
+                                        max_pending=3))
+        self.assertEqual(len(parallel), len(serial))
+        for parallel_chunk, serial_chunk in zip(parallel, serial):
+            self.assertEqual([without_id(category) for category in parallel_chunk.entities],
+                             [without_id(category) for category in serial_chunk.entities])
+            self.assertEqual(parallel_chunk.rejected, serial_chunk.rejected)
+
+    def test_csv_chunks_keep_quoted_lines_together(self):
+        text = "name,description,is_active,created_at\n" + "".join(
+            f'Category {i},"two\nlines",true,2023-05-01T10:30:15\n' if i % 3 == 0
+            else ",,false,2023-05-01T10:30:15\n" for i in range(40))
+        serial, = import_categories(read_csv(io.StringIO(text, newline="")))
+        parallel = list(parallel_import(io.StringIO(text, newline=""), is_csv=True, workers=2,
+                                        chunk_size=5))
+        self.assertEqual(
+            [without_id(category) for chunk in parallel for category in chunk.entities],
+            [without_id(category) for category in serial.entities])
+        self.assertEqual([row for chunk in parallel for row in chunk.rejected], serial.rejected)
+
+    def test_workers_return_compact_batches(self):
+        results = list(parallel_import_batches(io.StringIO(make_jsonl(30)), workers=2,
+                                               chunk_size=10))
+        self.assertEqual(len(results), 3)
+        for batch, rejected in results:
+            self.assertIsInstance(batch, CategoryBatch)
+            self.assertTrue(all(row.error == "The field name is required." or
+                                row.error.startswith("Invalid JSON") for row in rejected))
+        chunk, = parallel_import(io.StringIO(make_jsonl(10)), workers=1)
+        self.assertIsInstance(chunk.entities, CategoryBatch)
+
+    def test_timezone_aware_created_at(self):
+        text = json.dumps({"name": "Movie", "created_at": "2023-05-01T10:30:15+02:00"})
+        chunk, = parallel_import(io.StringIO(text), workers=1)
+        self.assertEqual(chunk.entities[0].created_at,
+                         datetime(2023, 5, 1, 10, 30, 15, tzinfo=timezone(timedelta(hours=2))))
+
+    def test_empty_input(self):
+        self.assertEqual(list(parallel_import(io.StringIO(""), workers=2)), [])
+
+    def test_cli_import_with_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "categories.jsonl")
+            cli.main(["generate", source, "--rows", "100", "--invalid-every", "10"])
+            with redirect_stdout(io.StringIO()) as stdout:
+                cli.main(["import", source, "--chunk-size", "7", "--workers", "2"])
+            self.assertIn("100 rows (90 accepted, 10 rejected)", stdout.getvalue())
@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from category.domain.entities import Category
+from category.infra import cli
+from category.infra.pipelines import (
+    SourceRow,
+    import_categories,
+    read_csv,
+    read_jsonl,
+    write_csv,
+    write_jsonl
+)
+
+
+class TestPipelinesIntegration(unittest.TestCase):
+
+    def test_import_jsonl_rejects_rows_with_line_numbers(self):
+        source = io.StringIO("\n".join([
+            json.dumps({"name": "Movie"}),
+            json.dumps({"name": ""}),
+            "{not json",
+            "",
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"name": "Movie", "id": "fake id"}),
+            json.dumps({"name": "Movie", "created_at": "yesterday"}),
+            json.dumps({"name": "Movie", "description": 5}),
+            json.dumps({"name": "Documentary", "description": None, "is_active": False,
+                        "id": "9f2ec4aa-010b-4282-addb-6d738cc27676",
+                        "created_at": "2023-05-01T10:30:15.000123"}),
+            json.dumps({"name": "Movie", "is_active": "yes"}),
+        ]))
+        chunks = list(import_categories(read_jsonl(source), chunk_size=4))
+        self.assertEqual([len(chunk.entities) for chunk in chunks], [1, 1, 0])
+
+        rejected = [(row.line, row.error) for chunk in chunks for row in chunk.rejected]
+        self.assertEqual(rejected[0], (2, "The field name is required."))
+        self.assertEqual(rejected[1][0], 3)
+        self.assertTrue(rejected[1][1].startswith("Invalid JSON"))
+        self.assertEqual(rejected[2:], [
+            (5, "Invalid JSON: expected an object"),
+            (6, "ID must be a valid UUID"),
+            (7, "The field created_at must be an ISO 8601 datetime."),
+            (8, "The field description must be a string."),
+            (10, "The field is_active must be a boolean."),
+        ])
+
+        documentary = chunks[1].entities[0]
+        self.assertEqual(documentary.id, "9f2ec4aa-010b-4282-addb-6d738cc27676")
+        self.assertEqual(documentary.created_at, datetime(2023, 5, 1, 10, 30, 15, 123))
+        self.assertFalse(documentary.is_active)
+        self.assertIsNone(documentary.description)
+
+    def test_import_csv(self):
+        source = io.StringIO(
+            "name,description,is_active,created_at\n"
+            "Movie,,,\n"
+            "Documentary,Nice,FALSE,2023-05-01T10:30:15\n"
+            ",Nice,true,\n"
+            "Anime,,maybe,\n"
+        )
+        chunk, = import_categories(read_csv(source))
+        movie, documentary = chunk.entities
+        self.assertEqual((movie.name, movie.description, movie.is_active), ("Movie", None, True))
+        self.assertEqual((documentary.name, documentary.description, documentary.is_active),
+                         ("Documentary", "Nice", False))
+        self.assertEqual(documentary.created_at, datetime(2023, 5, 1, 10, 30, 15))
+        self.assertEqual([(row.line, row.error) for row in chunk.rejected], [
+            (4, "The field name is required."),
+            (5, "The field is_active must be a boolean."),
+        ])
+
+    def test_export_and_import_round_trip(self):
+        categories = [Category(name="Movie"),
+                      Category(name="Documentary, \"quoted\"", description="Nice\nmovie",
+                               is_active=False)]
+
+        jsonl = io.BytesIO()
+        self.assertEqual(write_jsonl(iter(categories), jsonl), 2)
+        self.assertEqual([json.loads(line) for line in jsonl.getvalue().splitlines()],
+                         [json.loads(json.dumps(category.to_dict(), default=datetime.isoformat))
+                          for category in categories])
+        chunk, = import_categories(read_jsonl(io.StringIO(jsonl.getvalue().decode())))
+        self.assertEqual(chunk.entities, categories)
+
+        csv_file = io.StringIO()
+        self.assertEqual(write_csv(iter(categories), csv_file), 2)
+        chunk, = import_categories(read_csv(io.StringIO(csv_file.getvalue())))
+        self.assertEqual(chunk.entities, categories)
+
+    def test_memory_is_bounded_by_the_chunk_size(self):
+        def rows(count):
+            for line in range(1, count + 1):
+                yield SourceRow(line, {"name": f"Category {line}", "description": "description"})
+
+        def peak_memory(count):
+            tracemalloc.start()
+            accepted = sum(len(chunk.entities)
+                           for chunk in import_categories(rows(count), chunk_size=1000))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertEqual(accepted, count)
+            return peak
+
+        small, large = peak_memory(2_000), peak_memory(50_000)
+        self.assertLess(large, small * 1.5)
+
+    def test_cli_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "categories.csv")
+            output = os.path.join(directory, "valid.jsonl")
+            rejected = os.path.join(directory, "rejected.jsonl")
+            cli.main(["generate", source, "--rows", "100", "--invalid-every", "10"])
+            with redirect_stdout(io.StringIO()) as stdout:
+                cli.main(["import", source, "--chunk-size", "7",
+                          "--output", output, "--rejected", rejected])
+            self.assertIn("100 rows (90 accepted, 10 rejected)", stdout.getvalue())
+            self.assertIn("rows/s", stdout.getvalue())
+            with open(output, encoding="utf-8") as file:
+                self.assertEqual(len(file.readlines()), 90)
+            with open(rejected, encoding="utf-8") as file:
+                rejected_rows = [json.loads(line) for line in file]
+            self.assertEqual([row["line"] for row in rejected_rows], list(range(11, 102, 10)))
+            self.assertEqual({row["error"] for row in rejected_rows},
+                             {"The field name is required."})
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from __seedwork.domain.exceptions import NotFoundException
+from category.domain.entities import Category
+from category.infra import snapshots
+from category.infra.snapshots import CategorySnapshot, SnapshotError, write_snapshot
+
+
+class TestCategorySnapshot(unittest.TestCase):
+    categories: list
+    path: str
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "categories.snap")
+        self.categories = [
+            Category(name="Movie"),
+            Category(name="Série ✨", description="Nice série", is_active=False,
+                     created_at=datetime(1969, 12, 31, 23, 59, 59, 999999)),
+            Category(name="Documentary", description="", is_active=None, created_at=None),
+            Category.restore(Category(name="Anime").unique_entity_id, None, None, True, None),
+        ]
+        self.assertEqual(write_snapshot(self.path, iter(self.categories)), 4)
+
+    def open(self, **kwargs) -> CategorySnapshot:
+        snapshot = CategorySnapshot.open(self.path, **kwargs)
+        self.addCleanup(snapshot.close)
+        return snapshot
+
+    def corrupt(self, position: int, data: bytes) -> None:
+        with open(self.path, "r+b") as file:
+            file.seek(position)
+            file.write(data)
+
+    def test_round_trip_is_lossless(self):
+        snapshot = self.open()
+        self.assertEqual(len(snapshot), 4)
+        self.assertEqual(snapshot.to_entities(), self.categories)
+        for index, category in enumerate(self.categories):
+            for restored in (snapshot[index], snapshot.to_entities()[index]):
+                self.assertEqual(restored.id, category.id)
+                self.assertEqual(restored.name, category.name)
+                self.assertEqual(restored.description, category.description)
+                self.assertIs(restored.is_active, category.is_active)
+                self.assertEqual(restored.created_at, category.created_at)
+        self.assertEqual(snapshot[-1], self.categories[-1])
+        with self.assertRaises(IndexError):
+            snapshot[4]  # pylint: disable=pointless-statement
+
+    def test_reads_single_fields(self):
+        snapshot = self.open()
+        category = self.categories[1]
+        self.assertEqual(snapshot.id_bytes(1), category.unique_entity_id.to_bytes())
+        self.assertEqual(snapshot.name(1), "Série ✨")
+        self.assertEqual(snapshot.description(1), "Nice série")
+        self.assertIsNone(snapshot.description(0))
+        self.assertEqual(snapshot.description(2), "")
+        self.assertIsNone(snapshot.name(3))
+        self.assertIs(snapshot.is_active(1), False)
+        self.assertIsNone(snapshot.is_active(2))
+        self.assertEqual(snapshot.created_at(1), category.created_at)
+        self.assertIsNone(snapshot.created_at(2))
+
+    def test_find_by_id(self):
+        snapshot = self.open()
+        for category in self.categories:
+            self.assertEqual(snapshot.find_by_id(category.id), category)
+            self.assertEqual(snapshot.find_by_id(category.unique_entity_id), category)
+        for entity_id in ["fake id", None, Category(name="Movie").id]:
+            with self.assertRaises(NotFoundException) as assert_error:
+                snapshot.find_by_id(entity_id)
+            self.assertEqual(assert_error.exception.args[0],
+                             f"Entity not found using ID '{entity_id}'")
+
+    def test_iterates_in_chunks(self):
+        categories = Category.bulk_create([{"name": f"Category {i}"} for i in range(10)]).entities
+        write_snapshot(self.path, categories)
+        with patch.object(snapshots, "_CHUNK", 3):
+            self.assertEqual(list(self.open()), categories)
+
+    def test_empty_snapshot(self):
+        write_snapshot(self.path, [])
+        snapshot = self.open()
+        self.assertEqual(len(snapshot), 0)
+        self.assertEqual(snapshot.to_entities(), [])
+
+    def test_closed_snapshot(self):
+        snapshot = CategorySnapshot.open(self.path)
+        with snapshot:
+            self.assertEqual(snapshot.name(0), "Movie")
+        snapshot.close()
+        for read in [lambda: snapshot[0], snapshot.to_entities,
+                     lambda: snapshot.find_by_id(self.categories[0].id)]:
+            with self.assertRaises(ValueError):
+                read()
+
+    def test_rejects_invalid_files(self):
+        self.corrupt(0, b"NOTSNAP\0")
+        with self.assertRaisesRegex(SnapshotError, "Not a category snapshot"):
+            CategorySnapshot.open(self.path)
+
+        write_snapshot(self.path, self.categories)
+        self.corrupt(8, (2).to_bytes(2, "little"))
+        with self.assertRaisesRegex(SnapshotError, "Unsupported snapshot version 2"):
+            CategorySnapshot.open(self.path)
+
+        write_snapshot(self.path, self.categories)
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaisesRegex(SnapshotError, "Truncated"):
+            CategorySnapshot.open(self.path)
+
+        with open(self.path, "wb") as file:
+            file.write(b"CATSNAP")
+        with self.assertRaisesRegex(SnapshotError, "not a category snapshot"):
+            CategorySnapshot.open(self.path)
+
+    def test_checksum(self):
+        # the first name starts the heap, right after the header
+        self.corrupt(snapshots._HEADER.size, b"N")  # pylint: disable=protected-access
+        with self.assertRaisesRegex(SnapshotError, "checksum"):
+            CategorySnapshot.open(self.path)
+        self.assertEqual(self.open(verify=False).name(0), "Novie")
+
+    def test_failed_write_keeps_the_previous_snapshot(self):
+        categories = [Category(name="Movie"),
+                      Category(name="Series", created_at=datetime.now(timezone.utc))]
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, categories)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["categories.snap"])
+        self.assertEqual(self.open().to_entities(), self.categories)
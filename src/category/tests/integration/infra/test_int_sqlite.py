@@ -0,0 +1,357 @@
+import copy
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from __seedwork.domain.exceptions import ConflictException, NotFoundException
+from __seedwork.domain.interning import Interner
+from __seedwork.domain.repositories import SearchParams
+from __seedwork.domain.sharding import ShardedSearchableRepository
+from __seedwork.domain.unit_of_work import UnitOfWork
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+from category.infra.repositories import CategoryInMemoryRepository
+from category.infra.sqlite import SCHEMA, CategorySqliteRepository
+
+
+class TestCategorySqliteRepository(unittest.TestCase):
+    repo: CategorySqliteRepository
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.repo = CategorySqliteRepository(os.path.join(directory.name, "categories.db"))
+        self.addCleanup(self.repo.close)
+
+    def test_insert_and_find(self):
+        category = Category(name="Movie", description="some description", is_active=False)
+        self.repo.insert(category)
+        with patch.object(Category, "validate") as mock_validate_method:
+            found = self.repo.find_by_id(category.id)
+            self.assertEqual(self.repo.find_by_id(category.unique_entity_id), category)
+            mock_validate_method.assert_not_called()
+        self.assertEqual(found, category)
+        self.assertEqual(found.created_at, category.created_at)
+        self.assertEqual(self.repo.find_all(), [category])
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repo.insert(category)
+
+    def test_interner_shares_loaded_values(self):
+        self.repo.bulk_insert(Category.bulk_create(
+            [{"name": "Movie", "description": "description"}] * 3).entities)
+        repo = CategorySqliteRepository(self.repo.database, interner=Interner())
+        self.addCleanup(repo.close)
+        first, *others = repo.find_all()
+        for category in others + [repo.find_by_id(first.id)]:
+            self.assertIs(category.name, first.name)
+            self.assertIs(category.description, first.description)
+            self.assertIs(category.created_at, first.created_at)
+        self.assertEqual(repo.find_all(), self.repo.find_all())
+
+    def test_find_many(self):
+        categories = [Category(name=f"Movie {i}") for i in range(600)]
+        self.repo.bulk_insert(categories)
+        unknown = UniqueEntityId()
+        found = self.repo.find_many([categories[0].unique_entity_id, unknown, "fake id",
+                                     *(category.id for category in categories)])
+        self.assertEqual(found, {category.id: category for category in categories})
+        self.assertEqual(self.repo.find_many([]), {})
+
+    def test_keeps_none_values(self):
+        category = Category.restore(UniqueEntityId(), "Movie", None, None, None)
+        self.repo.insert(category)
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+
+    def test_throw_not_found_exception(self):
+        for entity_id in ["fake id", str(UniqueEntityId()), None]:
+            with self.assertRaises(NotFoundException) as assert_error:
+                self.repo.find_by_id(entity_id)
+            self.assertEqual(assert_error.exception.args[0],
+                             f"Entity not found using ID '{entity_id}'")
+        with self.assertRaises(NotFoundException):
+            self.repo.update(Category(name="Movie"))
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(str(UniqueEntityId()))
+
+    def test_update_and_delete(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        category.update("Series", "some description")
+        category.deactivate()
+        self.repo.update(category)
+        self.assertEqual(self.repo.find_by_id(category.id), category)
+        self.repo.delete(category.id)
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_bulk_insert_and_upsert(self):
+        categories = [Category(name=f"Movie {i}") for i in range(3)]
+        self.repo.bulk_insert(categories)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repo.bulk_insert([Category(name="New"), categories[0]])
+        self.assertEqual(self.repo.find_all(), categories)
+
+        categories[0].update("Renamed", None)
+        new_category = Category(name="New")
+        self.repo.bulk_upsert([categories[0], new_category])
+        self.assertEqual(self.repo.find_all(), [*categories, new_category])
+        self.assertEqual(self.repo.search(SearchParams(filter="renamed")).items, [categories[0]])
+
+    def test_patch_many(self):
+        categories = [Category(name=f"Movie {i}") for i in range(4)]
+        self.repo.bulk_insert(categories)
+        changed_at = datetime(2022, 1, 1)
+        changes = {
+            categories[0].id: {"name": "Series", "description": "new"},
+            categories[1].id: {"is_active": False},
+            categories[2].id: {"description": "other", "name": "Drama"},
+            categories[3].id: {"created_at": changed_at, "is_active": None},
+        }
+        self.repo.patch_many(changes)
+        for category in categories:
+            for name, value in changes[category.id].items():
+                category._set(name, value)  # pylint: disable=protected-access
+        self.assertEqual(self.repo.find_all(), categories)
+        self.assertEqual(self.repo.search(SearchParams(filter="series")).items, [categories[0]])
+        # a patch without a version advances the stored one
+        self.assertEqual([category.version for category in self.repo.find_all()], [1] * 4)
+        self.repo.patch_many({categories[1].id: {"is_active": True, "version": 7}})
+        self.assertEqual(self.repo.find_by_id(categories[1].id).version, 7)
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.patch_many({categories[0].id: {"name": "Changed"},
+                                  "fake id": {"name": "Changed"}})
+        self.assertEqual(assert_error.exception.args[0], "Entity not found using ID 'fake id'")
+        self.assertEqual(self.repo.find_by_id(categories[0].id).name, "Series")
+        with self.assertRaises(ValueError):
+            self.repo.patch_many({categories[0].id: {"unknown": 1}})
+
+    def test_stores_versions(self):
+        category = Category(name="Movie")
+        category.deactivate()
+        self.repo.insert(category)
+        self.assertEqual(self.repo.find_by_id(category.id).version, 1)
+        category.update("Series", None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.find_all()[0].version, 2)
+
+    def test_unit_of_work_commit_fails_a_stale_compare_and_set(self):
+        for repo in [self.repo, CategoryInMemoryRepository()]:
+            category = Category(name="Movie")
+            repo.insert(category)
+            stale = repo.find_by_id(category.id)
+            if repo is not self.repo:
+                stale = copy.copy(stale)
+            with UnitOfWork(repo) as uow:
+                uow.get(category.id).update("Series", None)
+            self.assertEqual(repo.find_by_id(category.id).version, 1)
+            stale.update("Drama", None)
+            with self.assertRaises(ConflictException):
+                repo.compare_and_set(stale, 0)
+            self.assertEqual(repo.find_by_id(category.id).name, "Series")
+
+    def test_unit_of_work_commit_rolls_back_as_a_whole(self):
+        kept, removed = Category(name="Movie"), Category(name="Documentary")
+        self.repo.bulk_insert([kept, removed])
+        uow = UnitOfWork(self.repo)
+        new = Category(name="New")
+        uow.add(new)
+        loaded = uow.get(kept.id)
+        loaded.update("Series", None)
+        uow.remove(removed.id)
+        self.repo.delete(removed.id)
+        with self.assertRaises(NotFoundException):
+            uow.commit()
+        # neither the insert nor the patch made before the failed delete landed
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(new.id)
+        self.assertEqual(self.repo.find_by_id(kept.id).name, "Movie")
+        pending = uow.pending()
+        self.assertEqual((pending.new, list(pending.patches), pending.deleted),
+                         ([new], [kept.id], [removed.id]))
+
+        self.repo.insert(removed)
+        uow.commit()
+        self.assertEqual(self.repo.find_by_id(new.id), new)
+        self.assertEqual(self.repo.find_by_id(kept.id).version, 1)
+        self.assertCountEqual(self.repo.find_all(), [loaded, new])
+        self.assertFalse(uow.pending())
+
+    def test_compare_and_set(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        first, second = self.repo.find_by_id(category.id), self.repo.find_by_id(category.id)
+        first.update("Series", None)
+        self.repo.compare_and_set(first, 0)
+        second.deactivate()
+        with self.assertRaises(ConflictException) as assert_error:
+            self.repo.compare_and_set(second, 0)
+        self.assertEqual(assert_error.exception.args[0],
+                         f"Entity '{category.id}' is at version 1, not the expected 0")
+        self.assertEqual(self.repo.find_by_id(category.id), first)
+        with self.assertRaises(NotFoundException):
+            self.repo.compare_and_set(Category(name="Unknown"), 0)
+
+    def test_compare_and_set_many(self):
+        categories = [Category(name=f"Movie {i}") for i in range(3)]
+        self.repo.bulk_insert(categories)
+        for category in categories:
+            category.deactivate()
+        concurrent = self.repo.find_by_id(categories[1].id)
+        concurrent.update("Concurrent", None)
+        self.repo.update(concurrent)
+
+        with self.assertRaises(ConflictException) as assert_error:
+            self.repo.compare_and_set_many([(category, 0) for category in categories])
+        self.assertIn(categories[1].id, assert_error.exception.args[0])
+        self.assertEqual([category.is_active for category in self.repo.find_all()], [True] * 3)
+
+        self.repo.compare_and_set_many([(categories[0], 0), (categories[2], 0)])
+        self.assertEqual([category.version for category in self.repo.find_all()], [1, 1, 1])
+        categories[0].activate()
+        with self.assertRaises(ConflictException):
+            self.repo.compare_and_set_many([(categories[0], 1), (categories[0], 1)])
+        self.repo.compare_and_set_many([(categories[0], 1), (categories[0], 2)])
+        self.assertEqual(self.repo.find_by_id(categories[0].id).version, 2)
+
+    def test_adds_the_version_column_to_older_files(self):
+        database = os.path.join(os.path.dirname(self.repo.database), "old.db")
+        with sqlite3.connect(database) as connection:
+            old_schema = SCHEMA.replace(",\n    version INTEGER NOT NULL DEFAULT 0", "")
+            connection.executescript(old_schema)
+            connection.execute("INSERT INTO categories VALUES (?, 'Movie', 'movie', NULL, 1, '')",
+                               (UniqueEntityId().to_bytes(),))
+        connection.close()
+        repo = CategorySqliteRepository(database)
+        self.addCleanup(repo.close)
+        category = repo.find_all()[0]
+        self.assertEqual(category.version, 0)
+        category.deactivate()
+        repo.compare_and_set(category, 0)
+        self.assertEqual(repo.find_by_id(category.id).version, 1)
+
+    def test_bulk_delete(self):
+        categories = [Category(name=f"Movie {i}") for i in range(3)]
+        self.repo.bulk_insert(categories)
+        missing = str(UniqueEntityId())
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.bulk_delete([categories[0].id, missing])
+        self.assertEqual(assert_error.exception.args[0], f"Entity not found using ID '{missing}'")
+        self.assertEqual(self.repo.find_all(), categories)
+
+        self.repo.bulk_delete([categories[0].unique_entity_id, categories[2].id,
+                               categories[0].id])
+        self.assertEqual(self.repo.find_all(), [categories[1]])
+
+    def test_search_matches_in_memory_repository(self):
+        created_at = datetime(2022, 1, 1)
+        categories = [Category(name=name, created_at=created_at + timedelta(seconds=i % 3))
+                      for i, name in enumerate(["b", "A", "c", "ab", "B", "Ba", "a", "bb"])]
+        memory = CategoryInMemoryRepository()
+        memory.bulk_insert(categories)
+        self.repo.bulk_insert(categories)
+
+        for params in [{}, {"sort": "name"}, {"sort": "name", "sort_dir": "desc"},
+                       {"sort": "created_at", "sort_dir": "asc", "per_page": 3, "page": 2},
+                       {"filter": "b", "per_page": 2}, {"filter": "B", "sort": "name"},
+                       {"sort": "fake", "page": 3, "per_page": 3}, {"filter": "z"}]:
+            self.assertEqual(self.repo.search(SearchParams(**params)),
+                             memory.search(SearchParams(**params)), params)
+
+    def test_search_filter_edge_cases_match_the_in_memory_repository(self):
+        last = chr(sys.maxunicode)
+        categories = [Category(name=name) for name in
+                      ["5 stars", "50", "6", f"a{last}", f"a{last}b", "b", last, "é"]]
+        memory = CategoryInMemoryRepository()
+        memory.bulk_insert(categories)
+        self.repo.bulk_insert(categories)
+        for search_filter in [5, f"A{last}", last, f"{last}{last}", "", "É"]:
+            params = SearchParams(filter=search_filter, sort="name", per_page=20)
+            self.assertEqual(self.repo.search(params), memory.search(params), search_filter)
+            self.assertEqual(self.repo.search(params).total,
+                             sum(category.name.casefold().startswith(str(search_filter).casefold())
+                                 for category in categories), search_filter)
+
+    def test_search_by_cursor(self):
+        created_at = datetime(2022, 1, 1)
+        categories = [Category(name=f"Movie {i % 5}",
+                               created_at=created_at + timedelta(days=i % 4))
+                      for i in range(23)]
+        self.repo.bulk_insert(categories)
+        memory = CategoryInMemoryRepository()
+        memory.bulk_insert(categories)
+
+        for params in [{}, {"sort": "name"},
+                       {"sort": "name", "sort_dir": "desc", "filter": "movie 3"}]:
+            expected = memory.search(SearchParams(per_page=100, **params)).items
+            items, cursor = [], None
+            while True:
+                result = self.repo.search(SearchParams(per_page=4, cursor=cursor, **params))
+                items.extend(result.items)
+                self.assertEqual(result.total, len(expected))
+                self.assertEqual(
+                    result.next_cursor,
+                    memory.search(SearchParams(per_page=4, cursor=cursor, **params)).next_cursor)
+                cursor = result.next_cursor
+                if cursor is None:
+                    break
+            self.assertEqual(items, expected, params)
+
+    def test_shards_search_like_one_file(self):
+        created_at = datetime(2022, 1, 1)
+        categories = [Category(name=f"Movie {i % 5}", created_at=created_at + timedelta(days=i % 4))
+                      for i in range(23)]
+        self.repo.bulk_insert(categories)
+        shards = {}
+        for number in range(3):
+            shards[f"shard-{number}"] = CategorySqliteRepository(
+                self.repo.database.replace(".db", f"-{number}.db"))
+            self.addCleanup(shards[f"shard-{number}"].close)
+        sharded = ShardedSearchableRepository(shards)
+        sharded.bulk_insert(categories[:15])
+        sharded.add_shard("shard-3", CategorySqliteRepository(
+            self.repo.database.replace(".db", "-3.db")))
+        self.addCleanup(sharded.shards["shard-3"].close)
+        sharded.bulk_insert(categories[15:])
+        self.assertTrue(all(shard.find_all() for shard in sharded.shards.values()))
+
+        for params in [{}, {"sort": "name", "page": 2, "per_page": 4},
+                       {"sort": "created_at", "sort_dir": "asc", "filter": "movie 3"}]:
+            self.assertEqual(sharded.search(SearchParams(**params)),
+                             self.repo.search(SearchParams(**params)), params)
+        cursor = self.repo.search(SearchParams(sort="name", per_page=5)).next_cursor
+        self.assertEqual(sharded.search(SearchParams(sort="name", per_page=5, cursor=cursor)),
+                         self.repo.search(SearchParams(sort="name", per_page=5, cursor=cursor)))
+
+    def test_connection_per_thread(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        found = []
+
+        def find():
+            found.append((self.repo.find_by_id(category.id), self.repo.connection))
+
+        threads = [threading.Thread(target=find) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(entity == category for entity, _ in found))
+        connections = {connection for _, connection in found} | {self.repo.connection}
+        self.assertEqual(len(connections), 4)
+        self.assertEqual(set(self.repo._connections), connections)  # pylint: disable=protected-access
+
+    def test_total_follows_writes_from_any_connection(self):
+        self.repo.bulk_insert([Category(name="a"), Category(name="b")])
+        self.assertEqual(self.repo.search(SearchParams()).total, 2)
+        self.repo.insert(Category(name="c"))
+        self.assertEqual(self.repo.search(SearchParams()).total, 3)
+
+        thread = threading.Thread(target=self.repo.insert, args=(Category(name="d"),))
+        thread.start()
+        thread.join()
+        self.assertEqual(self.repo.search(SearchParams()).total, 4)
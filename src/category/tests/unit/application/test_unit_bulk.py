@@ -0,0 +1,94 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+from unittest.mock import patch
+from __seedwork.domain.events import EventDispatcher
+from __seedwork.domain.exceptions import ConflictException
+from __seedwork.domain.repositories import SearchParams
+from category.application.bulk import BulkCategoryCommands, BulkCommandResult
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated, CategoryDeactivated
+from category.infra.repositories import CategoryInMemoryRepository
+
+
+@dataclass(slots=True)
+class RacingCategoryRepository(CategoryInMemoryRepository):
+    """Another writer saves the first category of each batch right before it lands."""
+    raced: List[str] = field(default_factory=list)
+
+    def compare_and_set_many(self, entities: Iterable[Tuple[Category, int]]) -> None:
+        entities = list(entities)
+        if len(entities) > 1:
+            first = entities[0][0]
+            self._versions[first.id] += 1
+            self.raced.append(first.id)
+        CategoryInMemoryRepository.compare_and_set_many(self, entities)
+
+
+class TestBulkCategoryCommands(unittest.TestCase):
+    repo: CategoryInMemoryRepository
+    categories: list
+    events: EventDispatcher
+    commands: BulkCategoryCommands
+
+    def setUp(self):
+        self.repo = CategoryInMemoryRepository()
+        self.categories = Category.bulk_create(
+            [{"name": f"{kind} {i}", "is_active": i % 2 == 0}
+             for kind in ("Movie", "Series") for i in range(10)]).entities
+        self.repo.bulk_insert(self.categories)
+        self.events = EventDispatcher()
+        self.commands = BulkCategoryCommands(self.repo, self.events, page_size=3)
+
+    def test_deactivate_and_activate_where(self):
+        with patch.object(self.repo, "compare_and_set_many",
+                          wraps=self.repo.compare_and_set_many) as mock_write:
+            result = self.commands.deactivate_where("movie")
+        mock_write.assert_called_once()
+        self.assertEqual(result, BulkCommandResult(affected=5, unchanged=5, errors={}))
+        self.assertEqual([category.is_active for category in self.repo.find_all()],
+                         [False] * 10 + [i % 2 == 0 for i in range(10)])
+        self.assertEqual(len(self.events), 5)
+        self.assertTrue(all(isinstance(event, CategoryDeactivated)
+                            for event in self.events._queue))  # pylint: disable=protected-access
+
+        result = self.commands.activate_where()
+        self.assertEqual(result, BulkCommandResult(affected=15, unchanged=5, errors={}))
+        self.assertTrue(all(category.is_active for category in self.repo.find_all()))
+        self.assertEqual(self.commands.activate_where("nothing"),
+                         BulkCommandResult(affected=0, unchanged=0, errors={}))
+        self.assertEqual(self.repo.find_by_id(self.categories[0].id).version, 2)
+
+    def test_bulk_update(self):
+        movie, series = self.categories[0], self.categories[10]
+        result = self.commands.bulk_update({
+            movie.unique_entity_id: {"name": "Film", "is_active": False},
+            series.id: {"name": ""},
+            self.categories[2].id: {"is_active": True},
+            "fake id": {"is_active": True},
+        })
+        self.assertEqual(result, BulkCommandResult(affected=1, unchanged=1, errors={
+            series.id: "The field name is required.",
+            "fake id": "Entity not found using ID 'fake id'",
+        }))
+        self.assertEqual(self.repo.find_by_id(movie.id).name, "Film")
+        self.assertEqual(self.repo.find_by_id(series.id).name, "Series 0")
+        self.assertEqual(self.repo.search(SearchParams(filter="film")).total, 1)
+
+    def test_conflicting_batches_are_saved_one_by_one(self):
+        repo = RacingCategoryRepository()
+        repo.bulk_insert(self.categories)
+        result = BulkCategoryCommands(repo, self.events).activate_where("series")
+        self.assertEqual(result.affected, 4)
+        self.assertEqual(result.unchanged, 5)
+        self.assertEqual(result.errors, {repo.raced[0]: f"Entity '{repo.raced[0]}' is at "
+                                                         "version 1, not the expected 0"})
+        with self.assertRaises(ConflictException):
+            repo.compare_and_set(repo.find_by_id(repo.raced[0]), 0)
+        # the rejected change is not visible in the store
+        self.assertIs(repo.find_by_id(repo.raced[0]).is_active, False)
+        self.assertEqual(sum(category.is_active for category in repo.find_all()), 14)
+        self.assertEqual(sum(category.is_active for category in self.categories), 10)
+        self.assertEqual(len(self.events), 4)
+        self.assertTrue(all(isinstance(event, CategoryActivated)
+                            for event in self.events._queue))  # pylint: disable=protected-access
@@ -0,0 +1,146 @@
+import asyncio
+import unittest
+from dataclasses import dataclass
+from typing import Union
+from __seedwork.application.dto import PaginationOutput, SearchInput
+from __seedwork.domain.events import EventDispatcher
+from __seedwork.domain.exceptions import NotFoundException, ValidationException
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.application.dto import CategoryOutput
+from category.application.use_cases import (
+    CreateCategoryUseCase,
+    DeleteCategoryUseCase,
+    GetCategoryUseCase,
+    ListCategoriesUseCase,
+    UpdateCategoryUseCase
+)
+from category.domain.entities import Category
+from category.domain.events import (
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryDeleted,
+    CategoryUpdated
+)
+from category.infra.repositories import CategoryAsyncInMemoryRepository
+
+
+@dataclass(slots=True)
+class SlowCategoryRepository(CategoryAsyncInMemoryRepository):
+    """Yields to the event loop between reading and returning, like real I/O."""
+
+    async def find_by_id(self, entity_id: Union[str, UniqueEntityId]) -> Category:
+        category = await CategoryAsyncInMemoryRepository.find_by_id(self, entity_id)
+        await asyncio.sleep(0)
+        return category
+
+
+class TestCategoryUseCases(unittest.IsolatedAsyncioTestCase):
+    repo: CategoryAsyncInMemoryRepository
+
+    def setUp(self):
+        self.repo = CategoryAsyncInMemoryRepository()
+
+    async def test_create(self):
+        output = await CreateCategoryUseCase(self.repo).execute(
+            CreateCategoryUseCase.Input(name="Movie", description="some description"))
+        category = await self.repo.find_by_id(output.id)
+        self.assertEqual(output, CategoryOutput.from_entity(category))
+        self.assertEqual(output.name, "Movie")
+        self.assertTrue(output.is_active)
+
+        with self.assertRaises(ValidationException):
+            await CreateCategoryUseCase(self.repo).execute(CreateCategoryUseCase.Input(name=""))
+
+    async def test_get(self):
+        category = Category(name="Movie")
+        await self.repo.insert(category)
+        output = await GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input(category.id))
+        self.assertEqual(output, CategoryOutput.from_entity(category))
+
+        with self.assertRaises(NotFoundException):
+            await GetCategoryUseCase(self.repo).execute(GetCategoryUseCase.Input("fake id"))
+
+    async def test_list(self):
+        categories = [Category(name=name) for name in ["b", "a", "c"]]
+        await self.repo.bulk_insert(categories)
+        output = await ListCategoriesUseCase(self.repo).execute(
+            SearchInput(sort="name", per_page=2))
+        self.assertEqual(output, PaginationOutput(
+            items=[CategoryOutput.from_entity(categories[1]),
+                   CategoryOutput.from_entity(categories[0])],
+            total=3, current_page=1, last_page=2, per_page=2, next_cursor=output.next_cursor))
+
+        last_page = await ListCategoriesUseCase(self.repo).execute(
+            SearchInput(sort="name", per_page=2, cursor=output.next_cursor))
+        self.assertEqual(last_page.items, [CategoryOutput.from_entity(categories[2])])
+        self.assertIsNone(last_page.next_cursor)
+
+    async def test_update(self):
+        category = Category(name="Movie")
+        await self.repo.insert(category)
+        use_case = UpdateCategoryUseCase(self.repo)
+
+        output = await use_case.execute(
+            UpdateCategoryUseCase.Input(category.id, name="Series", description="some description"))
+        self.assertEqual((output.name, output.description, output.is_active),
+                         ("Series", "some description", True))
+
+        output = await use_case.execute(UpdateCategoryUseCase.Input(category.id, is_active=False))
+        self.assertEqual((output.name, output.is_active), ("Series", False))
+        self.assertEqual(CategoryOutput.from_entity(await self.repo.find_by_id(category.id)), output)
+
+        with self.assertRaises(ValidationException):
+            await use_case.execute(UpdateCategoryUseCase.Input(category.id, name="a" * 256))
+        with self.assertRaises(NotFoundException):
+            await use_case.execute(UpdateCategoryUseCase.Input("fake id", name="Series"))
+
+    async def test_delete(self):
+        category = Category(name="Movie")
+        await self.repo.insert(category)
+        await DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(category.id))
+        self.assertEqual(await self.repo.find_all(), [])
+
+        with self.assertRaises(NotFoundException):
+            await DeleteCategoryUseCase(self.repo).execute(DeleteCategoryUseCase.Input(category.id))
+
+    async def test_concurrent_updates_do_not_lose_writes(self):
+        repo = SlowCategoryRepository()
+        category = Category(name="Movie")
+        await repo.insert(category)
+        use_case = UpdateCategoryUseCase(repo)
+
+        inputs = []
+        for index in range(50):
+            inputs.append(UpdateCategoryUseCase.Input(category.id, name=f"Movie {index}"))
+            inputs.append(UpdateCategoryUseCase.Input(category.id, is_active=index % 2 == 0))
+        await asyncio.gather(*(use_case.execute(input_param) for input_param in inputs))
+
+        saved = await repo.find_by_id(category.id)
+        self.assertEqual((saved.name, saved.is_active), ("Movie 49", False))
+        self.assertEqual(repo._locks, {})  # pylint: disable=protected-access
+
+    async def test_writes_queue_their_events(self):
+        dispatcher = EventDispatcher()
+        delivered = []
+        dispatcher.subscribe(CategoryCreated, delivered.extend)
+        dispatcher.subscribe(CategoryUpdated, delivered.extend)
+        dispatcher.subscribe(CategoryDeactivated, delivered.extend)
+        dispatcher.subscribe(CategoryDeleted, delivered.extend)
+
+        created = await CreateCategoryUseCase(self.repo, dispatcher).execute(
+            CreateCategoryUseCase.Input(name="Movie"))
+        update = UpdateCategoryUseCase(self.repo, dispatcher)
+        await update.execute(UpdateCategoryUseCase.Input(created.id, name="Series"))
+        await update.execute(UpdateCategoryUseCase.Input(created.id, name="Documentary",
+                                                         is_active=False))
+        await DeleteCategoryUseCase(self.repo, dispatcher).execute(
+            DeleteCategoryUseCase.Input(created.id))
+        self.assertEqual(len(dispatcher), 5)
+
+        await dispatcher.dispatch_async()
+        self.assertEqual(delivered, [
+            CategoryCreated(created.id, "Movie", None, True),
+            CategoryUpdated(created.id, "Documentary", None),
+            CategoryDeactivated(created.id),
+            CategoryDeleted(created.id),
+        ])
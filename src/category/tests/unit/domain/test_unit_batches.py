@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from unittest.mock import patch
+from category.domain import batches
+from category.domain.batches import CategoryBatch
+from category.domain.entities import Category
+
+
+class TestCategoryBatchUnit(unittest.TestCase):
+    categories: list
+    batch: CategoryBatch
+
+    def setUp(self):
+        self.categories = [
+            Category(name="Movie"),
+            Category(name="Série ✨", description="Nice série", is_active=False,
+                     created_at=datetime(1969, 12, 31, 23, 59, 59, 999999)),
+            Category(name="Documentary", description="", is_active=None, created_at=None),
+            Category(name="Anime", is_active=False),
+        ]
+        self.batch = CategoryBatch.from_entities(self.categories)
+
+    def test_round_trip_is_lossless(self):
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(self.batch.to_entities(), self.categories)
+        self.assertEqual(self.batch[-1], self.categories[-1])
+        for restored, category in zip(self.batch, self.categories):
+            self.assertEqual(restored.id, category.id)
+            self.assertEqual(restored.created_at, category.created_at)
+            self.assertIs(restored.is_active, category.is_active)
+        with self.assertRaises(IndexError):
+            self.batch[4]  # pylint: disable=pointless-statement
+
+    def test_reject_aware_created_at(self):
+        with self.assertRaises(ValueError):
+            self.batch.append(Category(name="Movie", created_at=datetime.now(timezone.utc)))
+        with self.assertRaises(ValueError):
+            self.batch.extend([Category(name="Movie"),
+                               Category(name="Movie", created_at=datetime.now(timezone.utc))])
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(self.batch.to_entities(), self.categories)
+
+    def test_rebuilds_rows_by_blocks_and_shares_timestamps(self):
+        categories = Category.bulk_create(
+            {"name": f"Série {i}" if i % 5 else f"Category {i}",
+             "description": None if i % 3 else "Description"} for i in range(25)).entities
+        batch = CategoryBatch.from_entities(self.categories + categories)
+        # one run per distinct timestamp in a row, the bulk created ones share one
+        runs = [created_at for created_at, _ in
+                groupby(category.created_at for category in self.categories + categories)]
+        self.assertEqual(list(batch.created_at.values), [
+            batches._NO_TIMESTAMP if created_at is None  # pylint: disable=protected-access
+            else (created_at - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+            for created_at in runs])
+        with patch.object(batches, "_BLOCK", 4):
+            self.assertEqual(list(batch), self.categories + categories)
+        rebuilt = batch.to_entities()
+        self.assertEqual(rebuilt, self.categories + categories)
+        self.assertIs(rebuilt[-1].created_at, rebuilt[4].created_at)
+        self.assertEqual(batch.select(range(3, 10)).to_entities(), batch.to_entities()[3:10])
+        self.assertEqual(CategoryBatch().to_entities(), [])
+
+    def test_counts_and_filters(self):
+        self.assertEqual(self.batch.count_by_is_active(), {True: 1, False: 2, None: 1})
+        self.assertEqual(self.batch.indices_where(False), [1, 3])
+        self.assertEqual(self.batch.filter(False).to_entities(),
+                         [self.categories[1], self.categories[3]])
+        self.assertEqual(self.batch.select([2, 0]).to_entities(),
+                         [self.categories[2], self.categories[0]])
+        self.assertEqual(len(self.batch.filter(True).filter(False)), 0)
+
+    def test_activate_and_deactivate(self):
+        self.batch.activate([1])
+        self.assertEqual(self.batch.indices_where(True), [0, 1])
+        self.batch.deactivate()
+        self.assertEqual(self.batch.count_by_is_active(), {True: 0, False: 4, None: 0})
+        self.batch.activate()
+        self.assertTrue(all(category.is_active for category in self.batch))
@@ -1,8 +1,25 @@
+import copy
+import pickle
 import unittest
+from contextlib import contextmanager
 from datetime import datetime
-from dataclasses import is_dataclass, FrozenInstanceError
-from unittest.mock import patch
+from dataclasses import is_dataclass, replace, FrozenInstanceError
+from typing import Iterator
+from unittest.mock import Mock, call, patch
+from __seedwork.domain import codecs
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.instrumentation import INSTRUMENTATION, MetricsRegistry
+from __seedwork.domain.interning import Interner
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain import entities
 from category.domain.entities import Category
+from category.domain.events import (
+    CategoryActivated,
+    CategoryCreated,
+    CategoryDeactivated,
+    CategoryUpdated
+)
+from category.domain.validators import CATEGORY_RULES
 
 
 class TestCategoryUnit(unittest.TestCase):
@@ -61,3 +78,234 @@ class TestCategoryUnit(unittest.TestCase):
             category = Category(name="Movie 1")
             category.deactivate()
             self.assertFalse(category.is_active)
+
+    def test_restore(self):
+        with patch.object(Category, "validate") as mock_validate_method:
+            unique_entity_id = UniqueEntityId()
+            created_at = datetime.now()
+            category = Category.restore(unique_entity_id=unique_entity_id,
+                                        name="Movie",
+                                        description="description",
+                                        is_active=False,
+                                        created_at=created_at)
+            mock_validate_method.assert_not_called()
+            self.assertEqual(category, Category(unique_entity_id=unique_entity_id,
+                                                name="Movie",
+                                                description="description",
+                                                is_active=False,
+                                                created_at=created_at))
+
+    def test_bulk_create(self):
+        created_at = datetime.now()
+        unique_entity_id = UniqueEntityId()
+        result = Category.bulk_create([
+            {"name": "Movie"},
+            {"name": "Documentary", "description": "description", "is_active": False,
+             "created_at": created_at, "unique_entity_id": unique_entity_id},
+        ])
+        self.assertEqual(result.errors, {})
+        self.assertEqual(len(result.entities), 2)
+
+        movie, documentary = result.entities
+        self.assertEqual(movie.name, "Movie")
+        self.assertIsNone(movie.description)
+        self.assertTrue(movie.is_active)
+        self.assertIsInstance(movie.created_at, datetime)
+        self.assertIsInstance(movie.unique_entity_id, UniqueEntityId)
+        self.assertEqual(documentary, Category(unique_entity_id=unique_entity_id,
+                                               name="Documentary",
+                                               description="description",
+                                               is_active=False,
+                                               created_at=created_at))
+
+    def test_bulk_create_with_interner(self):
+        created_at = datetime(2022, 1, 1)
+        rows = [{"name": "".join(["Mo", "vie"]), "description": "".join(["desc", "ription"]),
+                 "created_at": datetime(2022, 1, 1)} for _ in range(3)]
+        rows.append({"name": ["Movie"]})
+        result = Category.bulk_create(rows, Interner())
+        self.assertEqual(list(result.errors), [3])
+        first = result.entities[0]
+        for category in result.entities[1:]:
+            self.assertIs(category.name, first.name)
+            self.assertIs(category.description, first.description)
+            self.assertIs(category.created_at, first.created_at)
+        self.assertEqual(first.created_at, created_at)
+
+    @staticmethod
+    @contextmanager
+    def watch_category_rules() -> Iterator[Mock]:
+        """Records the rule checks bulk_update runs, one per distinct changed value."""
+        check_all = Mock(wraps=CATEGORY_RULES.check_all)
+        with patch.object(entities, "CATEGORY_RULES",
+                          replace(CATEGORY_RULES, check_all=check_all)):
+            yield check_all
+
+    def test_bulk_update(self):
+        categories = Category.bulk_create([{"name": f"Movie {i}"} for i in range(6)]).entities
+        for category in categories:
+            category.pull_events()
+        changes = {
+            categories[0].id: {"is_active": False},
+            categories[1].id: {"name": "Series", "description": "description"},
+            categories[2].id: {"is_active": True, "name": "Movie 2"},
+            categories[3].id: {"name": ""},
+            categories[4].id: {"is_active": 1},
+            categories[5].id: {"created_at": None},
+        }
+        with self.watch_category_rules() as mock_check:
+            result = Category.bulk_update(categories, changes)
+        self.assertEqual(mock_check.call_count, 5)
+        self.assertEqual(result.changed, categories[:2])
+        self.assertEqual(result.unchanged, 1)
+        self.assertEqual(result.errors, {
+            categories[3].id: "The field name is required.",
+            categories[4].id: "The field is_active must be a boolean.",
+            categories[5].id: "Cannot change the 'created_at' field of a category",
+        })
+        self.assertEqual([category.version for category in categories], [1, 1, 0, 0, 0, 0])
+        self.assertIs(categories[0].is_active, False)
+        self.assertEqual((categories[1].name, categories[1].description),
+                         ("Series", "description"))
+        self.assertEqual(categories[0].pull_events(), [CategoryDeactivated(categories[0].id)])
+        self.assertEqual(categories[1].pull_events(),
+                         [CategoryUpdated(categories[1].id, "Series", "description")])
+        self.assertEqual(categories[3].name, "Movie 3")
+
+    def test_bulk_update_leaves_categories_without_changes_alone(self):
+        categories = Category.bulk_create([{"name": "Movie"}, {"name": "Series"}]).entities
+        result = Category.bulk_update(categories, {categories[1].id: {"is_active": False}})
+        self.assertEqual(result.changed, categories[1:])
+        self.assertEqual(result.unchanged, 1)
+        self.assertEqual(result.errors, {})
+        self.assertEqual((categories[0].version, categories[0].is_active), (0, True))
+        result = Category.bulk_update(categories, {})
+        self.assertEqual((result.changed, result.unchanged, result.errors), ([], 2, {}))
+
+    def test_bulk_update_validates_each_distinct_value_once(self):
+        categories = Category.bulk_create([{"name": "Movie"}] * 100).entities
+        with self.watch_category_rules() as mock_check:
+            result = Category.bulk_update(
+                categories, {category.id: {"is_active": False, "name": "Movie", "description": ""}
+                             for category in categories})
+        self.assertEqual(mock_check.call_args_list, [call(description=""),
+                                                     call(is_active=False)])
+        self.assertEqual(len(result.changed), 100)
+        result = Category.bulk_update(categories[:1], {categories[0].id: {"name": ["Movie"]}})
+        self.assertEqual(result.errors, {categories[0].id: "The field name must be a string."})
+
+    def test_changes_bump_the_version(self):
+        category = Category(name="Movie")
+        self.assertEqual(category.version, 0)
+        category.update("Movie", None)
+        category.activate()
+        self.assertEqual(category.version, 0)
+        category.update("Series", None)
+        category.deactivate()
+        category.activate()
+        self.assertEqual(category.version, 3)
+        for rebuilt in [copy.copy(category), pickle.loads(pickle.dumps(category))]:
+            self.assertEqual(rebuilt.version, 3)
+        self.assertEqual(Category.restore(category.unique_entity_id, "Movie", None, True, None,
+                                          version=7).version, 7)
+
+    def test_pickle(self):
+        category = Category(name="Movie", description="description", is_active=False)
+        with patch.object(Category, "validate") as mock_validate_method:
+            restored = pickle.loads(pickle.dumps(category))
+            mock_validate_method.assert_not_called()
+        self.assertEqual(restored, category)
+
+    def test_copy(self):
+        category = Category(name="Movie", description="description")
+        with patch.object(Category, "validate") as mock_validate_method:
+            copied = copy.copy(category)
+            mock_validate_method.assert_not_called()
+        self.assertEqual(copied, category)
+        self.assertIsNot(copied, category)
+        copied.deactivate()
+        self.assertTrue(category.is_active)
+
+    def test_records_events(self):
+        category = Category(name="Movie", is_active=False)
+        category.update("Series", "description")
+        category.activate()
+        category.deactivate()
+        self.assertEqual(category.pull_events(), [
+            CategoryCreated(category.id, "Movie", None, False),
+            CategoryUpdated(category.id, "Series", "description"),
+            CategoryDeactivated(category.id),
+        ])
+        self.assertEqual(category.pull_events(), [])
+
+    def test_repeated_toggles_keep_the_events_bounded(self):
+        category = Category(name="Movie")
+        for _ in range(1000):
+            category.deactivate()
+            category.activate()
+        category.update("Series", None)
+        category.update("Movie", None)
+        self.assertEqual(category.pull_events(), [
+            CategoryCreated(category.id, "Movie", None, True),
+            CategoryActivated(category.id),
+            CategoryUpdated(category.id, "Movie", None),
+        ])
+        self.assertEqual(category.version, 2002)
+
+    def test_trusted_rebuilds_record_no_events(self):
+        category = Category(name="Movie")
+        restored = Category.restore(category.unique_entity_id, "Movie", None, True, None)
+        bulk_created = Category.bulk_create([{"name": "Movie"}]).entities[0]
+        for rebuilt in [restored, copy.copy(category), pickle.loads(pickle.dumps(category)),
+                        bulk_created]:
+            self.assertEqual(rebuilt.pull_events(), [])
+
+    def test_unchanged_values_record_nothing(self):
+        category = Category(name="Movie", description="description")
+        category.pull_events()
+        category.update("Movie", "description")
+        category.activate()
+        self.assertEqual(category.pull_events(), [])
+        self.assertEqual(category.changes(), {})
+
+        category.update("Movie", None)
+        category.deactivate()
+        self.assertEqual(category.changes(), {"description": None, "is_active": False})
+        self.assertEqual(len(category.pull_events()), 2)
+        self.assertEqual(Category.restore(category.unique_entity_id, "Movie", None, True,
+                                          None).changes(), {})
+
+    def test_json_codec_round_trip(self):
+        category = Category(name="Movie", description="description", is_active=False)
+        with patch.object(Category, "validate") as mock_validate_method:
+            decoded = codecs.decode(codecs.encode(category), Category)
+            mock_validate_method.assert_not_called()
+        self.assertEqual(decoded, category)
+        self.assertEqual(decoded.created_at, category.created_at)
+        self.assertEqual(decoded.pull_events(), [])
+        self.assertEqual(codecs.decode_many(codecs.encode_many([category, decoded]), Category),
+                         [category, category])
+
+    def test_instrumentation(self):
+        registry = INSTRUMENTATION.enable(MetricsRegistry())
+        self.addCleanup(INSTRUMENTATION.disable)
+        category = Category(name="Movie")
+        category.update("Series", None)
+        category.deactivate()
+        Category.bulk_create([{"name": "Movie"}, {"name": ""}])
+        with self.assertRaises(ValidationException):
+            Category(name="")
+
+        self.assertEqual(registry.timer("operation", operation="Category.validate").count, 3)
+        self.assertEqual(registry.timer("operation", operation="Category.bulk_create").count, 1)
+        self.assertEqual(registry.timer("operation", operation="Category.__new__").count, 2)
+        self.assertEqual(registry.timer("operation", operation="Category.__post_init__").count, 1)
+        self.assertEqual(registry.counter("operation_errors", operation="Category.__new__",
+                                          error="ValidationException"), 1)
+        for event in ["CategoryCreated", "CategoryUpdated", "CategoryDeactivated"]:
+            self.assertEqual(registry.counter("domain_events", entity="Category", event=event), 1)
+        # the failing constructor and the invalid bulk row
+        self.assertEqual(registry.counter("validation_failures", field="name", rule="required",
+                                          message="The field name is required."), 2)
+        self.assertIn('seedwork_operation_seconds_count{operation="Category.validate"} 3',
+                      registry.to_prometheus())
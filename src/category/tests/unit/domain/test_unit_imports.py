@@ -0,0 +1,79 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 4))
+DOMAIN_MODULES = [
+    "__seedwork.domain.cache",
+    "__seedwork.domain.codecs",
+    "__seedwork.domain.entities",
+    "__seedwork.domain.events",
+    "__seedwork.domain.exceptions",
+    "__seedwork.domain.instrumentation",
+    "__seedwork.domain.interning",
+    "__seedwork.domain.repositories",
+    "__seedwork.domain.search",
+    "__seedwork.domain.serializers",
+    "__seedwork.domain.sharding",
+    "__seedwork.domain.unit_of_work",
+    "__seedwork.domain.validators",
+    "__seedwork.domain.value_objects",
+    "category.domain.batches",
+    "category.domain.entities",
+    "category.domain.events",
+    "category.domain.repositories",
+    "category.domain.validators",
+]
+# used when installed, never required
+OPTIONAL_PACKAGES = {"orjson"}
+# cumulative `-X importtime` of category.domain.entities, best of a few runs;
+# it took about 90ms without DRF on a slow box, importing DRF alone took 250ms
+IMPORT_TIME_BUDGET_US = 200_000
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=SRC, capture_output=True, text=True,
+                          check=True)
+
+
+class TestDomainImports(unittest.TestCase):
+
+    def test_domain_only_imports_the_standard_library(self):
+        script = (
+            "import importlib, json, sys\n"
+            "before = set(sys.modules)\n"
+            f"for name in {DOMAIN_MODULES!r}:\n"
+            "    importlib.import_module(name)\n"
+            "roots = {name.partition('.')[0] for name in set(sys.modules) - before}\n"
+            # stdlib modules, and platform's build settings named after the platform
+            "roots = {root for root in roots - set(sys.stdlib_module_names)\n"
+            "         if not root.startswith('_sysconfig')}\n"
+            "print(json.dumps(sorted(roots)))\n"
+        )
+        third_party = set(json.loads(run_python("-c", script).stdout))
+        self.assertEqual(third_party - OPTIONAL_PACKAGES, {"__seedwork", "category"})
+
+    def test_drf_is_loaded_on_first_use(self):
+        script = (
+            "import sys\n"
+            "from category.domain import validators\n"
+            "print('rest_framework' in sys.modules)\n"
+            "print(validators.CategoryRules.__name__, 'rest_framework' in sys.modules)\n"
+        )
+        self.assertEqual(run_python("-c", script).stdout.split(),
+                         ["False", "CategoryRules", "True"])
+
+    def test_import_time_budget(self):
+        best = None
+        for _ in range(3):
+            stderr = run_python("-X", "importtime", "-c", "import category.domain.entities").stderr
+            match = re.search(r"\|\s*(\d+) \| category\.domain\.entities$", stderr, re.MULTILINE)
+            cumulative = int(match.group(1))
+            best = cumulative if best is None else min(best, cumulative)
+            if best <= IMPORT_TIME_BUDGET_US:
+                break
+        self.assertLessEqual(best, IMPORT_TIME_BUDGET_US,
+                             f"importing category.domain.entities took {best}us")
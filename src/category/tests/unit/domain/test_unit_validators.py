@@ -0,0 +1,51 @@
+import unittest
+from category.domain.validators import (
+    CategoryDRFValidator,
+    CategoryValidator,
+    CategoryValidatorFactory
+)
+
+
+class TestCategoryValidatorFactory(unittest.TestCase):
+
+    def test_create(self):
+        self.assertIsInstance(CategoryValidatorFactory.create(), CategoryValidator)
+        self.assertIsInstance(CategoryValidatorFactory.create(use_drf=True), CategoryDRFValidator)
+
+
+class TestCategoryValidatorUnit(unittest.TestCase):
+    validator: CategoryValidator
+
+    def setUp(self):
+        self.validator = CategoryValidatorFactory.create()
+
+    def test_invalid_cases(self):
+        invalid_data = [
+            (None, {"name": ["The field name is required."]}),
+            ({}, {"name": ["The field name is required."]}),
+            ({"name": ""}, {"name": ["The field name is required."]}),
+            ({"name": 5}, {"name": ["The field name must be a string."]}),
+            ({"name": "t" * 256}, {"name": ["The field name cannot exceed 255 characters."]}),
+            ({"name": "Movie", "description": 5},
+             {"description": ["The field description must be a string."]}),
+            ({"name": None, "is_active": 5}, {
+                "name": ["The field name is required."],
+                "is_active": ["The field is_active must be a boolean."],
+            }),
+        ]
+        for data, errors in invalid_data:
+            self.assertFalse(self.validator.validate(data), data)
+            self.assertEqual(self.validator.errors, errors)
+
+    def test_valid_cases(self):
+        valid_data = [
+            {"name": "Movie"},
+            {"name": "Movie", "description": None},
+            {"name": "Movie", "description": ""},
+            {"name": "Movie", "is_active": True},
+            {"name": "Movie", "description": "Nice movie", "is_active": False},
+        ]
+        for data in valid_data:
+            self.assertTrue(self.validator.validate(data), data)
+            self.assertIsNone(self.validator.errors)
+            self.assertEqual(self.validator.validated_data, data)
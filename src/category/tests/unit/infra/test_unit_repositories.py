@@ -0,0 +1,80 @@
+import sys
+import unittest
+from datetime import datetime, timedelta
+from __seedwork.domain.repositories import SearchParams
+from category.domain.entities import Category
+from category.infra.repositories import CategoryInMemoryRepository, name_prefix_bounds
+
+
+class TestCategoryInMemoryRepository(unittest.TestCase):
+    repo: CategoryInMemoryRepository
+
+    def setUp(self):
+        self.repo = CategoryInMemoryRepository()
+
+    def test_sortable_fields(self):
+        self.assertEqual(self.repo.sortable_fields, ["name", "created_at"])
+
+    def test_sort_by_created_at_desc_by_default(self):
+        created_at = datetime.now()
+        categories = [Category(name=f"Movie {i}", created_at=created_at + timedelta(seconds=i))
+                      for i in range(3)]
+        self.repo.bulk_insert(categories)
+        result = self.repo.search(SearchParams())
+        self.assertEqual(result.items, categories[::-1])
+        self.assertEqual(result.sort, "created_at")
+        self.assertEqual(result.sort_dir, "desc")
+
+    def test_sort_by_name(self):
+        categories = [Category(name=name) for name in ["b", "a", "c"]]
+        self.repo.bulk_insert(categories)
+        result = self.repo.search(SearchParams(sort="name"))
+        self.assertEqual(result.items, [categories[1], categories[0], categories[2]])
+
+    def test_filter_by_case_insensitive_name_prefix(self):
+        created_at = datetime.now()
+        names = ["test", "TEST 2", "a test", "tesT 3", "tes", "tf"]
+        categories = [Category(name=name, created_at=created_at + timedelta(seconds=i))
+                      for i, name in enumerate(names)]
+        self.repo.bulk_insert(categories)
+
+        result = self.repo.search(SearchParams(filter="TEST"))
+        self.assertEqual([category.name for category in result.items], ["tesT 3", "TEST 2", "test"])
+        self.assertEqual(result.total, 3)
+
+        result = self.repo.search(SearchParams(filter="test", sort="name", per_page=2, page=2))
+        self.assertEqual([category.name for category in result.items], ["test"])
+        self.assertEqual(result.filter, "test")
+        self.assertEqual(result.total, 3)
+
+    def test_filter_edge_cases(self):
+        last = chr(sys.maxunicode)
+        names = ["5 stars", "50", "6", f"a{last}", f"a{last}b", "b", last, f"{last}{last}"]
+        categories = [Category(name=name) for name in names]
+        self.repo.bulk_insert(categories)
+
+        def matches(search_filter):
+            result = self.repo.search(SearchParams(filter=search_filter, sort="name",
+                                                   per_page=20))
+            return [category.name for category in result.items]
+        self.assertEqual(matches(5), ["5 stars", "50"])
+        self.assertEqual(matches(f"A{last}"), [f"a{last}", f"a{last}b"])
+        self.assertEqual(matches(last), [last, f"{last}{last}"])
+        self.assertEqual(matches(f"{last}{last}"), [f"{last}{last}"])
+        self.assertEqual(matches(""), sorted(names))
+
+    def test_name_prefix_bounds(self):
+        last = chr(sys.maxunicode)
+        self.assertEqual(name_prefix_bounds("Ab"), ("ab", "ac"))
+        self.assertEqual(name_prefix_bounds(12), ("12", "13"))
+        self.assertEqual(name_prefix_bounds(f"a{last}{last}"), (f"a{last}{last}", "b"))
+        self.assertEqual(name_prefix_bounds(last), (last, None))
+        self.assertEqual(name_prefix_bounds(""), ("", None))
+
+    def test_filter_follows_updates(self):
+        category = Category(name="Movie")
+        self.repo.insert(category)
+        category.update("Documentary", None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.search(SearchParams(filter="movie")).items, [])
+        self.assertEqual(self.repo.search(SearchParams(filter="doc")).items, [category])
@@ -0,0 +1,42 @@
+import unittest
+from __seedwork.domain.events import EventDispatcher
+from category.domain.entities import Category
+from category.domain.events import CategoryDeleted
+from category.infra.search import CategorySearchIndex
+
+
+class TestCategorySearchIndex(unittest.TestCase):
+    index: CategorySearchIndex
+
+    def setUp(self):
+        self.index = CategorySearchIndex()
+
+    def test_follows_category_events(self):
+        dispatcher = EventDispatcher()
+        self.index.subscribe(dispatcher)
+        movie = Category(name="Movie", description="feature films")
+        series = Category(name="Series")
+        dispatcher.collect(movie, series)
+        dispatcher.dispatch()
+        self.assertEqual(self.index.search("fil").ids, [movie.id])
+
+        movie.update("Documentary", "real films")
+        movie.deactivate()
+        dispatcher.collect(movie)
+        dispatcher.dispatch()
+        self.assertEqual(self.index.search("movie").ids, [])
+        self.assertEqual(self.index.search("doc films").ids, [movie.id])
+
+        dispatcher.publish([CategoryDeleted(series.id)])
+        dispatcher.dispatch()
+        self.assertEqual(self.index.search("series").total, 0)
+
+    def test_bulk_add_ranks_names_first(self):
+        documentary = Category(name="Documentary", description="drama based on real events")
+        drama = Category(name="Drama")
+        self.index.bulk_add([documentary, drama])
+        self.assertEqual(self.index.search("drama").ids, [drama.id, documentary.id])
+
+        self.index.remove(drama.id)
+        self.index.add(drama)
+        self.assertEqual(self.index.search("dra").total, 2)